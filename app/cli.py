@@ -0,0 +1,323 @@
+"""Headless command line for text, document and batch translation.
+
+Runs on ``TranslationManager`` without importing PyQt6, so it starts fast
+and works on machines without a display. Settings (API keys, endpoints,
+workers) come from an INI file and ``TRADUCTOR_<KEY>`` environment variables
+instead of QSettings; see ``Config.use_file``.
+
+Results go to stdout (the translated text, or one output path per line) and
+progress, summaries and errors to stderr, so the output can be piped.
+
+Usage:
+    $ python -m app.cli text "Hola mundo" --from es --to en
+    $ echo "Hola mundo" | python -m app.cli text --from es --to en
+    $ python -m app.cli doc manual.docx manual_en.docx --from es --to en --skip-pages 1,3-4
+    $ python -m app.cli doc manual.docx manual.docx --from es --to en --to fr
+    $ python -m app.cli batch "manuals/**/*.docx" --out translated --from es --to en --processes 4
+"""
+import argparse
+import os
+import sys
+import time
+from enum import IntEnum
+import app.exceptions.authorization as ae
+import app.exceptions.document as de
+import app.exceptions.translation as te
+from app.core.config import Config
+from app.core.constants import Engine, LANGUAGES
+
+class ExitCode(IntEnum):
+    """Process exit status of the command line, one per failure class.
+
+    Members:
+        OK: Everything was translated
+        ERROR: Unexpected error
+        USAGE: Invalid arguments
+        NOT_FOUND: Input document missing, or no document matched
+        READ_ERROR: Input document could not be read
+        WRITE_ERROR: Output document could not be written
+        TRANSLATION_FAILED: The engine returned an invalid or failed translation
+        UNAVAILABLE: The engine could not be reached, was rate limited or its circuit is open
+        UNAUTHORIZED: The engine has no valid API key or URL configured
+        PARTIAL: A batch finished but some documents failed or some inputs matched no file
+        INTERRUPTED: Cancelled with Ctrl+C
+    """
+    OK = 0
+    ERROR = 1
+    USAGE = 2
+    NOT_FOUND = 3
+    READ_ERROR = 4
+    WRITE_ERROR = 5
+    TRANSLATION_FAILED = 6
+    UNAVAILABLE = 7
+    UNAUTHORIZED = 8
+    PARTIAL = 9
+    INTERRUPTED = 130
+
+def exit_code(e: BaseException) -> ExitCode:
+    """Maps an exception to the exit status reporting it.
+
+    Args:
+        e (BaseException): Error that stopped the command
+
+    Returns:
+        ExitCode: Matching exit status, ``ExitCode.ERROR`` for unknown errors
+
+    Example:
+        >>> exit_code(de.DocumentNotFound("missing.docx"))
+        <ExitCode.NOT_FOUND: 3>
+    """
+    match e:
+        case KeyboardInterrupt():
+            return ExitCode.INTERRUPTED
+        case ae.Unauthorized():
+            return ExitCode.UNAUTHORIZED
+        case te.TranslationServiceUnavailable() | TimeoutError():
+            return ExitCode.UNAVAILABLE
+        case te.TranslationError() | de.ParagraphTranslationError():
+            return ExitCode.TRANSLATION_FAILED
+        case de.DocumentNotFound():
+            return ExitCode.NOT_FOUND
+        case de.DocumentReadError():
+            return ExitCode.READ_ERROR
+        case de.DocumentWriteError():
+            return ExitCode.WRITE_ERROR
+        case ValueError():
+            return ExitCode.USAGE
+        case _:
+            return ExitCode.ERROR
+
+class Progress:
+    """Progress reporter writing to stderr.
+
+    On a terminal the line is rewritten in place; otherwise one line is
+    written per percent reached, so logs stay short and parseable
+    (``<label> <done>/<total> <percent>%``).
+
+    Attributes:
+        label (str): Prefix of every line
+    """
+
+    def __init__(self, label: str) -> None:
+        """Creates a reporter that has not written anything yet.
+
+        Args:
+            label (str): Prefix of every line
+        """
+        self.label = label
+        self._tty = sys.stderr.isatty()
+        self._last = -1
+
+    def __call__(self, done: int, total: int) -> None:
+        """Reports progress; usable as a ``progress_callback``."""
+        percent = done * 100 // total if total else 100
+        if percent == self._last:
+            return
+        self._last = percent
+        line = f"{self.label} {done}/{total} {percent}%"
+        sys.stderr.write(f"\r{line}" if self._tty else f"{line}\n")
+        sys.stderr.flush()
+
+    def close(self) -> None:
+        """Ends the in-place line on a terminal."""
+        if self._tty and self._last >= 0:
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+def parse_pages(value: str) -> set[int]:
+    """Parses a page list such as ``1,3-5``.
+
+    Args:
+        value (str): Comma-separated page numbers and inclusive ranges
+
+    Returns:
+        set[int]: Page numbers
+
+    Raises:
+        argparse.ArgumentTypeError: If a page or range is invalid
+
+    Example:
+        >>> sorted(parse_pages("1,3-5"))
+        [1, 3, 4, 5]
+    """
+    pages = set()
+    for part in filter(None, (part.strip() for part in value.split(","))):
+        start, _, end = part.partition("-")
+        try:
+            first, last = int(start), int(end or start)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid page range: {part}")
+        if first < 1 or last < first:
+            raise argparse.ArgumentTypeError(f"Invalid page range: {part}")
+        pages.update(range(first, last + 1))
+    return pages
+
+def build_parser() -> argparse.ArgumentParser:
+    """Defines the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: Parser with the ``text``, ``doc`` and ``batch`` subcommands
+    """
+    languages = sorted(LANGUAGES.values())
+    engines = [engine.value for engine in Engine]
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--from", dest="lang_from", required=True, choices=languages, help="Source language")
+    common.add_argument(
+        "--engine", choices=engines,
+        help="Translation engine (default: the 'engine' setting, then my_memory)"
+    )
+    common.add_argument("--hedge-with", choices=engines, help="Secondary engine for slow or failing requests")
+    common.add_argument(
+        "--config", metavar="PATH",
+        help="Settings INI file (default: $TRADUCTOR_CONFIG, then ~/.traductor-inador/config.ini)"
+    )
+
+    document = argparse.ArgumentParser(add_help=False)
+    document.add_argument(
+        "--skip-pages", type=parse_pages, default=set(), metavar="PAGES",
+        help="Pages left untranslated, e.g. 1,3-5"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="Translate text and DOCX documents without the graphical interface."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    text = commands.add_parser("text", parents=[common], help="Translate text")
+    text.add_argument("text", nargs="?", default="-", help="Text to translate, or - to read stdin (default)")
+    text.add_argument("--to", dest="lang_to", required=True, choices=languages, help="Target language")
+    text.set_defaults(handler=translate_text)
+
+    doc = commands.add_parser("doc", parents=[common, document], help="Translate a DOCX document")
+    doc.add_argument("input", help="Source document")
+    doc.add_argument("output", help="Translated document; with several --to, the language is appended")
+    doc.add_argument(
+        "--to", dest="langs_to", action="append", required=True, choices=languages,
+        help="Target language; repeat to translate into several in one pass"
+    )
+    doc.add_argument(
+        "--streaming", action=argparse.BooleanOptionalAction, default=None,
+        help="Force or disable streaming (default: by document size)"
+    )
+    doc.set_defaults(handler=translate_document)
+
+    batch = commands.add_parser("batch", parents=[common, document], help="Translate many DOCX documents")
+    batch.add_argument("inputs", nargs="+", help="Documents or glob patterns (** allowed)")
+    batch.add_argument("--out", dest="output_dir", required=True, help="Folder receiving the translations")
+    batch.add_argument("--to", dest="lang_to", required=True, choices=languages, help="Target language")
+    batch.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    batch.add_argument("--overwrite", action="store_true", help="Translate again documents already finished")
+    batch.set_defaults(handler=translate_batch)
+    return parser
+
+def check_credentials(*engines: Engine | None) -> None:
+    """Verifies that the engines needing an API key or URL have one configured.
+
+    Args:
+        *engines (Engine | None): Engines about to be used; None entries are ignored
+
+    Raises:
+        Unauthorized: If an engine requires an API key and ``<engine>_api`` is not set
+    """
+    from app.services.engines.registry import get_profile
+
+    for engine in filter(None, engines):
+        if get_profile(engine).requires_api_key and not Config.get_api_url(engine):
+            raise ae.Unauthorized(
+                f"No API key configured for {engine}; set {engine}_api or TRADUCTOR_{engine.upper()}_API"
+            )
+
+def translate_text(args: argparse.Namespace) -> ExitCode:
+    """Translates the argument or stdin and prints the translation."""
+    from app.core.translator import TranslationManager
+
+    text = sys.stdin.read() if args.text == "-" else args.text
+    manager = TranslationManager(args.engine, hedge_with=args.hedge_with)
+    translation = manager.translate_text(text, args.lang_from, args.lang_to)
+    sys.stdout.write(translation if translation.endswith("\n") else f"{translation}\n")
+    return ExitCode.OK
+
+def translate_document(args: argparse.Namespace) -> ExitCode:
+    """Translates one document into one or several languages and prints the output paths."""
+    from app.core.translator import TranslationManager
+
+    if not os.path.isfile(args.input):
+        raise de.DocumentNotFound(f"File not found: {args.input}")
+    manager = TranslationManager(args.engine, hedge_with=args.hedge_with)
+    langs_to = list(dict.fromkeys(args.langs_to))
+    progress = Progress(f"{args.input} -> {','.join(langs_to)}")
+    try:
+        if len(langs_to) == 1:
+            outputs = {langs_to[0]: args.output}
+            stats = {langs_to[0]: manager.translate_document(
+                args.input, args.output, args.lang_from, langs_to[0], progress, args.skip_pages, args.streaming
+            )}
+        else:
+            outputs = manager.target_paths(args.output, langs_to)
+            stats = manager.translate_document_targets(
+                args.input, args.output, args.lang_from, langs_to, progress, args.skip_pages, args.streaming
+            )
+    finally:
+        progress.close()
+
+    for lang, summary in stats.items():
+        print(
+            f"{lang}: {summary.segments} segments, {summary.unique} sent, {summary.skipped} skipped",
+            file=sys.stderr
+        )
+        print(outputs[lang])
+    return ExitCode.OK
+
+def translate_batch(args: argparse.Namespace) -> ExitCode:
+    """Translates every matched document and prints the outputs of those translated."""
+    from app.core.batch_translator import BatchTranslator
+
+    batch = BatchTranslator(args.engine, args.processes, args.hedge_with)
+    progress = Progress("documents")
+    try:
+        report = batch.translate(
+            args.inputs, args.output_dir, args.lang_from, args.lang_to, progress, args.skip_pages, args.overwrite
+        )
+    finally:
+        progress.close()
+
+    if not report.results:
+        print("No documents matched", *(f"  {pattern}" for pattern in report.missing), sep="\n", file=sys.stderr)
+        return ExitCode.NOT_FOUND
+
+    print(report.summary(), file=sys.stderr)
+    for result in report.translated:
+        print(result.output_path)
+    return ExitCode.PARTIAL if report.failed or report.missing else ExitCode.OK
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the command line.
+
+    Args:
+        argv (list[str], optional): Arguments without the program name. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: Exit status, see ``ExitCode``
+    """
+    args = build_parser().parse_args(argv)
+    Config.use_file(args.config)
+
+    start = time.perf_counter()
+    try:
+        args.engine = Engine(args.engine or Config.get("engine") or Engine.MY_MEMORY)
+        args.hedge_with = Engine(args.hedge_with) if args.hedge_with else None
+        check_credentials(args.engine, args.hedge_with)
+        code = args.handler(args)
+    except (Exception, KeyboardInterrupt) as e:
+        code = exit_code(e)
+        message = "Interrupted" if code == ExitCode.INTERRUPTED else f"{type(e).__name__}: {e}"
+        print(f"error: {message}", file=sys.stderr)
+        return code
+
+    print(f"Finished in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+import glob
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Set
+from app.services.engines.registry import get_engine_class
+from app.services.rate_limiter import TokenBucket
+from app.services.translation_api import TranslationService
+from app.services.translation_cache import TranslationCache
+from .config import Config
+from .constants import Engine
+from .segment_plan import SegmentStats
+from .translator import TranslationManager
+
+@dataclass
+class DocumentResult:
+    """Outcome of one document of a batch.
+
+    Attributes:
+        input_path (str): Source document
+        output_path (str): Translated document
+        stats (SegmentStats | None): Job summary, or None if not translated
+        error (str | None): Why the document failed, or None
+        skipped (bool): True if a finished output already existed
+        elapsed (float): Seconds spent on the document
+    """
+    input_path: str
+    output_path: str
+    stats: SegmentStats | None = None
+    error: str | None = None
+    skipped: bool = False
+    elapsed: float = 0.0
+
+@dataclass
+class BatchReport:
+    """Aggregate throughput of a batch of documents.
+
+    Attributes:
+        results (list[DocumentResult]): One result per document, in completion order
+        missing (list[str]): Inputs that matched no file: listed paths that do not
+            exist and glob patterns without matches. They are not documents, so
+            they count neither as translated nor as failed.
+        elapsed (float): Wall time of the whole batch in seconds
+    """
+    results: list[DocumentResult] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def translated(self) -> list[DocumentResult]:
+        """Documents translated in this run."""
+        return [result for result in self.results if result.stats is not None]
+
+    @property
+    def failed(self) -> list[DocumentResult]:
+        """Documents that could not be translated."""
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def segments(self) -> int:
+        """Segments planned across the translated documents."""
+        return sum(result.stats.segments for result in self.translated)
+
+    @property
+    def unique(self) -> int:
+        """Segments sent across the translated documents."""
+        return sum(result.stats.unique for result in self.translated)
+
+    @property
+    def documents_per_minute(self) -> float:
+        """Translated documents per minute of wall time."""
+        return len(self.translated) / self.elapsed * 60 if self.elapsed else 0.0
+
+    @property
+    def segments_per_second(self) -> float:
+        """Planned segments per second of wall time."""
+        return self.segments / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """Formats the report for a log or a terminal.
+
+        Returns:
+            str: Totals and throughput on one line, then one line per failure
+                and per input that matched no file
+        """
+        skipped = sum(result.skipped for result in self.results)
+        lines = [
+            f"{len(self.translated)} translated, {skipped} skipped, {len(self.failed)} failed "
+            f"in {self.elapsed:.1f}s | {self.documents_per_minute:.1f} docs/min | "
+            f"{self.segments_per_second:.1f} seg/s | {self.segments} segments, {self.unique} sent"
+        ]
+        lines.extend(f"  {result.input_path}: {result.error}" for result in self.failed)
+        lines.extend(f"  {pattern}: no matching file" for pattern in self.missing)
+        return "\n".join(lines)
+
+class BatchTranslator:
+    """Translates many DOCX files at once, spreading them across a process pool.
+
+    Each worker process loads, translates and saves whole documents with its
+    own ``TranslationManager``, so python-docx and lxml parsing use every
+    core. The engine's request rate is split evenly between the processes,
+    and the translation cache is shared through its SQLite file.
+
+    Every output keeps its own journal (``<output>.journal``), so running the
+    same batch again resumes unfinished documents and skips finished ones.
+    A document that raises is reported as failed and the batch goes on. If a
+    worker process dies, the documents it may have been running are retried
+    one by one in a fresh process; one that kills its process again is
+    reported as failed.
+
+    Workers read the same settings as the calling process: the INI file
+    selected with ``Config.use_file`` if any, QSettings otherwise.
+
+    Attributes:
+        engine (Engine): Translation engine
+        processes (int): Worker processes
+        hedge_with (Engine | None): Secondary engine for hedging and failover
+        base_urls (dict[Engine, str]): Endpoint overrides by engine
+        config_path (str | None): Settings file passed to the workers
+
+    Example:
+        >>> batch = BatchTranslator(Engine.DEEPL, processes=4)
+        >>> report = batch.translate("manuals/**/*.docx", "translated", "en", "es")
+        >>> print(report.summary())
+    """
+
+    def __init__(
+        self,
+        engine: Engine = Engine.MY_MEMORY,
+        processes: int | None = None,
+        hedge_with: Engine | None = None,
+        base_urls: dict[Engine, str] | None = None
+    ) -> None:
+        """Configures the batch without starting any process.
+
+        Args:
+            engine (Engine, optional): Translation engine. Defaults to Engine.MY_MEMORY.
+            processes (int, optional): Worker processes. Defaults to the CPU count.
+            hedge_with (Engine, optional): Secondary engine. Defaults to None.
+            base_urls (dict[Engine, str], optional): Endpoint overrides. Defaults to None.
+        """
+        self.engine = engine
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.hedge_with = hedge_with
+        self.base_urls = dict(base_urls or {})
+        self.config_path = Config.file_path()
+
+    def translate(
+        self,
+        inputs: str | Iterable[str],
+        output_dir: str,
+        lang_from: str,
+        lang_to: str,
+        progress_callback: Callable[[int, int], None] | None = None,
+        skip_pages: Set[int] = set(),
+        overwrite: bool = False
+    ) -> BatchReport:
+        """Translates every input document into ``output_dir``.
+
+        Outputs keep the inputs' layout below their common folder, with the
+        target language appended to the name (``guide.docx`` becomes
+        ``guide_es.docx``, see ``TranslationManager.target_paths``).
+
+        Args:
+            inputs (str | Iterable[str]): File paths or glob patterns (``**`` allowed).
+                Word lock files (``~$*.docx``) are ignored; inputs matching no
+                file are listed in ``BatchReport.missing``.
+            output_dir (str): Folder receiving the translated documents
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            progress_callback (Callable[[int, int], None], optional): Called with
+                (documents finished, total documents)
+            skip_pages (set[int], optional): Pages to leave untranslated in every document
+            overwrite (bool, optional): Translate again documents whose output is
+                already finished. Defaults to False.
+
+        Returns:
+            BatchReport: Result of every document and the aggregate throughput
+        """
+        start = time.perf_counter()
+        report = BatchReport()
+        jobs = deque()
+        found, report.missing = self._jobs(inputs, output_dir, lang_to)
+        for input_path, output_path in found:
+            if not overwrite and os.path.exists(output_path) and not os.path.exists(f"{output_path}.journal"):
+                report.results.append(DocumentResult(input_path, output_path, skipped=True))
+            else:
+                jobs.append((input_path, output_path))
+        total = len(report.results) + len(jobs)
+
+        def record(result: DocumentResult) -> None:
+            report.results.append(result)
+            if progress_callback:
+                progress_callback(len(report.results), total)
+
+        arguments = (lang_from, lang_to, set(skip_pages))
+        while jobs:
+            for job in self._run_pool(jobs, self.processes, arguments, record):
+                # Alone in a fresh process, an innocent document completes
+                for crashed in self._run_pool(deque([job]), 1, arguments, record):
+                    record(DocumentResult(*crashed, error="Worker process crashed"))
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _jobs(
+        self, inputs: str | Iterable[str], output_dir: str, lang_to: str
+    ) -> tuple[list[tuple[str, str]], list[str]]:
+        """Resolves the inputs and the output path of each one.
+
+        Args:
+            inputs (str | Iterable[str]): File paths or glob patterns
+            output_dir (str): Output folder
+            lang_to (str): Target language code
+
+        Returns:
+            tuple[list[tuple[str, str]], list[str]]: (input path, output path) pairs
+                sorted by input, and the inputs that matched no file, in input order
+        """
+        paths, missing = [], []
+        for pattern in [inputs] if isinstance(inputs, str) else inputs:
+            # A literal name may contain glob characters, e.g. "report [draft].docx"
+            matches = glob.glob(pattern, recursive=True) or ([pattern] if os.path.exists(pattern) else [])
+            paths.extend(matches)
+            if not matches:
+                missing.append(pattern)
+        paths = sorted({
+            os.path.abspath(path) for path in paths
+            if os.path.isfile(path) and not os.path.basename(path).startswith("~$")
+        })
+        if not paths:
+            return [], missing
+
+        root = os.path.commonpath([os.path.dirname(path) for path in paths])
+        return [
+            (path, TranslationManager.target_paths(
+                os.path.join(output_dir, os.path.relpath(path, root)), [lang_to]
+            )[lang_to])
+            for path in paths
+        ], missing
+
+    def _run_pool(
+        self,
+        jobs: deque,
+        processes: int,
+        arguments: tuple,
+        record: Callable[[DocumentResult], None]
+    ) -> list[tuple[str, str]]:
+        """Runs queued jobs on a new pool until the queue is empty or the pool breaks.
+
+        At most ``processes`` jobs are submitted at a time, so when a worker
+        dies only the documents actually running are suspects.
+
+        Args:
+            jobs (deque[tuple[str, str]]): (input path, output path) pairs; consumed
+            processes (int): Pool size
+            arguments (tuple): Source language, target language and skipped pages
+            record (Callable[[DocumentResult], None]): Receives every finished document
+
+        Returns:
+            list[tuple[str, str]]: Jobs that were running when a worker died
+        """
+        running = {}
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_start_worker,
+            initargs=(self.engine, self.processes, self.hedge_with, self.base_urls, self.config_path)
+        ) as pool:
+            while jobs or running:
+                while jobs and len(running) < processes:
+                    job = jobs.popleft()
+                    running[pool.submit(_translate_file, *job, *arguments)] = job
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                crashed = []
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        record(future.result())
+                    except BrokenProcessPool:
+                        crashed.append(job)
+                if crashed:
+                    return crashed + list(running.values())
+        return []
+
+_manager: TranslationManager | None = None  # Translation manager of a worker process
+
+def _start_worker(
+    engine: Engine,
+    processes: int,
+    hedge_with: Engine | None,
+    base_urls: dict[Engine, str],
+    config_path: str | None
+) -> None:
+    """Creates the translation manager of a worker process.
+
+    Args:
+        engine (Engine): Translation engine
+        processes (int): Processes sharing the engine's request rate
+        hedge_with (Engine | None): Secondary engine
+        base_urls (dict[Engine, str]): Endpoint overrides
+        config_path (str | None): Settings file, or None to use QSettings
+    """
+    global _manager
+    if config_path:
+        Config.use_file(config_path)
+    profile = get_engine_class(engine).profile
+    service = TranslationService(
+        engine,
+        cache=TranslationCache.shared(),
+        rate_limiter=TokenBucket(profile.rate / processes, max(1, profile.burst // processes)),
+        hedge_with=hedge_with,
+        base_urls=base_urls
+    )
+    _manager = TranslationManager(service=service)
+
+def _translate_file(
+    input_path: str,
+    output_path: str,
+    lang_from: str,
+    lang_to: str,
+    skip_pages: Set[int]
+) -> DocumentResult:
+    """Translates one document in a worker process, catching its errors.
+
+    Args:
+        input_path (str): Source document
+        output_path (str): Translated document
+        lang_from (str): Source language code
+        lang_to (str): Target language code
+        skip_pages (set[int]): Pages to leave untranslated
+
+    Returns:
+        DocumentResult: Summary of the document, or the error it raised
+    """
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        stats = _manager.translate_document(input_path, output_path, lang_from, lang_to, skip_pages=skip_pages)
+        return DocumentResult(input_path, output_path, stats=stats, elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return DocumentResult(
+            input_path, output_path, error=f"{type(e).__name__}: {e}", elapsed=time.perf_counter() - start
+        )
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from app.exceptions.document import DocumentWriteError
+
+class CheckpointJournal:
+    """Append-only journal of translated segments used to resume documents.
+
+    Each line is a JSON record ``{"id", "source", "translation"}``: the segment
+    id, a hash of its source and its translation. Records are buffered and
+    written with a single ``fsync`` every ``sync_every`` records or
+    ``sync_interval`` seconds, whichever comes first, so checkpointing does not
+    cost one disk write per paragraph. A torn last line from a crash is
+    ignored on load, and a later record for the same id wins.
+
+    Segments are first announced with ``begin`` (their source hash, taken
+    before translation) and then written with ``commit`` once translated.
+    On resume, ``lookup`` only returns translations of the previous run whose
+    source hash still matches, so edits to the input file are translated
+    again. New records are written but not kept in memory.
+
+    A journal opened with a ``context`` (e.g. engine and language pair) starts
+    with a ``{"context"}`` header line. A previous journal whose header is
+    missing or different is deleted on load, so retrying with another target
+    language or engine never replays translations made for the old one.
+
+    Attributes:
+        path (str): Journal file location
+        context (str | None): Settings the recorded translations depend on
+        sync_every (int): Buffered records that trigger a sync
+        sync_interval (float): Seconds after which buffered records are synced
+
+    Example:
+        >>> journal = CheckpointJournal("out.docx.journal", context="deepl:en:es")
+        >>> journal.begin(0, CheckpointJournal.hash("Hello"))
+        >>> journal.commit(0, "Hola")
+        >>> journal.close()
+        >>> CheckpointJournal("out.docx.journal", context="deepl:en:es").lookup(0, CheckpointJournal.hash("Hello"))
+        'Hola'
+        >>> CheckpointJournal("out.docx.journal", context="deepl:en:fr").lookup(0, CheckpointJournal.hash("Hello"))
+    """
+
+    def __init__(
+        self, path: str, sync_every: int = 64, sync_interval: float = 2.0, context: str | None = None
+    ) -> None:
+        """Opens a journal, loading the records of a previous run if present.
+
+        Args:
+            path (str): Journal file path
+            sync_every (int, optional): Records per sync. Defaults to 64.
+            sync_interval (float, optional): Maximum seconds between syncs. Defaults to 2.0.
+            context (str, optional): Settings the translations depend on; a previous
+                journal recorded under other settings is discarded. Defaults to None
+                (no check).
+        """
+        self.path = path
+        self.context = context
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self._entries: dict[str, tuple[str, str]] = {}
+        self._sources: dict[str, str] = {}
+        self._buffer: list[str] = []
+        self._synced_at = time.monotonic()
+        self._file = None
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def hash(source: str | bytes) -> str:
+        """Returns the fingerprint stored for a segment's source.
+
+        Args:
+            source (str | bytes): Source text or serialized XML
+
+        Returns:
+            str: Hex SHA-1 digest
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        return hashlib.sha1(source).hexdigest()
+
+    def lookup(self, segment_id: int | str, source_hash: str) -> str | None:
+        """Returns a translation recorded by the previous run if its source is unchanged.
+
+        Args:
+            segment_id (int | str): Segment identifier
+            source_hash (str): Hash of the segment's current source
+
+        Returns:
+            (str, optional): Recorded translation, or None if missing or stale
+        """
+        entry = self._entries.get(str(segment_id))
+        if entry is None or entry[0] != source_hash:
+            return None
+        return entry[1]
+
+    def begin(self, segment_id: int | str, source_hash: str) -> None:
+        """Remembers the source hash of a segment about to be translated.
+
+        Args:
+            segment_id (int | str): Segment identifier
+            source_hash (str): Hash of the segment's source
+        """
+        with self._lock:
+            self._sources[str(segment_id)] = source_hash
+
+    def commit(self, segment_id: int | str, translation: str) -> None:
+        """Records the translation of a segment announced with ``begin``.
+
+        Args:
+            segment_id (int | str): Segment identifier
+            translation (str): Translated segment
+
+        Raises:
+            DocumentWriteError: If a due sync fails
+        """
+        key = str(segment_id)
+        with self._lock:
+            source_hash = self._sources.pop(key)
+            self._buffer.append(json.dumps(
+                {"id": key, "source": source_hash, "translation": translation}, ensure_ascii=False
+            ))
+            due = (
+                len(self._buffer) >= self.sync_every
+                or time.monotonic() - self._synced_at >= self.sync_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes buffered records and syncs them to disk.
+
+        The file is created even with nothing buffered, so a partial output
+        saved next to it (see ``DocxProcessor._save_progress``) is always
+        recognizable as unfinished.
+
+        Raises:
+            DocumentWriteError: If the journal cannot be written
+        """
+        with self._lock:
+            self._synced_at = time.monotonic()
+            if not self._buffer and self._file is not None:
+                return
+            lines, self._buffer = self._buffer, []
+            try:
+                if self._file is None:
+                    self._file = self._open()
+                if lines:
+                    self._file.write("\n".join(lines) + "\n")
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                raise DocumentWriteError(f"Checkpoint update failed: {e}")
+
+    def close(self) -> None:
+        """Flushes pending records and closes the file, keeping it for a resume."""
+        if self._buffer:
+            self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self) -> None:
+        """Closes the journal and deletes it, e.g. once the document is saved."""
+        with self._lock:
+            self._buffer.clear()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._entries.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _open(self):
+        """Opens the file for appending, terminating a line torn by a crash."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        torn = False
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                torn = file.read(1) != b"\n"
+        file = open(self.path, "a", encoding="utf-8")
+        if torn:
+            file.write("\n")
+        if self.context is not None and file.tell() == 0:
+            file.write(json.dumps({"context": self.context}, ensure_ascii=False) + "\n")
+        return file
+
+    def _load(self) -> None:
+        """Reads the records of a previous run, skipping malformed lines.
+
+        Deletes the file instead if it was recorded under another context.
+        """
+        if not os.path.exists(self.path):
+            return
+        context = None
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                for number, line in enumerate(file):
+                    try:
+                        record = json.loads(line)
+                        if number == 0 and "context" in record:
+                            context = record["context"]
+                            continue
+                        self._entries[str(record["id"])] = (record["source"], record["translation"])
+                    except (ValueError, TypeError, KeyError):
+                        continue
+        except OSError:
+            self._entries.clear()
+            return
+
+        if self.context is not None and context != self.context:
+            self._entries.clear()
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                raise DocumentWriteError(f"Stale checkpoint could not be removed: {e}")
@@ -1,15 +1,111 @@
-from PyQt6.QtCore import QSettings
+import configparser
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QSettings
+
+class FileSettings:
+    """Settings store backed by an INI file and the environment, without Qt.
+
+    Offers the subset of the ``QSettings`` interface ``Config`` uses, so
+    headless entry points can read the same keys without importing PyQt6.
+    Keys live in the ``[General]`` section, the layout QSettings uses for
+    its own INI files. A ``TRADUCTOR_<KEY>`` environment variable (e.g.
+    ``TRADUCTOR_DEEPL_API``) takes precedence over the file.
+
+    Attributes:
+        path (str): INI file read and written
+
+    Example:
+        >>> settings = FileSettings("~/.traductor-inador/config.ini")
+        >>> settings.value("deepl_api")
+        'your_api_key_here'
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".traductor-inador", "config.ini")
+    SECTION = "General"
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """Reads the file, if it exists.
+
+        Args:
+            path (str, optional): INI file. Defaults to ``DEFAULT_PATH``.
+        """
+        self.path = os.path.expanduser(path)
+        self._parser = configparser.ConfigParser(interpolation=None)
+        self._parser.optionxform = str  # Keys are case-sensitive, as in QSettings
+        self._parser.read(self.path, encoding="utf-8")
+        if not self._parser.has_section(self.SECTION):
+            self._parser.add_section(self.SECTION)
+        self._lock = threading.Lock()
+
+    def value(self, key: str, default: str | None = None) -> str | None:
+        """Returns the environment override, the stored value or ``default``."""
+        return os.environ.get(f"TRADUCTOR_{key.upper()}") or self._parser.get(self.SECTION, key, fallback=default)
+
+    def setValue(self, key: str, value: str) -> None:
+        """Stores a value and writes the file."""
+        with self._lock:
+            self._parser.set(self.SECTION, key, str(value))
+            self._write()
+
+    def remove(self, key: str) -> None:
+        """Deletes a value and writes the file."""
+        with self._lock:
+            if self._parser.remove_option(self.SECTION, key):
+                self._write()
+
+    def _write(self) -> None:
+        """Saves the settings, creating the file's folder if needed."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            self._parser.write(file)
 
 class Config:
     """Manages application configuration using QSettings for persistent storage.
     
     Provides a centralized interface for storing/retrieving settings across sessions.
-    Uses platform-appropriate storage locations handled by Qt.
+    Uses platform-appropriate storage locations handled by Qt. QtCore is only
+    imported on first use, so entry points that call ``use_file`` first (like
+    the command line) never load Qt.
 
     Attributes:
-        _settings (QSettings): QSettings instance initialized with organization/app names
+        _settings (QSettings | FileSettings | None): Store in use, created on first access
     """
-    _settings: QSettings = QSettings("Mictla Projects", 'Traductor-inador')
+    _settings: "QSettings | FileSettings | None" = None
+
+    @classmethod
+    def use_file(cls, path: str | None = None) -> None:
+        """Switches to a Qt-free store backed by an INI file and the environment.
+
+        Args:
+            path (str, optional): INI file. Defaults to the ``TRADUCTOR_CONFIG``
+                environment variable, then ``FileSettings.DEFAULT_PATH``.
+
+        Example:
+            >>> Config.use_file("settings.ini")
+        """
+        cls._settings = FileSettings(path or os.environ.get("TRADUCTOR_CONFIG") or FileSettings.DEFAULT_PATH)
+
+    @classmethod
+    def file_path(cls) -> str | None:
+        """Returns the INI file selected with ``use_file``, or None if QSettings is in use.
+
+        Example:
+            >>> Config.file_path()
+            '/home/user/.traductor-inador/config.ini'
+        """
+        return cls._settings.path if isinstance(cls._settings, FileSettings) else None
+
+    @classmethod
+    def _store(cls) -> "QSettings | FileSettings":
+        """Returns the store in use, opening the QSettings one if none is set."""
+        if cls._settings is None:
+            from PyQt6.QtCore import QSettings
+            cls._settings = QSettings("Mictla Projects", 'Traductor-inador')
+        return cls._settings
 
     @classmethod
     def get(cls, key: str, default: str | None = None) -> str | None:
@@ -26,7 +122,7 @@ class Config:
             >>> Config.get('last_used_language', 'en')
             'es'
         """
-        return cls._settings.value(key, default)
+        return cls._store().value(key, default)
 
     @classmethod
     def set(cls, key: str, value: str) -> None:
@@ -42,7 +138,7 @@ class Config:
         if not value:
             cls.delete(key)
         else:   
-            cls._settings.setValue(key, value)
+            cls._store().setValue(key, value)
 
     @classmethod
     def delete(cls, key: str) -> None:
@@ -54,7 +150,7 @@ class Config:
         Example:
             >>> Config.delete('temp_api_key')
         """
-        cls._settings.remove(key)
+        cls._store().remove(key)
 
     @classmethod
     def get_api_url(cls, engine: str) -> str | None:
@@ -74,11 +170,12 @@ class Config:
             'your_api_key_here'
 
         Note:
-            Key mapping can be extended for new services
+            Key mapping can be extended for new services; unmapped engines
+            use the ``<engine>_api`` key
         """
         key_map = {
             "deepl": "deepl_api",
             "google": "google_api",
             "magic_loops": "magic_loops_api"
         }
-        return cls.get(key_map.get(engine, ""))
\ No newline at end of file
+        return cls.get(key_map.get(engine, f"{engine}_api"))
\ No newline at end of file
@@ -11,6 +11,7 @@ class Engine(StrEnum):
         MAGIC_LOOPS: Custom Magic Loops API
         DEEPL: DeepL API service
         GOOGLE: Google Cloud Translation API
+        TRANSLATION_MEMORY: Offline lookup in local TMX/TSV translation memories
 
     Example:
         >>> Engine.DEEPL
@@ -22,6 +23,7 @@ class Engine(StrEnum):
     MAGIC_LOOPS = "magic_loops"
     DEEPL = "deepl"
     GOOGLE = "google"
+    TRANSLATION_MEMORY = "translation_memory"
 
 LANGUAGES = {
     "Español": "es",
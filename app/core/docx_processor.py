@@ -1,6 +1,28 @@
-import os
-from typing import Callable, Set
+import asyncio
+import copy
+import html
+import re
+import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from xml.sax.saxutils import escape, unescape
+from typing import Callable, Iterable, Iterator, Set
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
+from app.services.async_translation_api import AsyncTranslationService
+from .checkpoint_journal import CheckpointJournal
+from .page_counter import PageCounter
+from .segment_filter import SegmentFilter
+from .segment_plan import SegmentPlan, SegmentStats
+from .segmenter import Segmenter
+from .story_walker import StoryWalker
 from app.exceptions.document import (
     DocumentNotFound,
     DocumentReadError,
@@ -13,13 +35,33 @@ class DocxProcessor:
     
     Features:
     - Preserves original document formatting and structure
-    - Checkpoint system for resuming interrupted translations
-    - Page skipping functionality
-    - Chunked translation to handle API limits
+    - Translates every story: body, nested tables, text boxes, headers,
+      footers, footnotes, endnotes and comments
+    - Journal of translated paragraphs for resuming interrupted translations
+    - Page skipping functionality backed by a one-pass page index
+    - Sentence-aware chunking that fills each request up to the engine's
+      character and byte limits, keeping the original whitespace
+    - Adjacent runs with identical formatting merged into one segment
+    - Optional markup mode sending each paragraph as one tagged segment
+    - Batched requests grouping several paragraphs per API call
+    - Document-wide deduplication sending each distinct segment once
+    - Numbers, codes, URLs and similar segments left untouched without a request
+    - Optional concurrent mode keeping several batches in flight
+    - Optional thread pool mode committing batches as they finish, in order
+    - Several target languages from a single read of the source
     
     Attributes:
-        translator (TranslationService): Translation service instance with translate() method
+        translator (TranslationService): Translation service instance with translate_batch() method
         chunk_size (int): Maximum characters per translation chunk (default: 200)
+        chunk_bytes (int | None): Maximum URL-encoded bytes per chunk, or None (default)
+        batch_size (int): Paragraphs translated together per batch (default: 50)
+        concurrency (int): Batches kept in flight at once; 1 translates serially (default: 1)
+        workers (int): Threads translating batches in parallel; overrides ``concurrency``
+            when greater than 1 (default: 1)
+        markup (str | None): ``'xml'`` or ``'html'`` to translate whole paragraphs with
+            inline tags marking run boundaries; None translates run by run (default: None)
+        segment_filter (SegmentFilter): Classifier of segments engines return unchanged
+        segmenter (Segmenter): Splitter of long segments into chunks within the limits
     
     Raises:
         DocumentNotFound: When input file is not found
@@ -28,15 +70,58 @@ class DocxProcessor:
         ParagraphTranslationError: When paragraph translation fails
     """
 
-    def __init__(self, translator: object, chunk_size: int = 200):
+    # Run children that can be rewritten as plain text when merging runs
+    _PLAIN_RUN_CHILDREN = {qn('w:rPr'), qn('w:t')}
+    # Proofing-only run properties that Word varies without changing the look
+    _PROOFING_PROPERTIES = {qn('w:noProof'), qn('w:lang')}
+    # Spell/grammar check markers Word leaves between runs
+    _PROOF_MARK = qn('w:proofErr')
+    # Elements planned batches point at, matched between copies of a document
+    _PLANNED_ELEMENTS = (qn('w:p'), qn('w:r'))
+    # Inline tags wrapping each run group in markup mode, and their parsers
+    _MARKUP_TAGS = {
+        'xml': ('<g{0}>', '</g{0}>'),
+        'html': ('<span id="g{0}">', '</span>'),
+    }
+    _MARKUP_SPANS = {
+        'xml': re.compile(r'<g(\d+)>(.*?)</g\1>', re.S),
+        'html': re.compile(r'<span id="g(\d+)">(.*?)</span>', re.S),
+    }
+
+    def __init__(
+        self,
+        translator: object,
+        chunk_size: int = 200,
+        batch_size: int = 50,
+        concurrency: int = 1,
+        markup: str | None = None,
+        workers: int = 1,
+        chunk_bytes: int | None = None
+    ):
         """Initializes the document processor with translation service and configuration.
         
         Args:
-            translator: Translation service implementing translate(text, src_lang, dest_lang)
+            translator: Translation service implementing translate_batch(texts, src_lang, dest_lang)
             chunk_size: Maximum character count per translation chunk (default: 200)
+            batch_size: Paragraphs grouped into a single batch call (default: 50)
+            concurrency: Batches translated concurrently through asyncio (default: 1)
+            markup: Inline markup understood by the engine, ``'xml'`` or ``'html'``.
+                The translator must then accept ``translate_batch(..., markup=markup)``
+                (default: None, plain text per run)
+            workers: Size of the thread pool sending batches; the calling thread
+                applies the results and writes the journal (default: 1, no pool)
+            chunk_bytes: Maximum URL-encoded UTF-8 bytes per chunk, for engines
+                reading the text from the query string (default: None, no limit)
         """
         self.translator = translator
         self.chunk_size = chunk_size
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.markup = markup
+        self.workers = max(1, workers)
+        self.chunk_bytes = chunk_bytes
+        self.segment_filter = SegmentFilter()
+        self.segmenter = Segmenter(chunk_size, chunk_bytes)
 
     def process_document(
         self,
@@ -46,53 +131,636 @@ class DocxProcessor:
         lang_to: str,
         progress_callback: Callable[[int, int], None] | None = None,
         skip_pages: Set[int] = set()
-    ) -> None:
+    ) -> SegmentStats:
         """Main method to process and translate a DOCX document.
         
+        Translated paragraphs are journaled next to the output
+        (``<output_path>.journal``). Running again after an interruption replays
+        the journal into the freshly loaded input and only translates the rest;
+        paragraphs whose source changed in between are translated again. A
+        journal left by another engine or language pair is discarded.
+        
+        Every segment of the document is planned before any request (see
+        ``SegmentPlan``), so repeated cell values, headers and boilerplate are
+        translated once and copied to every occurrence.
+        
         Args:
             input_path (str): Path to source DOCX file
             output_path (str): Path for translated DOCX file
             lang_from (str): Source language code (ISO 639-1)
             lang_to (str): Target language code (ISO 639-1)
-            progress_callback (Callable[[int, int], None], optional): Optional callback for progress updates (processed, total)
+            progress_callback (Callable[[int, int], None], optional): Optional callback for progress
+                updates (unique segments translated, total unique segments)
             skip_pages (set[int], optional): Set of page numbers to skip in translation
         
+        Returns:
+            SegmentStats: Segments planned and sent, including the dedup ratio
+        
         Raises:
             DocumentNotFound: If input file doesn't exist
             DocumentReadError: If document can't be loaded
             DocumentWriteError: If document can't be saved
             ParagraphTranslationError: If any paragraph fails to translate
         """
-        checkpoint_path = f"{output_path}.checkpoint"
-        start_index, current_page = self._load_checkpoint(checkpoint_path)
+        journal = self._open_journal(output_path, lang_from, lang_to)
+        plan = SegmentPlan()
         
         try:
             doc = self._load_document(input_path)
-            paragraphs = self._extract_all_paragraphs(doc)
-            total = len(paragraphs)
+            walker = StoryWalker(doc)
+            body = walker.body_paragraphs()
+            paragraphs = body + walker.story_paragraphs()
             
-            for idx in range(start_index, total):
-                paragraph = paragraphs[idx]
-                current_page = self._handle_page_breaks(paragraph, current_page)
-                
-                if current_page in skip_pages:
-                    continue
-                
-                try:
-                    self._translate_paragraph(paragraph, lang_from, lang_to)
-                except Exception as e:
-                    self._save_progress(doc, output_path, checkpoint_path, idx)
-                    raise ParagraphTranslationError(f"Paragraph {idx+1} error: {e}")
-                
-                self._update_checkpoint(checkpoint_path, idx + 1)
-                self._report_progress(progress_callback, idx + 1, total)
-            
-            self._finalize_output(doc, output_path, checkpoint_path)
+            page_index = self._index_pages(doc)
+            pages = [page_index.get(paragraph._element, 1) for paragraph in body]
+            batches = self._plan_segments(self._plan_batches(paragraphs, pages, journal, skip_pages), plan, lang_from)
+            self._translate_planned(doc, batches, plan, lang_from, lang_to, output_path, journal, progress_callback)
+            return plan.stats
         
         except Exception as e:
             if isinstance(e, (DocumentNotFound, DocumentReadError, DocumentWriteError)):
                 raise
             raise DocumentWriteError(f"Unexpected error: {e}")
+        finally:
+            journal.close()
+
+    def process_targets(
+        self,
+        input_path: str,
+        outputs: dict[str, str],
+        lang_from: str,
+        progress_callback: Callable[[int, int], None] | None = None,
+        skip_pages: Set[int] = set()
+    ) -> dict[str, SegmentStats]:
+        """Translates a document into several languages, reading and planning it once.
+        
+        The document is loaded, paged and split into segments a single time.
+        Each target language then gets its own copy of the loaded document,
+        and the copies are translated concurrently, each on its own thread and
+        in the mode ``process_document`` would use. The wall time is close to
+        that of the slowest language rather than the sum of all of them.
+        
+        Each language is journaled next to its output, so a language that
+        failed can be resumed on its own with ``process_document``. A
+        multi-target run always translates every language from the start.
+        
+        Args:
+            input_path (str): Path to source DOCX file
+            outputs (dict[str, str]): Output path for each target language code
+            lang_from (str): Source language code (ISO 639-1)
+            progress_callback (Callable[[int, int], None], optional): Optional callback for progress
+                updates (unique segments translated, total), summed over all languages
+            skip_pages (set[int], optional): Set of page numbers to skip in translation
+        
+        Returns:
+            dict[str, SegmentStats]: Segments planned and sent for each language
+        
+        Raises:
+            DocumentNotFound: If input file doesn't exist
+            DocumentReadError: If document can't be loaded
+            DocumentWriteError: If any language fails; the others are still saved
+        """
+        try:
+            doc = self._load_document(input_path)
+            walker = StoryWalker(doc)
+            body = walker.body_paragraphs()
+            paragraphs = body + walker.story_paragraphs()
+            
+            page_index = self._index_pages(doc)
+            pages = [page_index.get(paragraph._element, 1) for paragraph in body]
+            plan = SegmentPlan()
+            batches = self._plan_segments(self._plan_batches(paragraphs, pages, None, skip_pages), plan, lang_from)
+            sources = {
+                idx: CheckpointJournal.hash(etree.tostring(paragraph._element))
+                for batch, *_ in batches
+                for idx, paragraph in batch
+            }
+            
+            # Copies are made here, as lxml trees should not be read from several threads
+            originals = [element for root in walker.roots() for element in root.iter(*self._PLANNED_ELEMENTS)]
+            copies = {}
+            for lang_to in outputs:
+                target = copy.deepcopy(doc)
+                elements = dict(zip(originals, (
+                    element for root in StoryWalker(target).roots() for element in root.iter(*self._PLANNED_ELEMENTS)
+                )))
+                copies[lang_to] = (target, self._rebind(batches, elements))
+        
+        except Exception as e:
+            if isinstance(e, (DocumentNotFound, DocumentReadError)):
+                raise
+            raise DocumentReadError(f"Error planning document: {e}")
+        
+        progress = self._combine_progress(progress_callback, outputs, plan.stats.unique)
+        with ThreadPoolExecutor(max_workers=len(outputs), thread_name_prefix="target") as pool:
+            futures = {
+                lang_to: pool.submit(
+                    self._translate_copy, *copies.pop(lang_to), sources, plan.stats,
+                    lang_from, lang_to, output_path, progress[lang_to]
+                )
+                for lang_to, output_path in outputs.items()
+            }
+        return self._gather_targets(futures)
+
+    def _translate_planned(
+        self,
+        doc,
+        batches: list[tuple[list, list, list[str], list[str]]],
+        plan: SegmentPlan,
+        lang_from: str,
+        lang_to: str,
+        output_path: str,
+        journal: CheckpointJournal,
+        progress_callback: Callable[[int, int], None] | None
+    ) -> None:
+        """Sends planned batches in the configured mode and saves the document.
+        
+        Args:
+            doc (Document): Document being translated
+            batches (list[tuple[list, list, list[str], list[str]]]): Batches from ``_plan_segments``
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            output_path (str): Output file path
+            journal (CheckpointJournal): Journal receiving translated paragraphs
+            progress_callback (Callable[[int, int], None] | None): Progress reporting function
+            
+        Raises:
+            DocumentWriteError: If the document can't be saved
+            ParagraphTranslationError: If any batch fails to translate
+        """
+        total = plan.stats.unique
+        
+        if self.workers > 1:
+            self._process_in_parallel(
+                doc, batches, plan, lang_from, lang_to, output_path, journal, progress_callback, total
+            )
+        elif self.concurrency > 1:
+            asyncio.run(self._process_concurrently(
+                doc, batches, plan, lang_from, lang_to, output_path, journal, progress_callback, total
+            ))
+        else:
+            processed = 0
+            for batch in batches:
+                self._flush_batch(doc, batch, plan, lang_from, lang_to, output_path, journal)
+                processed += len(batch[3])
+                self._report_progress(progress_callback, processed, total)
+        
+        self._report_progress(progress_callback, total, total)
+        self._finalize_output(doc, output_path, journal)
+
+    def _translate_copy(
+        self,
+        doc,
+        batches: list[tuple[list, list, list[str]]],
+        sources: dict[int, str],
+        stats: SegmentStats,
+        lang_from: str,
+        lang_to: str,
+        output_path: str,
+        progress_callback: Callable[[int, int], None] | None
+    ) -> SegmentStats:
+        """Translates one language of ``process_targets`` into its copy of the document.
+        
+        Args:
+            doc (Document): Copy of the document for this language
+            batches (list[tuple[list, list, list[str]]]): Batches bound to the copy (see ``_rebind``)
+            sources (dict[int, str]): Source hash of every planned paragraph
+            stats (SegmentStats): Counters of the shared plan, for the skipped segments
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            output_path (str): Output file path
+            progress_callback (Callable[[int, int], None] | None): Progress reporting function
+            
+        Returns:
+            SegmentStats: Segments planned and sent for this language
+        """
+        plan = SegmentPlan()
+        plan.stats.skipped, plan.stats.skipped_chars = stats.skipped, stats.skipped_chars
+        journal = self._open_journal(output_path, lang_from, lang_to)
+        try:
+            planned = []
+            for batch, runs, chunks in batches:
+                for idx, _ in batch:
+                    journal.begin(idx, sources[idx])
+                planned.append((batch, runs, chunks, plan.add(chunks)))
+            self._translate_planned(doc, planned, plan, lang_from, lang_to, output_path, journal, progress_callback)
+            return plan.stats
+        finally:
+            journal.close()
+
+    def _rebind(
+        self,
+        batches: list[tuple[list, list, list[str], list[str]]],
+        elements: dict
+    ) -> list[tuple[list, list, list[str]]]:
+        """Points planned batches at the matching paragraphs and runs of a document copy.
+        
+        Args:
+            batches (list[tuple[list, list, list[str], list[str]]]): Batches from ``_plan_segments``
+            elements (dict): Copied element of every planned paragraph and run element
+            
+        Returns:
+            list[tuple[list, list, list[str]]]: (index, paragraph) pairs, runs and chunks of
+                each batch, bound to the copy
+        """
+        return [
+            (
+                [(idx, Paragraph(elements[paragraph._element], None)) for idx, paragraph in batch],
+                [
+                    ([[Run(elements[run._element], None) for run in group] for group in groups], layout)
+                    for groups, layout in runs
+                ],
+                chunks,
+            )
+            for batch, runs, chunks, _ in batches
+        ]
+
+    def _combine_progress(
+        self,
+        callback: Callable[[int, int], None] | None,
+        languages: Iterable[str],
+        total: int = 0
+    ) -> dict[str, Callable[[int, int], None] | None]:
+        """Creates per-language progress callbacks that report the sum of all languages.
+        
+        Args:
+            callback (Callable[[int, int], None] | None): Progress reporting function
+            languages (Iterable[str]): Target language codes
+            total (int, optional): Expected total of each language, until it reports its own
+            
+        Returns:
+            dict[str, Callable[[int, int], None] | None]: Callback of each language
+        """
+        if not callback:
+            return dict.fromkeys(languages)
+        processed = dict.fromkeys(languages, 0)
+        totals = dict.fromkeys(languages, total)
+        lock = threading.Lock()
+        
+        def report(lang_to: str, done: int, expected: int) -> None:
+            with lock:
+                processed[lang_to], totals[lang_to] = done, expected
+                callback(sum(processed.values()), sum(totals.values()))
+        
+        return {lang_to: partial(report, lang_to) for lang_to in processed}
+
+    def _gather_targets(self, futures: dict[str, Future]) -> dict[str, SegmentStats]:
+        """Collects the summary of every language, raising once all have finished.
+        
+        Args:
+            futures (dict[str, Future]): Translation of each target language
+            
+        Returns:
+            dict[str, SegmentStats]: Summary of each language
+            
+        Raises:
+            DocumentWriteError: Naming every language that failed and why
+        """
+        results: dict[str, SegmentStats] = {}
+        failures: list[str] = []
+        for lang_to, future in futures.items():
+            try:
+                results[lang_to] = future.result()
+            except Exception as e:
+                failures.append(f"{lang_to}: {e}")
+        if failures:
+            raise DocumentWriteError(f"Translation failed for {'; '.join(failures)}")
+        return results
+
+    def _plan_batches(
+        self,
+        paragraphs: list,
+        pages: list[int],
+        journal: CheckpointJournal | None,
+        skip_pages: Set[int]
+    ) -> Iterator[list[tuple[int, object]]]:
+        """Groups translatable paragraphs into batches, honoring skipped pages.
+        
+        Skipped pages are jumped over with a binary search on ``pages``, and
+        the body is left after the last page that is not skipped. Paragraphs
+        past the end of ``pages`` (headers, footers, notes, comments) are not
+        tied to one page and are always planned. Paragraphs already in the
+        journal with an unchanged source are restored from it instead of being
+        batched, and blank paragraphs are left out.
+        
+        Args:
+            paragraphs (list[Paragraph]): All document paragraphs, in document order
+            pages (list[int]): Page of each body paragraph (non-decreasing)
+            journal (CheckpointJournal | None): Journal of a previous, interrupted run,
+                or None to plan every paragraph
+            skip_pages (set[int]): Page numbers to leave untranslated
+            
+        Yields:
+            list[tuple[int, Paragraph]]: Up to ``batch_size`` (index, paragraph) pairs
+        """
+        batch: list[tuple[int, object]] = []
+        last_page = max(
+            (page for page in range(1, (pages[-1] if pages else 0) + 1) if page not in skip_pages),
+            default=0
+        )
+        
+        position = 0
+        while position < len(paragraphs):
+            if position < len(pages):
+                if pages[position] > last_page:
+                    position = len(pages)
+                    continue
+                if pages[position] in skip_pages:
+                    position = bisect_right(pages, pages[position], position)
+                    continue
+            
+            idx, paragraph = position, paragraphs[position]
+            position += 1
+            if not self._needs_translation(idx, paragraph, journal):
+                continue
+            
+            batch.append((idx, paragraph))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        
+        if batch:
+            yield batch
+
+    def _needs_translation(self, idx: int, paragraph, journal: CheckpointJournal | None) -> bool:
+        """Restores a journaled paragraph, or announces one that must be translated.
+        
+        Args:
+            idx (int): Paragraph index in document order
+            paragraph (Paragraph): Paragraph to plan
+            journal (CheckpointJournal | None): Journal of a previous, interrupted run
+            
+        Returns:
+            bool: False for blank paragraphs and paragraphs restored from the journal
+        """
+        if not StoryWalker.has_text(paragraph._element):
+            return False
+        if journal is None:
+            return True
+        
+        source = CheckpointJournal.hash(etree.tostring(paragraph._element))
+        translation = journal.lookup(idx, source)
+        if translation is not None:
+            self._restore_paragraph(paragraph, translation)
+            return False
+        
+        journal.begin(idx, source)
+        return True
+
+    def _plan_segments(
+        self,
+        batches: Iterator[list[tuple[int, object]]],
+        plan: SegmentPlan,
+        lang_from: str | None = None
+    ) -> list[tuple[list, list, list[str], list[str]]]:
+        """Collects the segments of every batch and registers them with the plan.
+        
+        The whole document is planned before anything is sent, so every
+        distinct segment is sent by the first batch that holds it. The plan's
+        use counts are then exact, and no translation is kept past its last
+        use.
+        
+        Args:
+            batches (Iterator[list[tuple[int, Paragraph]]]): Planned batches in document order
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str, optional): Source language code, for sentence splitting
+            
+        Returns:
+            list[tuple[list, list, list[str], list[str]]]: For each batch, its (index,
+                paragraph) pairs, its runs and chunks (see ``_collect_runs``) and the
+                chunks it must send (see ``SegmentPlan.add``)
+        """
+        planned = []
+        for batch in batches:
+            runs, chunks = self._collect_runs([paragraph for _, paragraph in batch], plan, lang_from)
+            planned.append((batch, runs, chunks, plan.add(chunks)))
+        return planned
+
+    def _send(self, plan: SegmentPlan, unique: list[str], lang_from: str, lang_to: str) -> None:
+        """Translates the segments a batch owns and publishes them to the plan.
+        
+        Args:
+            plan (SegmentPlan): Document-wide segment table
+            unique (list[str]): Segments claimed by the batch
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            
+        Raises:
+            Exception: Whatever the request raised; the segments are failed in the
+                plan first, so batches repeating them fail too
+        """
+        if not unique:
+            return
+        try:
+            plan.settle(unique, self._request(self.translator, unique, lang_from, lang_to))
+        except Exception as e:
+            plan.fail(unique, e)
+            raise
+
+    async def _process_concurrently(
+        self,
+        doc,
+        batches: list[tuple[list, list, list[str], list[str]]],
+        plan: SegmentPlan,
+        lang_from: str,
+        lang_to: str,
+        output_path: str,
+        journal: CheckpointJournal,
+        progress_callback: Callable[[int, int], None] | None,
+        total: int
+    ) -> None:
+        """Translates batches keeping up to ``concurrency`` of them in flight.
+        
+        Requests run concurrently, but results are written back into the runs
+        and journaled strictly in document order, so the batches owning a
+        repeated segment are always settled before the batches repeating it.
+        
+        Args:
+            doc (Document): Document being translated
+            batches (list[tuple[list, list, list[str], list[str]]]): Batches from ``_plan_segments``
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            output_path (str): Output file path
+            journal (CheckpointJournal): Journal receiving translated paragraphs
+            progress_callback (Callable[[int, int], None] | None): Progress reporting function
+            total (int): Total number of unique segments
+            
+        Raises:
+            ParagraphTranslationError: If any batch fails to translate
+        """
+        service = AsyncTranslationService(service=self.translator, concurrency=self.concurrency)
+        in_flight: deque = deque()
+        processed = 0
+        
+        async def commit_oldest() -> None:
+            nonlocal processed
+            batch, runs, chunks, unique, task = in_flight.popleft()
+            first, last = batch[0][0], batch[-1][0]
+            try:
+                if task:
+                    plan.settle(unique, await task)
+                self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+            except Exception as e:
+                for *_, pending in in_flight:
+                    if pending:
+                        pending.cancel()
+                self._save_progress(doc, output_path, journal)
+                raise ParagraphTranslationError(f"Paragraph {first+1}-{last+1} error: {e}")
+            
+            self._journal_batch(journal, batch)
+            processed += len(unique)
+            self._report_progress(progress_callback, processed, total)
+        
+        for batch, runs, chunks, unique in batches:
+            task = asyncio.create_task(self._request(service, unique, lang_from, lang_to)) if unique else None
+            in_flight.append((batch, runs, chunks, unique, task))
+            if len(in_flight) >= self.concurrency:
+                await commit_oldest()
+        
+        while in_flight:
+            await commit_oldest()
+
+    def _process_in_parallel(
+        self,
+        doc,
+        batches: list[tuple[list, list, list[str], list[str]]],
+        plan: SegmentPlan,
+        lang_from: str,
+        lang_to: str,
+        output_path: str,
+        journal: CheckpointJournal,
+        progress_callback: Callable[[int, int], None] | None,
+        total: int
+    ) -> None:
+        """Translates batches on a thread pool, applying results on the calling thread.
+        
+        Workers only send requests; reading runs, writing translations and the
+        journal stay on this thread. Batches are applied and journaled as soon
+        as they finish, waiting if needed for the batches that own their
+        repeated segments (submitted earlier, so already running). Progress
+        only advances past the highest contiguous run of finished batches, so
+        it never goes backwards. At most twice ``workers`` batches are
+        submitted ahead.
+        
+        Args:
+            doc (Document): Document being translated
+            batches (list[tuple[list, list, list[str], list[str]]]): Batches from ``_plan_segments``
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            output_path (str): Output file path
+            journal (CheckpointJournal): Journal receiving translated paragraphs
+            progress_callback (Callable[[int, int], None] | None): Progress reporting function
+            total (int): Total number of unique segments
+            
+        Raises:
+            ParagraphTranslationError: If any batch fails to translate
+        """
+        planned = enumerate(batches)
+        pending: dict[Future, tuple[int, list, list, list[str], list[str]]] = {}
+        finished: dict[int, int] = {}  # Unique segments of each applied, uncommitted batch
+        committed = 0
+        processed = 0
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="docx") as pool:
+            while True:
+                for position, (batch, runs, chunks, unique) in islice(planned, 2 * self.workers - len(pending)):
+                    future = pool.submit(self._send, plan, unique, lang_from, lang_to)
+                    pending[future] = (position, batch, runs, chunks, unique)
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                failure = None
+                for future in done:
+                    position, batch, runs, chunks, unique = pending.pop(future)
+                    try:
+                        future.result()
+                        self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+                    except Exception as e:
+                        failure = failure or (batch, e)
+                        continue
+                    self._journal_batch(journal, batch)
+                    finished[position] = len(unique)
+                
+                if failure:
+                    batch, e = failure
+                    self._drain(pending, plan, journal, lang_from, lang_to)
+                    self._save_progress(doc, output_path, journal)
+                    raise ParagraphTranslationError(f"Paragraph {batch[0][0]+1}-{batch[-1][0]+1} error: {e}")
+                
+                if committed not in finished:
+                    continue
+                while committed in finished:
+                    processed += finished.pop(committed)
+                    committed += 1
+                self._report_progress(progress_callback, processed, total)
+
+    def _drain(
+        self,
+        pending: dict[Future, tuple[int, list, list, list[str], list[str]]],
+        plan: SegmentPlan,
+        journal: CheckpointJournal,
+        lang_from: str,
+        lang_to: str
+    ) -> None:
+        """Cancels queued batches and keeps the results of those already running.
+        
+        Args:
+            pending (dict[Future, tuple[int, list, list, list[str], list[str]]]): Submitted batches by future
+            plan (SegmentPlan): Document-wide segment table
+            journal (CheckpointJournal): Journal receiving the salvaged paragraphs
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+        """
+        for future in pending:
+            future.cancel()
+        for future, (_, batch, runs, chunks, _) in pending.items():
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+                self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+            except Exception:
+                continue
+            self._journal_batch(journal, batch)
+
+    def _flush_batch(
+        self,
+        doc,
+        planned: tuple[list, list, list[str], list[str]],
+        plan: SegmentPlan,
+        lang_from: str,
+        lang_to: str,
+        output_path: str,
+        journal: CheckpointJournal
+    ) -> None:
+        """Translates a group of paragraphs and journals them.
+        
+        Args:
+            doc (Document): Document being translated
+            planned (tuple[list, list, list[str], list[str]]): Batch from ``_plan_segments``
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            output_path (str): Output file path
+            journal (CheckpointJournal): Journal receiving translated paragraphs
+            
+        Raises:
+            ParagraphTranslationError: If the batch fails to translate
+        """
+        batch, runs, chunks, unique = planned
+        first, last = batch[0][0], batch[-1][0]
+        try:
+            self._send(plan, unique, lang_from, lang_to)
+            self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+        except Exception as e:
+            self._save_progress(doc, output_path, journal)
+            raise ParagraphTranslationError(f"Paragraph {first+1}-{last+1} error: {e}")
+        
+        self._journal_batch(journal, batch)
 
     def _load_document(self, path: str):
         """Loads DOCX document from file path.
@@ -114,26 +782,6 @@ class DocxProcessor:
         except Exception as e:
             raise DocumentReadError(f"Error loading document: {e}")
 
-    def _extract_all_paragraphs(self, doc) -> list:
-        """Extracts all paragraphs including tables and their cells.
-        
-        Args:
-            doc (Document): python-docx Document object
-            
-        Returns:
-            list[Paragraph]: All paragraph objects in document
-        """
-        return (
-            list(doc.paragraphs)
-            + [
-                para
-                for table in doc.tables
-                for row in table.rows
-                for cell in row.cells
-                for para in cell.paragraphs
-            ]
-        )
-
     def _translate_paragraph(self, paragraph, lang_from: str, lang_to: str) -> None:
         """Translates a paragraph while preserving formatting runs.
         
@@ -142,136 +790,452 @@ class DocxProcessor:
             lang_from (str): Source language code
             lang_to (str): Target language code
         """
-        if not paragraph.text.strip():
+        self._translate_paragraphs([paragraph], lang_from, lang_to)
+
+    def _translate_paragraphs(self, paragraphs: list, lang_from: str, lang_to: str) -> None:
+        """Translates several paragraphs with a single batch call, preserving runs.
+        
+        Every run is split into chunks, all chunks are sent together and the
+        results are joined back into their original run. In markup mode,
+        paragraphs whose tags did not survive translation are sent again run
+        by run.
+        
+        Args:
+            paragraphs (list[Paragraph]): docx Paragraph objects to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+        """
+        runs, chunks = self._collect_runs(paragraphs, lang=lang_from)
+        if not chunks:
             return
         
-        for run in paragraph.runs:
-            if not run.text.strip():
+        self._apply_with_retry(runs, self._request(self.translator, chunks, lang_from, lang_to), lang_from, lang_to)
+
+    def _apply_with_retry(self, runs: list, translated: list[str], lang_from: str, lang_to: str) -> None:
+        """Applies translations, resending run by run the paragraphs whose tags were lost.
+        
+        Args:
+            runs (list[tuple[list[list[Run]], list[str]]]): Units from ``_collect_runs``
+            translated (list[str]): Translated chunks in the same order
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+        """
+        failed = self._apply_translations(runs, translated)
+        runs, chunks = self._collect_groups(failed, lang=lang_from)
+        if chunks:
+            self._apply_translations(runs, self._request(self.translator, chunks, lang_from, lang_to))
+
+    def _request(self, translator, chunks: list[str], lang_from: str, lang_to: str):
+        """Calls ``translator.translate_batch``, passing ``markup`` only when enabled.
+        
+        Args:
+            translator: Sync or async service implementing ``translate_batch``
+            chunks (list[str]): Segments to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            
+        Returns:
+            list[str] | Awaitable[list[str]]: Whatever ``translate_batch`` returns
+        """
+        if self.markup:
+            return translator.translate_batch(chunks, lang_from, lang_to, markup=self.markup)
+        return translator.translate_batch(chunks, lang_from, lang_to)
+
+    def _collect_runs(
+        self,
+        paragraphs: list,
+        plan: SegmentPlan | None = None,
+        lang: str | None = None
+    ) -> tuple[list, list[str]]:
+        """Splits the translatable runs of several paragraphs into chunks.
+        
+        Adjacent runs with equivalent formatting are merged first (see
+        ``_coalesce_runs``), so a sentence Word split into many runs is
+        translated as one segment. In markup mode, a paragraph with several
+        run groups that fits in a single chunk becomes one tagged segment
+        instead (see ``_to_markup``). Paragraphs and run groups the
+        ``segment_filter`` rejects are left untouched.
+        
+        Args:
+            paragraphs (list[Paragraph]): docx Paragraph objects to translate
+            plan (SegmentPlan, optional): Plan counting the segments left untouched
+            lang (str, optional): Source language code, for sentence splitting
+            
+        Returns:
+            tuple[list[tuple[list[list[Run]], list[str]]], list[str]]: (run groups,
+                whitespace around the chunks) pairs (see ``_segment``) and the flat
+                list of chunks in run order
+        """
+        runs = []
+        chunks: list[str] = []
+        
+        for paragraph in paragraphs:
+            groups = [
+                group for group in self._coalesce_runs(paragraph)
+                if "".join(run.text for run in group).strip()
+            ]
+            if not groups:
+                continue
+            # Judged as a whole first, so "12" and a bold " kg" are not sent apart
+            if not self.segment_filter.needs_translation("".join(run.text for group in groups for run in group)):
+                if plan:
+                    for group in groups:
+                        plan.skip("".join(run.text for run in group))
                 continue
+            if self.markup and len(groups) > 1:
+                segment = self._to_markup(groups)
+                if self.segmenter.fits(segment):
+                    runs.append((groups, ["", ""]))
+                    chunks.append(segment)
+                    continue
             
-            chunks = self._split_into_chunks(run.text)
-            translated = [self.translator.translate(chunk, lang_from, lang_to) for chunk in chunks]
-            run.text = "".join(translated)
+            group_runs, group_chunks = self._collect_groups(groups, plan, lang)
+            runs.extend(group_runs)
+            chunks.extend(group_chunks)
+        
+        return runs, chunks
 
-    def _split_into_chunks(self, text: str) -> list[str]:
-        """Splits text into chunks respecting word boundaries and size limit.
+    def _collect_groups(
+        self,
+        groups: list[list],
+        plan: SegmentPlan | None = None,
+        lang: str | None = None
+    ) -> tuple[list, list[str]]:
+        """Splits run groups into chunks, one translation unit per group.
+        
+        Groups that need no translation (see ``SegmentFilter``) are skipped.
         
         Args:
-            text (str): Input text to split
+            groups (list[list[Run]]): Run groups with text to translate
+            plan (SegmentPlan, optional): Plan counting the skipped groups
+            lang (str, optional): Source language code, for sentence splitting
             
         Returns:
-            list[str]: Text chunks under size limit
-        """
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for word in text.split():
-            word_length = len(word) + 1  # Include space
-            if current_length + word_length > self.chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = word_length
+            tuple[list[tuple[list[list[Run]], list[str]]], list[str]]: (run groups,
+                whitespace around the chunks) pairs and the flat list of chunks,
+                escaped in markup mode
+        """
+        runs = []
+        chunks: list[str] = []
+        
+        for group in groups:
+            text = "".join(run.text for run in group)
+            if not self.segment_filter.needs_translation(text):
+                if plan:
+                    plan.skip(text)
+                continue
+            group_chunks, layout = self._segment(self._escape(text), lang)
+            runs.append(([group], layout))
+            chunks.extend(group_chunks)
+        
+        return runs, chunks
+
+    def _segment(self, text: str, lang: str | None) -> tuple[list[str], list[str]]:
+        """Splits text into chunks to send and the whitespace that surrounds them.
+        
+        Chunks are sent without leading or trailing whitespace, so engines
+        cannot drop it and repeated sentences share one segment; the layout
+        puts it back around the translations.
+        
+        Args:
+            text (str): Text of a run group
+            lang (str, optional): Source language code
+            
+        Returns:
+            tuple[list[str], list[str]]: Stripped chunks and the whitespace before,
+                between and after them (one more item than chunks)
+        """
+        chunks: list[str] = []
+        layout = [""]
+        for piece in self.segmenter.split(text, lang):
+            chunk = piece.strip()
+            if not chunk:
+                layout[-1] += piece
+                continue
+            start = piece.index(chunk)
+            layout[-1] += piece[:start]
+            chunks.append(chunk)
+            layout.append(piece[start + len(chunk):])
+        return chunks, layout
+
+    def _apply_translations(self, runs: list, translated: list[str]) -> list[list]:
+        """Writes translated chunks back into their runs.
+        
+        The translation of a merged group goes into its first run and the
+        other runs of the group are removed. Tagged paragraphs are split back
+        into their groups, moving the runs if the translation reordered them.
+        
+        Args:
+            runs (list[tuple[list[list[Run]], list[str]]]): (run groups, whitespace layout)
+                pairs from ``_collect_runs``
+            translated (list[str]): Translated chunks in the same order
+            
+        Returns:
+            list[list[Run]]: Groups of tagged paragraphs whose tags could not be
+                matched; they are left untouched for a run-by-run retry
+        """
+        failed: list[list] = []
+        position = 0
+        for groups, layout in runs:
+            count = len(layout) - 1
+            text = layout[0] + "".join(
+                chunk + space for chunk, space in zip(translated[position:position + count], layout[1:])
+            )
+            position += count
+            
+            if len(groups) == 1:
+                self._write_group(groups[0], self._unescape(text))
+                continue
+            
+            spans = self._from_markup(text, len(groups))
+            if spans is None:
+                failed.extend(groups)
+                continue
+            for index, span in spans:
+                self._write_group(groups[index], self._unescape(span))
+            self._reorder_runs([group[0] for group in groups], [groups[index][0] for index, _ in spans])
+        
+        return failed
+
+    def _write_group(self, group: list, text: str) -> None:
+        """Puts ``text`` in the first run of a group and removes the others."""
+        first, *merged = group
+        first.text = text
+        for run in merged:
+            run._element.getparent().remove(run._element)
+
+    def _to_markup(self, groups: list[list]) -> str:
+        """Serializes run groups into one segment, tagging each group with its index.
+        
+        Args:
+            groups (list[list[Run]]): Run groups of a paragraph
+            
+        Returns:
+            str: Escaped text such as ``<g0>Hello </g0><g1>world</g1>``
+        """
+        opening, closing = self._MARKUP_TAGS[self.markup]
+        return "".join(
+            opening.format(index) + self._escape("".join(run.text for run in group)) + closing.format(index)
+            for index, group in enumerate(groups)
+        )
+
+    def _from_markup(self, text: str, count: int) -> list[tuple[int, str]] | None:
+        """Splits a translated tagged segment back into its groups.
+        
+        Text the engine moved outside the tags joins the preceding span (or the
+        first one, if it leads the segment).
+        
+        Args:
+            text (str): Translated segment
+            count (int): Number of groups that were tagged
+            
+        Returns:
+            (list[tuple[int, str]], optional): (group index, escaped text) pairs in
+                translated order, or None unless every tag came back exactly once
+        """
+        spans: list[list] = []
+        prefix = ""
+        position = 0
+        for match in self._MARKUP_SPANS[self.markup].finditer(text):
+            gap = text[position:match.start()]
+            if spans:
+                spans[-1][1] += gap
             else:
-                current_chunk.append(word)
-                current_length += word_length
+                prefix = gap
+            spans.append([int(match.group(1)), match.group(2)])
+            position = match.end()
+        
+        if not spans:
+            return None
+        spans[0][1] = prefix + spans[0][1]
+        spans[-1][1] += text[position:]
+        
+        if sorted(index for index, _ in spans) != list(range(count)):
+            return None
+        if any("<" in span for _, span in spans):
+            return None
+        return [(index, span) for index, span in spans]
+
+    def _reorder_runs(self, original: list, reordered: list) -> None:
+        """Moves runs into the translated order when they are adjacent siblings.
         
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        Args:
+            original (list[Run]): Runs in document order
+            reordered (list[Run]): Same runs in the order of the translation
+        """
+        elements = [run._element for run in original]
+        if elements == [run._element for run in reordered]:
+            return
+        if any(current.getnext() is not following for current, following in zip(elements, elements[1:])):
+            return
         
-        return chunks
+        parent = elements[0].getparent()
+        start = parent.index(elements[0])
+        for offset, run in enumerate(reordered):
+            parent.insert(start + offset, run._element)
+
+    def _escape(self, text: str) -> str:
+        """Escapes text for the markup mode in use; plain text is returned as is."""
+        if self.markup == 'xml':
+            return escape(text)
+        if self.markup == 'html':
+            return html.escape(text, quote=False)
+        return text
 
-    def _handle_page_breaks(self, paragraph, current_page: int) -> int:
-        """Tracks page numbers based on paragraph breaks.
+    def _unescape(self, text: str) -> str:
+        """Reverts ``_escape`` on a translation, including entities the engine added."""
+        if self.markup == 'xml':
+            return unescape(text, {'&quot;': '"', '&apos;': "'"})
+        if self.markup == 'html':
+            return html.unescape(text)
+        return text
+
+    def _coalesce_runs(self, paragraph) -> list[list]:
+        """Groups adjacent runs that only differ in proofing or revision metadata.
+        
+        Runs are merged when both contain nothing but text, have the same run
+        properties (ignoring ``w:noProof``/``w:lang`` and rsid attributes) and
+        are separated at most by spell-check markers.
         
         Args:
-            paragraph (Paragraph): Paragraph to check for page breaks
-            current_page (int): Current page number
+            paragraph (Paragraph): Paragraph whose runs are grouped
             
         Returns:
-            int: Updated page number
+            list[list[Run]]: Runs in document order, one list per merged group
         """
-        if self._has_page_break(paragraph):
-            return current_page + 1
-        return current_page
+        groups: list[list] = []
+        previous_key = None
+        
+        for run in StoryWalker.runs(paragraph):
+            key = self._format_key(run)
+            if groups and key is not None and key == previous_key and self._follows(groups[-1][-1], run):
+                groups[-1].append(run)
+            else:
+                groups.append([run])
+            previous_key = key
+        
+        return groups
 
-    def _has_page_break(self, paragraph) -> bool:
-        """Detects page breaks in paragraph using XML structure.
+    def _format_key(self, run) -> tuple | None:
+        """Returns a comparable description of a run's formatting.
         
         Args:
-            paragraph (Paragraph): Paragraph to check
+            run (Run): Run to describe
             
         Returns:
-            bool: True if contains page break
+            (tuple, optional): Serialized run properties, or None if the run holds
+                more than text (tabs, breaks, drawings, fields...) and must stay alone
         """
-        return any('w:lastRenderedPageBreak' in run._element.xml for run in paragraph.runs)
+        element = run._element
+        if any(child.tag not in self._PLAIN_RUN_CHILDREN for child in element):
+            return None
+        properties = element.rPr
+        if properties is None:
+            return ()
+        return tuple(
+            etree.tostring(child)
+            for child in properties
+            if child.tag not in self._PROOFING_PROPERTIES
+        )
+
+    def _follows(self, previous, run) -> bool:
+        """Checks that ``run`` comes right after ``previous``, ignoring spell-check markers."""
+        sibling = previous._element.getnext()
+        while sibling is not None and sibling.tag == self._PROOF_MARK:
+            sibling = sibling.getnext()
+        return sibling is run._element
 
-    def _load_checkpoint(self, checkpoint_path: str) -> tuple[int, int]:
-        """Loads translation progress from checkpoint file.
+    def _index_pages(self, doc) -> dict:
+        """Maps every body paragraph to its page in a single pass over the XML.
         
         Args:
-            checkpoint_path (str): Path to checkpoint file
+            doc (Document): python-docx Document object
             
         Returns:
-            tuple[int, int]: (start_index, current_page)
+            dict[CT_P, int]: Page number (from 1) by ``w:p`` element, see ``PageCounter``
         """
-        if os.path.exists(checkpoint_path):
-            try:
-                with open(checkpoint_path, "r") as f:
-                    return int(f.read().strip()), 1  # Page tracking resets
-            except (ValueError, IOError):
-                return 0, 1
-        return 0, 1
+        body = doc.element.body
+        return PageCounter.for_body(body).feed(body)
 
-    def _update_checkpoint(self, checkpoint_path: str, index: int) -> None:
-        """Updates checkpoint file with current progress index.
+    def _open_journal(self, output_path: str, lang_from: str, lang_to: str) -> CheckpointJournal:
+        """Opens the journal of an output, bound to the engine and language pair.
+        
+        A journal left by a run with another engine or language pair is
+        discarded, so its translations are not replayed into this one.
         
         Args:
-            checkpoint_path (str): Path to checkpoint file
-            index (int): Current paragraph index
+            output_path (str): Output file path
+            lang_from (str): Source language code
+            lang_to (str): Target language code
             
-        Raises:
-            DocumentWriteError: If checkpoint update fails
+        Returns:
+            CheckpointJournal: Journal at ``<output_path>.journal``
         """
-        try:
-            with open(checkpoint_path, "w") as f:
-                f.write(str(index))
-        except IOError as e:
-            raise DocumentWriteError(f"Checkpoint update failed: {e}")
+        engine = getattr(self.translator, "engine", None)
+        return CheckpointJournal(f"{output_path}.journal", context=f"{engine}:{lang_from}:{lang_to}")
+
+    def _journal_batch(self, journal: CheckpointJournal, batch: list[tuple[int, object]]) -> None:
+        """Records the translated XML of every paragraph in a batch.
+        
+        Args:
+            journal (CheckpointJournal): Journal announced with the source hashes
+            batch (list[tuple[int, Paragraph]]): Translated (index, paragraph) pairs
+        """
+        for idx, paragraph in batch:
+            journal.commit(idx, etree.tostring(paragraph._element, encoding="unicode"))
+
+    def _restore_paragraph(self, paragraph, translation: str) -> None:
+        """Replaces a paragraph's content with its journaled translation in place.
+        
+        Text boxes anchored in the paragraph keep their current content: their
+        paragraphs are journaled, and restored, on their own.
+        
+        Args:
+            paragraph (Paragraph): Untranslated paragraph of the fresh document
+            translation (str): Translated ``w:p`` XML from the journal
+        """
+        restored = parse_xml(translation)
+        element = paragraph._element
+        text_boxes = list(element.iter(StoryWalker.TEXT_BOX))
+        restored_boxes = list(restored.iter(StoryWalker.TEXT_BOX))
+        if len(text_boxes) == len(restored_boxes):
+            for current, journaled in zip(text_boxes, restored_boxes):
+                journaled.getparent().replace(journaled, current)
+        element.attrib.clear()
+        element.attrib.update(restored.attrib)
+        element[:] = list(restored)
 
-    def _save_progress(self, doc, output_path: str, checkpoint_path: str, index: int) -> None:
-        """Saves current progress and checkpoint during error handling.
+    def _save_progress(self, doc, output_path: str, journal: CheckpointJournal) -> None:
+        """Saves the partial document and syncs the journal during error handling.
         
         Args:
             doc (Document): Document object to save
             output_path (str): Output file path
-            checkpoint_path (str): Checkpoint file path
-            index (int): Current progress index
+            journal (CheckpointJournal): Journal to sync for a later resume
             
         Raises:
             DocumentWriteError: If save operation fails
         """
         try:
+            journal.flush()
             doc.save(output_path)
-            self._update_checkpoint(checkpoint_path, index)
         except Exception as e:
             raise DocumentWriteError(f"Error saving progress: {e}")
 
-    def _finalize_output(self, doc, output_path: str, checkpoint_path: str) -> None:
-        """Saves final document and cleans up checkpoint.
+    def _finalize_output(self, doc, output_path: str, journal: CheckpointJournal) -> None:
+        """Saves final document and removes the journal.
         
         Args:
             doc (Document): Document object to save
             output_path (str): Output file path
-            checkpoint_path (str): Checkpoint file path
+            journal (CheckpointJournal): Journal of the finished document
             
         Raises:
             DocumentWriteError: If final save fails
         """
         try:
             doc.save(output_path)
-            if os.path.exists(checkpoint_path):
-                os.remove(checkpoint_path)
+            journal.discard()
         except Exception as e:
             raise DocumentWriteError(f"Final save failed: {e}")
 
@@ -0,0 +1,469 @@
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Set
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.oxml.parser import element_class_lookup
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from app.exceptions.document import (
+    DocumentNotFound,
+    DocumentReadError,
+    DocumentWriteError,
+    ParagraphTranslationError,
+)
+from .checkpoint_journal import CheckpointJournal
+from .docx_processor import DocxProcessor
+from .page_counter import PageCounter
+from .segment_plan import SegmentPlan, SegmentStats
+from .story_walker import StoryWalker
+
+class StreamingDocxProcessor(DocxProcessor):
+    """Translates DOCX documents without loading them, in roughly constant memory.
+
+    The main document part is read from the zip with an lxml pull parser.
+    Each top-level body element (paragraph, table...) is translated once it
+    has been read. It is then written straight into the output zip and
+    dropped from the tree, so only a window of about ``batch_size`` paragraphs
+    (times ``2 * workers`` with a pool) is held in memory. Headers, footers,
+    notes and comments are small; they are loaded whole and translated after
+    the body. Every other part is copied unchanged.
+
+    Chunking, markup mode, page skipping and journal-based resume behave as in
+    ``DocxProcessor``, and both share the same paragraph numbering, so either
+    can resume the other's journal. Repeated segments are deduplicated as
+    they are read: a segment seen earlier in the document is filled in from
+    the plan's bounded memory of recent translations instead of being sent.
+    Batches are sent serially, or on a thread pool when ``workers`` is
+    greater than 1; ``concurrency`` is not used.
+    Progress is reported in bytes of the main document part read.
+
+    Example:
+        >>> processor = StreamingDocxProcessor(service, batch_size=50, workers=4)
+        >>> processor.process_document("report.docx", "informe.docx", "en", "es")
+    """
+
+    READ_SIZE = 64 * 1024
+    _MAIN_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+    _RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+    _NAMESPACE_DECLARATION = re.compile(rb' xmlns(?::([\w.-]+))?="([^"]*)"')
+    _DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+    @classmethod
+    def document_size(cls, path: str) -> int:
+        """Returns the uncompressed size of a DOCX file's main document part.
+
+        Args:
+            path (str): DOCX file path
+
+        Returns:
+            int: Size in bytes, or 0 if the file cannot be read as a DOCX
+        """
+        try:
+            with zipfile.ZipFile(path) as source:
+                return source.getinfo(cls._main_part(source)).file_size
+        except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError):
+            return 0
+
+    def process_document(
+        self,
+        input_path: str,
+        output_path: str,
+        lang_from: str,
+        lang_to: str,
+        progress_callback: Callable[[int, int], None] | None = None,
+        skip_pages: Set[int] = set()
+    ) -> SegmentStats:
+        """Streams a DOCX document through translation into ``output_path``.
+
+        The output is written to ``<output_path>.part`` and moved into place
+        once complete. After a failure only the journal is kept, and running
+        again resumes from it.
+
+        Args:
+            input_path (str): Path to source DOCX file
+            output_path (str): Path for translated DOCX file
+            lang_from (str): Source language code (ISO 639-1)
+            lang_to (str): Target language code (ISO 639-1)
+            progress_callback (Callable[[int, int], None], optional): Optional callback for
+                progress updates (bytes read, total bytes of the main document part)
+            skip_pages (set[int], optional): Set of page numbers to skip in translation
+
+        Returns:
+            SegmentStats: Segments planned and sent, including the dedup ratio
+
+        Raises:
+            DocumentNotFound: If input file doesn't exist
+            DocumentReadError: If the file is not a readable DOCX
+            DocumentWriteError: If the output can't be written or translation fails
+        """
+        journal = self._open_journal(output_path, lang_from, lang_to)
+        plan = SegmentPlan()
+        temp_path = f"{output_path}.part"
+
+        try:
+            with self._open_zip(input_path) as source:
+                try:
+                    main = source.getinfo(self._main_part(source))
+                except KeyError as e:
+                    raise DocumentReadError(f"Error loading document: {e}")
+                stories = self._story_parts(source, main.filename)
+                with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as target:
+                    for info in source.infolist():
+                        if info.filename == main.filename:
+                            index = self._stream_part(
+                                source, target, info, journal, plan, lang_from, lang_to, progress_callback, skip_pages
+                            )
+                        elif info.filename not in stories:
+                            self._copy_entry(source, target, info)
+                    for name in stories:
+                        index = self._translate_story(
+                            source, target, source.getinfo(name), journal, plan, index, lang_from, lang_to
+                        )
+            self._report_progress(progress_callback, main.file_size, main.file_size)
+            os.replace(temp_path, output_path)
+            journal.discard()
+            return plan.stats
+
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if isinstance(e, (DocumentNotFound, DocumentReadError, DocumentWriteError)):
+                raise
+            raise DocumentWriteError(f"Unexpected error: {e}")
+        finally:
+            journal.close()
+
+    def process_targets(
+        self,
+        input_path: str,
+        outputs: dict[str, str],
+        lang_from: str,
+        progress_callback: Callable[[int, int], None] | None = None,
+        skip_pages: Set[int] = set()
+    ) -> dict[str, SegmentStats]:
+        """Streams a document into several languages, the languages running concurrently.
+
+        Copies of a loaded document would defeat the constant memory this
+        processor exists for, so each language streams the source on its own
+        thread, as ``process_document`` does.
+
+        Args:
+            input_path (str): Path to source DOCX file
+            outputs (dict[str, str]): Output path for each target language code
+            lang_from (str): Source language code (ISO 639-1)
+            progress_callback (Callable[[int, int], None], optional): Optional callback for
+                progress updates (bytes read, total bytes), summed over all languages
+            skip_pages (set[int], optional): Set of page numbers to skip in translation
+
+        Returns:
+            dict[str, SegmentStats]: Segments planned and sent for each language
+
+        Raises:
+            DocumentWriteError: If any language fails; the others are still saved
+        """
+        progress = self._combine_progress(progress_callback, outputs, self.document_size(input_path))
+        with ThreadPoolExecutor(max_workers=len(outputs), thread_name_prefix="target") as pool:
+            futures = {
+                lang_to: pool.submit(
+                    self.process_document, input_path, output_path, lang_from, lang_to, progress[lang_to], skip_pages
+                )
+                for lang_to, output_path in outputs.items()
+            }
+        return self._gather_targets(futures)
+
+    def _stream_part(
+        self,
+        source: zipfile.ZipFile,
+        target: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        journal: CheckpointJournal,
+        plan: SegmentPlan,
+        lang_from: str,
+        lang_to: str,
+        progress_callback: Callable[[int, int], None] | None,
+        skip_pages: Set[int]
+    ) -> int:
+        """Translates the main document part while copying it to the output zip.
+
+        A first pass over the part (see ``PageCounter.scan``) collects what the
+        page count needs; the second pass parses, translates and writes.
+
+        Args:
+            source (zipfile.ZipFile): Input package
+            target (zipfile.ZipFile): Output package
+            info (zipfile.ZipInfo): Entry of the main document part
+            journal (CheckpointJournal): Journal of translated paragraphs
+            plan (SegmentPlan): Document-wide segment table
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            progress_callback (Callable[[int, int], None] | None): Progress reporting function
+            skip_pages (set[int]): Page numbers to leave untranslated
+
+        Returns:
+            int: Number of body paragraphs, where the other stories' numbering starts
+
+        Raises:
+            DocumentReadError: If the part is not well-formed XML
+            ParagraphTranslationError: If any batch fails to translate
+        """
+        with source.open(info) as stream:
+            try:
+                counter = PageCounter.scan(stream)
+            except etree.XMLSyntaxError as e:
+                raise DocumentReadError(f"Error loading document: {e}")
+
+        parser = etree.XMLPullParser(events=("start", "end"), huge_tree=True, remove_blank_text=True)
+        parser.set_element_class_lookup(element_class_lookup)
+        part_info = zipfile.ZipInfo(info.filename, info.date_time)
+        part_info.compress_type = zipfile.ZIP_DEFLATED
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="docx") if self.workers > 1 else None
+        in_flight: deque = deque()
+        elements: list = []  # Top-level elements read since the last dispatch
+        batch: list[tuple[int, Paragraph]] = []  # Paragraphs among them to translate
+        index = 0
+        read = 0
+        root = body = None
+
+        def dispatch() -> None:
+            nonlocal elements, batch
+            runs, chunks = self._collect_runs([paragraph for _, paragraph in batch], plan, lang_from)
+            unique = plan.add(chunks)
+            task = pool.submit(self._send, plan, unique, lang_from, lang_to) if pool else None
+            in_flight.append((elements, batch, runs, chunks, unique, task, read))
+            elements, batch = [], []
+            while len(in_flight) > (2 * self.workers if pool else 0):
+                commit_oldest()
+
+        def commit_oldest() -> None:
+            window, translating, runs, chunks, unique, task, offset = in_flight.popleft()
+            if chunks:
+                try:
+                    if task:
+                        task.result()
+                    else:
+                        self._send(plan, unique, lang_from, lang_to)
+                    self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+                except Exception as e:
+                    self._drain(
+                        {pending[5]: (0, pending[1], pending[2], pending[3], pending[4]) for pending in in_flight if pending[5]},
+                        plan, journal, lang_from, lang_to
+                    )
+                    first, last = translating[0][0], translating[-1][0]
+                    raise ParagraphTranslationError(f"Paragraph {first+1}-{last+1} error: {e}")
+            self._journal_batch(journal, translating)
+            for element in window:
+                output.write(self._serialize(element, root.nsmap))
+                element.getparent().remove(element)
+            self._report_progress(progress_callback, offset, info.file_size)
+
+        try:
+            with source.open(info) as stream, target.open(part_info, "w", force_zip64=True) as output:
+                while chunk := stream.read(self.READ_SIZE):
+                    read += len(chunk)
+                    parser.feed(chunk)
+                    for event, element in parser.read_events():
+                        if event == "start":
+                            if root is None:
+                                root = element
+                                output.write(self._DECLARATION + self._open_tag(root, {}))
+                            elif body is None and element.tag == qn('w:body'):
+                                body = element
+                                output.write(self._open_tag(body, root.nsmap))
+                            continue
+
+                        parent = element.getparent()
+                        if body is not None and parent is body:
+                            elements.append(element)
+                            pages = counter.feed(element)
+                            for paragraph in (Paragraph(p, None) for p in StoryWalker.walk(element)):
+                                page = pages.get(paragraph._element, counter.page)
+                                if page not in skip_pages and self._needs_translation(index, paragraph, journal):
+                                    batch.append((index, paragraph))
+                                index += 1
+                            if len(batch) >= self.batch_size or len(elements) >= self.batch_size:
+                                dispatch()
+                        elif element is body:
+                            dispatch()
+                            while in_flight:
+                                commit_oldest()
+                            output.write(self._close_tag(body))
+                        elif element is root:
+                            output.write(self._close_tag(root))
+                        elif parent is root:
+                            output.write(self._serialize(element, root.nsmap))
+                            root.remove(element)
+                parser.close()
+        except etree.XMLSyntaxError as e:
+            raise DocumentReadError(f"Error loading document: {e}")
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+
+        return index
+
+    def _translate_story(
+        self,
+        source: zipfile.ZipFile,
+        target: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        journal: CheckpointJournal,
+        plan: SegmentPlan,
+        index: int,
+        lang_from: str,
+        lang_to: str
+    ) -> int:
+        """Translates a header, footer, notes or comments part and writes it to the output zip.
+
+        Args:
+            source (zipfile.ZipFile): Input package
+            target (zipfile.ZipFile): Output package
+            info (zipfile.ZipInfo): Entry of the story part
+            journal (CheckpointJournal): Journal of translated paragraphs
+            plan (SegmentPlan): Document-wide segment table
+            index (int): Number of the story's first paragraph
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+
+        Returns:
+            int: Number of the paragraph following the story
+
+        Raises:
+            DocumentReadError: If the part is not well-formed XML
+            ParagraphTranslationError: If any batch fails to translate
+        """
+        try:
+            root = parse_xml(source.read(info))
+        except etree.XMLSyntaxError as e:
+            raise DocumentReadError(f"Error loading {info.filename}: {e}")
+
+        paragraphs = [Paragraph(p, None) for p in StoryWalker.walk(root)]
+        translating = [
+            (idx, paragraph)
+            for idx, paragraph in enumerate(paragraphs, index)
+            if self._needs_translation(idx, paragraph, journal)
+        ]
+        for start in range(0, len(translating), self.batch_size):
+            batch = translating[start:start + self.batch_size]
+            runs, chunks = self._collect_runs([paragraph for _, paragraph in batch], plan, lang_from)
+            try:
+                self._send(plan, plan.add(chunks), lang_from, lang_to)
+                self._apply_with_retry(runs, plan.resolve(chunks), lang_from, lang_to)
+            except Exception as e:
+                raise ParagraphTranslationError(f"Paragraph {batch[0][0]+1}-{batch[-1][0]+1} error: {e}")
+            self._journal_batch(journal, batch)
+
+        copy = zipfile.ZipInfo(info.filename, info.date_time)
+        copy.compress_type = zipfile.ZIP_DEFLATED
+        target.writestr(copy, self._DECLARATION + etree.tostring(root, encoding="UTF-8"))
+        return index + len(paragraphs)
+
+    def _serialize(self, element, inherited: dict) -> bytes:
+        """Serializes an element without repeating namespaces its ancestors declare.
+
+        Args:
+            element: Element to write
+            inherited (dict[str | None, str]): Namespaces in scope in the output
+
+        Returns:
+            bytes: UTF-8 XML of the element
+        """
+        data = etree.tostring(element, encoding="UTF-8", xml_declaration=False)
+        end = data.index(b">")
+        return self._strip_namespaces(data[:end], inherited) + data[end:]
+
+    def _open_tag(self, element, inherited: dict) -> bytes:
+        """Start tag of an element, with its attributes and new namespace declarations."""
+        shell = etree.Element(element.tag, dict(element.attrib), nsmap=element.nsmap)
+        data = etree.tostring(shell, encoding="UTF-8", xml_declaration=False)
+        return self._strip_namespaces(data[:-2], inherited) + b">"
+
+    def _close_tag(self, element) -> bytes:
+        """End tag of an element, using its namespace prefix."""
+        name = etree.QName(element).localname
+        return f"</{element.prefix}:{name}>".encode() if element.prefix else f"</{name}>".encode()
+
+    def _strip_namespaces(self, tag: bytes, inherited: dict) -> bytes:
+        """Removes namespace declarations already in scope from a start tag."""
+        def keep(match: re.Match) -> bytes:
+            prefix = match.group(1).decode() if match.group(1) else None
+            return b"" if inherited.get(prefix) == match.group(2).decode() else match.group(0)
+
+        return self._NAMESPACE_DECLARATION.sub(keep, tag)
+
+    def _copy_entry(self, source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        """Copies a package part unchanged, in chunks.
+
+        Args:
+            source (zipfile.ZipFile): Input package
+            target (zipfile.ZipFile): Output package
+            info (zipfile.ZipInfo): Entry to copy
+        """
+        copy = zipfile.ZipInfo(info.filename, info.date_time)
+        copy.compress_type = info.compress_type
+        copy.external_attr = info.external_attr
+        with source.open(info) as reader, target.open(copy, "w", force_zip64=info.file_size >= 2**31) as writer:
+            shutil.copyfileobj(reader, writer, self.READ_SIZE)
+
+    def _open_zip(self, path: str) -> zipfile.ZipFile:
+        """Opens a DOCX package.
+
+        Args:
+            path (str): DOCX file path
+
+        Returns:
+            zipfile.ZipFile: Open package
+
+        Raises:
+            DocumentNotFound: If file not found
+            DocumentReadError: If the file is not a zip package
+        """
+        try:
+            return zipfile.ZipFile(path)
+        except FileNotFoundError:
+            raise DocumentNotFound(f"File not found: {path}")
+        except (OSError, zipfile.BadZipFile) as e:
+            raise DocumentReadError(f"Error loading document: {e}")
+
+    def _story_parts(self, source: zipfile.ZipFile, part: str) -> list[str]:
+        """Lists the story parts of a package, as ``StoryWalker`` orders them.
+
+        Args:
+            source (zipfile.ZipFile): Input package
+            part (str): Zip entry name of the main document part
+
+        Returns:
+            list[str]: Zip entry names of the headers, footers, notes and comments present
+        """
+        relationships = posixpath.join(posixpath.dirname(part), "_rels", f"{posixpath.basename(part)}.rels")
+        try:
+            names = StoryWalker.story_names(source.read(relationships), part)
+        except KeyError:
+            return []
+        present = set(source.namelist())
+        return [name for name in names if name in present]
+
+    @classmethod
+    def _main_part(cls, source: zipfile.ZipFile) -> str:
+        """Finds the main document part through the package relationships.
+
+        Args:
+            source (zipfile.ZipFile): Input package
+
+        Returns:
+            str: Zip entry name, usually ``word/document.xml``
+        """
+        try:
+            relationships = etree.fromstring(source.read("_rels/.rels"))
+        except KeyError:
+            return "word/document.xml"
+        for relationship in relationships.iter(cls._RELATIONSHIP):
+            if relationship.get("Type") == cls._MAIN_DOCUMENT:
+                return relationship.get("Target", "").lstrip("/")
+        return "word/document.xml"
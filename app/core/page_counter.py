@@ -0,0 +1,142 @@
+from typing import IO
+from docx.oxml.ns import qn
+from lxml import etree
+
+class PageCounter:
+    """Assigns page numbers to paragraphs while walking WordprocessingML in document order.
+
+    Page breaks Word rendered when saving (``w:lastRenderedPageBreak``)
+    describe the real layout and are used alone when the document has any.
+    Otherwise explicit breaks are counted: ``w:br w:type="page"``,
+    ``w:pageBreakBefore`` and section breaks that start a new page. A
+    paragraph belongs to the page holding its first text.
+
+    Both facts needed up front (whether rendered breaks exist and how every
+    section starts) come from ``for_body`` or, without loading the document,
+    from ``scan``. After that, ``feed`` can be called on consecutive pieces of
+    the body, so a streamed document is counted piece by piece.
+
+    Attributes:
+        page (int): Current page number, from 1
+
+    Example:
+        >>> counter = PageCounter.for_body(doc.element.body)
+        >>> pages = counter.feed(doc.element.body)
+        >>> pages[doc.paragraphs[0]._element]
+        1
+    """
+
+    PARAGRAPH = qn('w:p')
+    TEXT = qn('w:t')
+    RENDERED_BREAK = qn('w:lastRenderedPageBreak')
+    BREAK = qn('w:br')
+    BREAK_BEFORE = qn('w:pageBreakBefore')
+    SECTION = qn('w:sectPr')
+
+    def __init__(self, rendered: bool, new_page: list[bool]) -> None:
+        """Initializes the counter at page 1.
+
+        Args:
+            rendered (bool): Whether the document has rendered page breaks
+            new_page (list[bool]): Whether each ``w:sectPr``, in document order,
+                starts its section on a new page
+        """
+        self.rendered = rendered
+        self.new_page = new_page
+        self.page = 1
+        self._section = 0
+        self._section_break = False
+        self._waiting = None  # Paragraph whose first text has not been reached yet
+
+    @classmethod
+    def for_body(cls, body) -> "PageCounter":
+        """Creates a counter for a fully loaded ``w:body`` element.
+
+        Args:
+            body (CT_Body): Document body
+
+        Returns:
+            PageCounter: Counter ready to ``feed`` the body
+        """
+        rendered = body.find(f'.//{cls.RENDERED_BREAK}') is not None
+        return cls(rendered, [cls.starts_new_page(section) for section in body.iter(cls.SECTION)])
+
+    @classmethod
+    def scan(cls, source: IO[bytes]) -> "PageCounter":
+        """Creates a counter from a ``document.xml`` stream in constant memory.
+
+        Args:
+            source (IO[bytes]): Readable stream of the main document part
+
+        Returns:
+            PageCounter: Counter ready to ``feed`` the body as it is streamed again
+        """
+        rendered = False
+        new_page = []
+        for _, element in etree.iterparse(source, events=('end',), huge_tree=True):
+            if element.tag == cls.RENDERED_BREAK:
+                rendered = True
+            elif element.tag == cls.SECTION:
+                new_page.append(cls.starts_new_page(element))
+            parent = element.getparent()
+            if parent is not None and parent.tag == qn('w:body'):
+                parent.remove(element)
+        return cls(rendered, new_page)
+
+    @staticmethod
+    def starts_new_page(section) -> bool:
+        """Checks whether a ``w:sectPr`` starts its section on a new page.
+
+        Args:
+            section (CT_SectPr): Section properties element
+
+        Returns:
+            bool: False for continuous and new-column sections
+        """
+        kind = section.find(qn('w:type'))
+        value = 'nextPage' if kind is None else kind.get(qn('w:val'), 'nextPage')
+        return value not in ('continuous', 'nextColumn')
+
+    def feed(self, element) -> dict:
+        """Walks an element and its descendants, advancing the page count.
+
+        Args:
+            element: Body, or the next top-level element of the body
+
+        Returns:
+            dict[CT_P, int]: Page number by ``w:p`` element found in ``element``
+        """
+        pages = {}
+        for node in element.iter(
+            self.PARAGRAPH, self.TEXT, self.RENDERED_BREAK, self.BREAK, self.BREAK_BEFORE, self.SECTION
+        ):
+            tag = node.tag
+            if tag == self.PARAGRAPH:
+                if self._section_break:
+                    self.page += 1
+                    self._section_break = False
+                pages[node] = self.page
+                self._waiting = node
+            elif tag == self.TEXT:
+                if self._waiting is not None and node.text:
+                    pages[self._waiting] = self.page
+                    self._waiting = None
+            elif tag == self.SECTION:
+                # A section break belongs to the section that follows it
+                self._section += 1
+                self._section_break = (
+                    not self.rendered
+                    and node.getparent().tag == qn('w:pPr')
+                    and self._section < len(self.new_page)
+                    and self.new_page[self._section]
+                )
+            elif self.rendered:
+                if tag == self.RENDERED_BREAK:
+                    self.page += 1
+            elif tag == self.BREAK:
+                if node.get(qn('w:type')) == 'page':
+                    self.page += 1
+            elif tag == self.BREAK_BEFORE:
+                if node.get(qn('w:val'), 'true') not in ('0', 'false', 'off'):
+                    self.page += 1
+        return pages
@@ -0,0 +1,101 @@
+import re
+
+class SegmentFilter:
+    """Recognizes segments that every engine would return unchanged.
+
+    A segment without letters (numbers, amounts, numeric dates, bullets,
+    dashes) is never translated. Otherwise the segment is split on
+    whitespace, and each token is stripped of surrounding punctuation. The
+    segment is left alone only if every token is one of:
+
+    - a number, amount, percentage, numeric date or time: ``1,234.50``,
+      ``-3%``, ``$12``, ``2024-01-15``, ``10:30``
+    - a unit or currency code, when the segment also holds a number:
+      ``12 kg``, ``EUR 100``, ``5mm``
+    - a URL, email address or file path
+    - a part number, meaning a token with digits whose letter runs are
+      uppercase or at most three letters long: ``AB-1234-X``, ``M8x20``, ``v1.2.3``
+    - a code identifier: ``max_value``, ``getValue``, ``os.path.join``, ``run()``
+
+    Words, ordinals (``1st``, ``2º``, ``1er``) and dates with month names
+    keep a segment translatable. When unsure, the filter lets the segment
+    through.
+
+    Example:
+        >>> segment_filter = SegmentFilter()
+        >>> segment_filter.needs_translation("EUR 1.250,00")
+        False
+        >>> segment_filter.needs_translation("See https://example.com")
+        True
+    """
+
+    UNITS = frozenset({
+        "mm", "cm", "m", "km", "in", "ft", "mi", "mg", "g", "kg", "t", "lb", "oz",
+        "ml", "cl", "l", "s", "ms", "min", "h", "hz", "khz", "mhz", "ghz", "v", "mv", "kv",
+        "a", "ma", "w", "kw", "kwh", "mw", "b", "kb", "mb", "gb", "tb", "px", "pt", "dpi",
+        "°c", "°f", "rpm", "psi", "bar", "pa", "kpa", "nm", "n", "km/h", "m/s", "m²", "m³",
+    })
+    CURRENCIES = frozenset({
+        "eur", "usd", "gbp", "jpy", "chf", "cad", "aud", "cny", "mxn", "brl", "ars", "clp", "cop", "pen",
+    })
+    _PUNCTUATION = " \t\n.,;:!?¡¿\"'“”‘’«»()[]{}<>…*•·–—"
+    _CLOSING = _PUNCTUATION.replace(")", "")  # Trailing punctuation after a call()
+    _NUMBER_WITH_UNIT = re.compile(r"[-+±~]?\d+(?:[.,]\d+)*(?P<unit>°?[^\W\d_]{1,3})")
+    _URL = re.compile(r"(?:[a-z][a-z0-9+.-]*://|www\.)\S+", re.IGNORECASE)
+    _EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+    _PATH = re.compile(r"(?:[A-Za-z]:\\|\\\\|~?/)[\w.\-]+(?:[\\/][\w.\-]+)*[\\/]?")
+    _PART_NUMBER = re.compile(r"[A-Za-z0-9][\w\-./#+]*")
+    _IDENTIFIER = re.compile(
+        r"_*[A-Za-z][A-Za-z0-9]*(?:_+[A-Za-z0-9]+)+"   # snake_case, CONSTANT_NAME
+        r"|[a-z]+[0-9]*(?:[A-Z][a-z0-9]*)+"            # camelCase
+        r"|[A-Za-z_]\w+(?:\.[A-Za-z_]\w+)+"            # dotted.name, file.ext
+        r"|[A-Za-z_][\w.]*\(\)"                        # call()
+    )
+    _LETTER_RUN = re.compile(r"[^\W\d_]+")
+
+    def needs_translation(self, text: str) -> bool:
+        """Checks whether a segment has anything an engine would translate.
+
+        Args:
+            text (str): Segment text
+
+        Returns:
+            bool: False if the segment would come back unchanged
+        """
+        if not any(character.isalpha() for character in text):
+            return False
+
+        numeric = False
+        measured = False
+        for token in text.split():
+            call = token.rstrip(self._CLOSING).endswith("()")
+            token = token.strip(self._PUNCTUATION) + ("()" if call else "")
+            if not token or not any(character.isalpha() for character in token):
+                numeric = numeric or any(character.isdigit() for character in token)
+                continue
+            if token.lower() in self.UNITS or token.lower() in self.CURRENCIES:
+                measured = True
+                continue
+            if self._is_code(token):
+                numeric = numeric or any(character.isdigit() for character in token)
+                continue
+            return True
+
+        # Units and currency codes on their own are words ("a", "in", "t")
+        return measured and not numeric
+
+    def _is_code(self, token: str) -> bool:
+        """Checks a token with letters against the number, address and code patterns."""
+        unit = self._NUMBER_WITH_UNIT.fullmatch(token)
+        if unit:
+            # Ordinals such as 1st, 2º or 1er are words, not measures
+            return unit.group("unit").lower() in self.UNITS
+        if self._URL.fullmatch(token) or self._EMAIL.fullmatch(token) or self._PATH.fullmatch(token):
+            return True
+        if self._IDENTIFIER.fullmatch(token):
+            return True
+        return (
+            any(character.isdigit() for character in token)
+            and self._PART_NUMBER.fullmatch(token) is not None
+            and all(run.isupper() or len(run) <= 3 for run in self._LETTER_RUN.findall(token))
+        )
@@ -0,0 +1,163 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+@dataclass
+class SegmentStats:
+    """Counters describing how much work deduplication saved in a document.
+
+    Attributes:
+        segments (int): Segments planned for translation, counting every repeat
+        unique (int): Segments actually sent to the engine
+        skipped (int): Segments left untouched because no engine would change them
+        skipped_chars (int): Characters in those skipped segments
+    """
+    segments: int = 0
+    unique: int = 0
+    skipped: int = 0
+    skipped_chars: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Segments filled in from another occurrence instead of being sent."""
+        return self.segments - self.unique
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Planned segments per segment sent (1.0 means no repeats)."""
+        return self.segments / self.unique if self.unique else 1.0
+
+class SegmentPlan:
+    """Document-wide table of segments, so each distinct segment is translated once.
+
+    Every batch registers its segments with ``add`` before dispatch. This
+    returns the batch's unique segments, meaning those no earlier batch has
+    claimed (repeats within the batch are dropped too). The batch sends only
+    those and publishes the results with ``settle``. ``resolve`` then fans the
+    translations back out to all of a batch's segments, waiting for the
+    batches that own the repeats if they are still running.
+
+    The table counts the pending uses of each segment. When a segment has no
+    uses left, its translation moves to a bounded LRU, so repeats registered
+    later (as when streaming) are still filled in without a request. When
+    the whole document is added up front, the counts are exact and nothing
+    outlives its last use. All methods are thread-safe.
+
+    Attributes:
+        capacity (int): Finished translations kept for later repeats
+        stats (SegmentStats): Planned and sent segment counters
+
+    Example:
+        >>> plan = SegmentPlan()
+        >>> plan.add(["Total", "Notes", "Total"])
+        ['Total', 'Notes']
+        >>> plan.add(["Total"])
+        []
+        >>> plan.settle(["Total", "Notes"], ["Total", "Notas"])
+        >>> plan.resolve(["Total", "Notes", "Total"])
+        ['Total', 'Notas', 'Total']
+        >>> plan.stats.dedup_ratio
+        2.0
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        """Creates an empty plan.
+
+        Args:
+            capacity (int, optional): Finished translations kept for segments that
+                show up again later. Defaults to 10,000.
+        """
+        self.capacity = capacity
+        self.stats = SegmentStats()
+        self._pending: dict[str, list] = {}  # Segment -> [Future, uses left]
+        self._finished: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, segments: list[str]) -> list[str]:
+        """Registers a batch's segments and claims the ones no one has claimed yet.
+
+        Args:
+            segments (list[str]): Segments of the batch, in order
+
+        Returns:
+            list[str]: Segments the batch must send, without repeats, in order
+        """
+        unique = []
+        with self._lock:
+            for segment in segments:
+                self.stats.segments += 1
+                entry = self._pending.get(segment)
+                if entry is None:
+                    future = Future()
+                    if segment in self._finished:
+                        future.set_result(self._finished.pop(segment))
+                    else:
+                        unique.append(segment)
+                        self.stats.unique += 1
+                    entry = self._pending[segment] = [future, 0]
+                entry[1] += 1
+        return unique
+
+    def skip(self, segment: str) -> None:
+        """Counts a segment left untranslated without a request.
+
+        Args:
+            segment (str): Text of the skipped segment
+        """
+        with self._lock:
+            self.stats.skipped += 1
+            self.stats.skipped_chars += len(segment)
+
+    def settle(self, segments: list[str], translations: list[str]) -> None:
+        """Publishes the translations of segments claimed with ``add``.
+
+        Args:
+            segments (list[str]): Unique segments a batch sent
+            translations (list[str]): Their translations, in the same order
+        """
+        with self._lock:
+            futures = [self._pending[segment][0] for segment in segments]
+        for future, translation in zip(futures, translations):
+            future.set_result(translation)
+
+    def fail(self, segments: list[str], error: Exception) -> None:
+        """Marks claimed segments as failed, so batches repeating them fail too.
+
+        Args:
+            segments (list[str]): Unique segments a batch could not translate
+            error (Exception): Failure raised again by ``resolve``
+        """
+        with self._lock:
+            futures = [self._pending[segment][0] for segment in segments]
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def resolve(self, segments: list[str]) -> list[str]:
+        """Returns the translation of every segment of a batch, waiting for their owners.
+
+        Args:
+            segments (list[str]): Segments of the batch, as passed to ``add``
+
+        Returns:
+            list[str]: Translations in the same order
+
+        Raises:
+            Exception: The error of the batch that owned a failed segment
+        """
+        with self._lock:
+            futures = [self._pending[segment][0] for segment in segments]
+        translations = [future.result() for future in futures]
+
+        with self._lock:
+            for segment, translation in zip(segments, translations):
+                entry = self._pending[segment]
+                entry[1] -= 1
+                if entry[1]:
+                    continue
+                del self._pending[segment]
+                self._finished[segment] = translation
+                if len(self._finished) > self.capacity:
+                    self._finished.popitem(last=False)
+        return translations
@@ -0,0 +1,171 @@
+import re
+from typing import Iterator
+from urllib.parse import quote_plus
+
+class Segmenter:
+    """Splits text into the fullest chunks an engine accepts, at sentence boundaries.
+
+    Chunks are packed with whole sentences while they fit. A sentence that
+    does not fit on its own is split between words, and a word that does not
+    fit is split between characters. Joining the chunks gives back the
+    original text exactly, whitespace included.
+
+    A chunk fits when its text without surrounding whitespace (the part sent
+    to the engine) has at most ``max_chars`` characters and, if
+    ``max_bytes`` is set, at most ``max_bytes`` bytes once URL-encoded as
+    UTF-8. The byte limit is for engines that read the text from the query
+    string, where an accented letter takes 6 bytes and a Japanese character 9.
+
+    A period, question or exclamation mark (or an ellipsis) ends a sentence
+    when whitespace and a character other than a lowercase letter follow.
+    A period does not end one after an abbreviation of the source language
+    (see ``ABBREVIATIONS``), after a single-letter initial, or after a German
+    ordinal (``3. Oktober``). Japanese sentences end at 。！？ even without
+    whitespace.
+
+    Attributes:
+        max_chars (int): Characters per chunk
+        max_bytes (int | None): URL-encoded bytes per chunk, or None for no byte limit
+
+    Example:
+        >>> segmenter = Segmenter(max_chars=30)
+        >>> segmenter.split("Dr. Smith is here. He left at 5 p.m. today.", "en")
+        ['Dr. Smith is here. ', 'He left at 5 p.m. today.']
+    """
+
+    ABBREVIATIONS: dict[str, frozenset[str]] = {
+        "es": frozenset({
+            "sr", "sra", "srta", "sres", "dr", "dra", "lic", "ing", "arq", "prof", "ud", "uds",
+            "etc", "p.ej", "ej", "pág", "págs", "núm", "nº", "aprox", "av", "avda", "dpto",
+            "cía", "vol", "cap", "fig", "tel", "ee.uu", "a.c", "d.c", "a.m", "p.m",
+        }),
+        "en": frozenset({
+            "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e",
+            "inc", "ltd", "co", "corp", "no", "fig", "approx", "dept", "est", "vol",
+            "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+            "u.s", "a.m", "p.m",
+        }),
+        "it": frozenset({
+            "sig", "sigg", "sig.ra", "dott", "dott.ssa", "prof", "ing", "avv", "arch", "geom",
+            "ecc", "es", "pag", "pagg", "n", "tel", "p.es", "cap", "fig", "vol",
+        }),
+        "fr": frozenset({
+            "m", "mm", "mme", "mlle", "dr", "pr", "me", "etc", "p.ex", "cf", "av", "bd",
+            "st", "ste", "fig", "vol", "chap", "tél", "env", "n°",
+        }),
+        "de": frozenset({
+            "z.b", "bzw", "usw", "ca", "vgl", "d.h", "u.a", "dr", "prof", "hr", "fr", "nr",
+            "str", "s", "abs", "inkl", "evtl", "ggf", "bspw", "geb", "tel", "jh", "mio", "mrd",
+        }),
+        "pt": frozenset({
+            "sr", "sra", "srta", "dr", "dra", "prof", "eng", "av", "etc", "p.ex", "pág",
+            "nº", "ex", "fig", "vol", "cap", "tel", "ltda", "cia",
+        }),
+        "ja": frozenset(),
+    }
+    # Terminator, closing quotes or brackets, whitespace and the next character (group 4)
+    _LATIN_END = re.compile(r"([.!?…]+)([\"'”’»)\]]*)(\s+)(?=(\S))")
+    _CJK_END = re.compile(r"[。！？]+[」』）\"”]*\s*")
+    _OPENING = "([\"'“‘«¿¡"
+    # Whitespace, a word with the commas after it, or stray commas
+    _WORDS = re.compile(r"\s+|[^\s、，]+[、，]*\s*|[、，]+\s*")
+
+    def __init__(self, max_chars: int, max_bytes: int | None = None) -> None:
+        """Sets the limits chunks must respect.
+
+        Args:
+            max_chars (int): Characters per chunk
+            max_bytes (int, optional): URL-encoded bytes per chunk. Defaults to None.
+        """
+        self.max_chars = max_chars
+        self.max_bytes = max_bytes
+
+    def fits(self, text: str) -> bool:
+        """Checks a chunk against the character and byte limits.
+
+        Args:
+            text (str): Text as it will be sent
+
+        Returns:
+            bool: True if the engine accepts it
+        """
+        if len(text) > self.max_chars:
+            return False
+        return self.max_bytes is None or len(quote_plus(text)) <= self.max_bytes
+
+    def split(self, text: str, lang: str | None = None) -> list[str]:
+        """Packs whole sentences into chunks within the limits.
+
+        Args:
+            text (str): Text to split
+            lang (str, optional): Source language code, selecting the abbreviations
+                that do not end a sentence. Defaults to None (no abbreviations).
+
+        Returns:
+            list[str]: Chunks whose concatenation is ``text``
+        """
+        chunks = []
+        current = ""
+        for piece in self._pieces(text, lang):
+            if current.strip() and not self.fits((current + piece).strip()):
+                chunks.append(current)
+                current = ""
+            current += piece
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def sentences(self, text: str, lang: str | None = None) -> list[str]:
+        """Splits text into sentences, each keeping the whitespace that follows it.
+
+        Args:
+            text (str): Text to split
+            lang (str, optional): Source language code. Defaults to None.
+
+        Returns:
+            list[str]: Sentences whose concatenation is ``text``
+        """
+        ends = {match.end() for match in self._LATIN_END.finditer(text) if self._ends_sentence(text, match, lang)}
+        ends.update(match.end() for match in self._CJK_END.finditer(text))
+        sentences = []
+        start = 0
+        for end in sorted(ends):
+            if start < end < len(text):
+                sentences.append(text[start:end])
+                start = end
+        if start < len(text):
+            sentences.append(text[start:])
+        return sentences
+
+    def _ends_sentence(self, text: str, match: re.Match, lang: str | None) -> bool:
+        """Decides whether a terminator followed by whitespace closes a sentence."""
+        if match.group(4).islower():
+            return False
+        if match.group(1) != ".":
+            return True
+        # Abbreviations are short, so a window before the terminator is enough
+        word = text[max(0, match.start() - 16):match.start()].split()[-1:]
+        word = word[0].lstrip(self._OPENING) if word else ""
+        if len(word) == 1 and word.isalpha():
+            return False
+        if lang == "de" and word.isdigit():
+            return False
+        return word.lower() not in self.ABBREVIATIONS.get(lang, frozenset())
+
+    def _pieces(self, text: str, lang: str | None) -> Iterator[str]:
+        """Yields sentences, or words and characters of those too long to fit."""
+        for sentence in self.sentences(text, lang):
+            if self.fits(sentence.strip()):
+                yield sentence
+                continue
+            for word in self._WORDS.findall(sentence):
+                if self.fits(word.strip()):
+                    yield word
+                    continue
+                piece = ""
+                for character in word:
+                    if piece and not self.fits(piece + character):
+                        yield piece
+                        piece = ""
+                    piece += character
+                yield piece
@@ -0,0 +1,172 @@
+import posixpath
+from typing import Iterator
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.part import PartFactory, XmlPart
+from docx.oxml.ns import nsmap, qn
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
+
+# python-docx keeps notes as raw bytes; load them as XML like headers so edits are saved
+for _content_type in (CT.WML_FOOTNOTES, CT.WML_ENDNOTES):
+    PartFactory.part_type_for.setdefault(_content_type, XmlPart)
+
+class StoryWalker:
+    """Finds every text-bearing paragraph of a document, once and in document order.
+
+    A story is a part with its own flow of text: the main body, headers,
+    footers, footnotes, endnotes and comments. Each story is walked in a
+    single lxml pass, so paragraphs inside nested tables, content controls
+    (``w:sdt``) and text boxes are found where they sit in the text. A merged
+    cell is a single ``w:tc`` element and is visited once. Text boxes saved
+    with a VML fallback (``mc:Fallback``) hold two copies of their paragraphs;
+    both are returned so every reader shows the translation.
+
+    Body paragraphs come first, followed by the other stories in part name
+    order. ``DocxProcessor`` and ``StreamingDocxProcessor`` both number
+    paragraphs this way.
+
+    Attributes:
+        doc (Document): Document being walked
+
+    Example:
+        >>> walker = StoryWalker(Document("manual.docx"))
+        >>> [paragraph.text for paragraph in walker.paragraphs()]
+        ['Title', 'Cell text', 'Header text', 'A footnote']
+    """
+
+    STORIES = (RT.HEADER, RT.FOOTER, RT.FOOTNOTES, RT.ENDNOTES, RT.COMMENTS)
+    PARAGRAPH = qn('w:p')
+    TEXT_BOX = qn('w:txbxContent')
+    # Runs of a paragraph, including those wrapped by hyperlinks, inline content
+    # controls, smart tags, simple fields and tracked insertions
+    RUN_PATHS = (
+        'w:r',
+        'w:hyperlink/w:r',
+        'w:sdt/w:sdtContent/w:r',
+        'w:smartTag/w:r',
+        'w:fldSimple/w:r',
+        'w:ins/w:r',
+    )
+    _RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+    _RUNS = etree.XPath(" | ".join(f"./{path}" for path in RUN_PATHS), namespaces=nsmap)
+    _TEXTS = etree.XPath(" | ".join(f"./{path}/w:t" for path in RUN_PATHS), namespaces=nsmap)
+
+    def __init__(self, doc) -> None:
+        """Prepares a walk over a loaded document.
+
+        Args:
+            doc (Document): python-docx Document object
+        """
+        self.doc = doc
+
+    def paragraphs(self) -> list[Paragraph]:
+        """Returns the paragraphs of the body followed by those of the other stories.
+
+        Returns:
+            list[Paragraph]: Text-bearing paragraphs, in document order
+        """
+        return self.body_paragraphs() + self.story_paragraphs()
+
+    def body_paragraphs(self) -> list[Paragraph]:
+        """Returns the text-bearing paragraphs of the main body.
+
+        Returns:
+            list[Paragraph]: Body paragraphs, in document order
+        """
+        return [Paragraph(element, self.doc._body) for element in self.walk(self.doc.element.body)]
+
+    def story_paragraphs(self) -> list[Paragraph]:
+        """Returns the text-bearing paragraphs of headers, footers, notes and comments.
+
+        Returns:
+            list[Paragraph]: Paragraphs of each story part, parts in name order
+        """
+        return [Paragraph(element, None) for root in self.story_roots() for element in self.walk(root)]
+
+    def roots(self) -> list:
+        """Returns the body followed by the root element of every other story.
+
+        Two copies of a document give the same list, element for element.
+
+        Returns:
+            list: Body element, then story part roots in part name order
+        """
+        return [self.doc.element.body] + self.story_roots()
+
+    def story_roots(self) -> list:
+        """Returns the root elements of headers, footers, notes and comments.
+
+        Returns:
+            list: Story part roots, in part name order
+        """
+        parts = {
+            str(rel.target_part.partname).lstrip("/"): rel.target_part
+            for rel in self.doc.part.rels.values()
+            if rel.reltype in self.STORIES and not rel.is_external
+        }
+        return [parts[name].element for name in sorted(parts) if isinstance(parts[name], XmlPart)]
+
+    @classmethod
+    def walk(cls, element) -> Iterator:
+        """Yields the text-bearing paragraphs in and below an element in one pass.
+
+        Args:
+            element: Story root, body, or any element inside a story
+
+        Yields:
+            CT_P: Paragraph elements with text, in document order
+        """
+        for paragraph in element.iter(cls.PARAGRAPH):
+            if cls.has_text(paragraph):
+                yield paragraph
+
+    @classmethod
+    def has_text(cls, paragraph) -> bool:
+        """Checks whether a paragraph's own runs hold non-blank text.
+
+        Text in text boxes anchored in the paragraph belongs to their own
+        paragraphs and is not counted.
+
+        Args:
+            paragraph (CT_P): Paragraph element
+
+        Returns:
+            bool: True if any run of the paragraph has non-whitespace text
+        """
+        return any(text.text and not text.text.isspace() for text in cls._TEXTS(paragraph))
+
+    @classmethod
+    def runs(cls, paragraph: Paragraph) -> list[Run]:
+        """Returns a paragraph's runs, including those nested in hyperlinks and fields.
+
+        Args:
+            paragraph (Paragraph): Paragraph to read
+
+        Returns:
+            list[Run]: Runs in document order
+        """
+        return [Run(element, paragraph) for element in cls._RUNS(paragraph._p)]
+
+    @classmethod
+    def story_names(cls, relationships: bytes, part: str) -> list[str]:
+        """Finds the story parts related to the main document part of a package.
+
+        Args:
+            relationships (bytes): XML of the main part's relationships
+                (``word/_rels/document.xml.rels``)
+            part (str): Zip entry name of the main part
+
+        Returns:
+            list[str]: Zip entry names of the story parts, sorted
+        """
+        names = set()
+        for relationship in etree.fromstring(relationships).iter(cls._RELATIONSHIP):
+            if relationship.get("Type") not in cls.STORIES or relationship.get("TargetMode") == "External":
+                continue
+            target = relationship.get("Target", "")
+            if target.startswith("/"):
+                names.add(target.lstrip("/"))
+            else:
+                names.add(posixpath.normpath(posixpath.join(posixpath.dirname(part), target)))
+        return sorted(names)
@@ -1,7 +1,12 @@
+import os
 from typing import Callable
 from app.services.translation_api import TranslationService
+from app.services.translation_cache import TranslationCache
+from app.services.translation_memory import TranslationMemory
 from .constants import Engine
 from .docx_processor import DocxProcessor
+from .docx_stream import StreamingDocxProcessor
+from .segment_plan import SegmentStats
 
 class TranslationManager:
     """Orchestrates text and document translation operations.
@@ -12,6 +17,12 @@ class TranslationManager:
     Attributes:
         service (TranslationService): Configured translation service instance
         chunk_size (int): Optimal text chunk size for the selected engine
+        chunk_bytes (int | None): URL-encoded byte limit per chunk, if the engine has one
+        batch_size (int): Paragraphs grouped per batch request for the selected engine
+        concurrency (int): Document requests kept in flight for the selected engine
+        workers (int): Threads translating document batches in parallel
+        markup (str | None): Inline markup the engine preserves; documents are then
+            translated a paragraph per segment with tags marking the runs
 
     Example:
         >>> manager = TranslationManager(Engine.DEEPL)
@@ -19,19 +30,55 @@ class TranslationManager:
         >>> manager.translate_document("doc.docx", "translated.docx", "en", "es")
     """
 
-    def __init__(self, engine: Engine = Engine.MY_MEMORY):
+    # Main document parts from this size on are streamed instead of loaded
+    STREAMING_THRESHOLD = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        engine: Engine = Engine.MY_MEMORY,
+        cache: TranslationCache | None = None,
+        hedge_with: Engine | None = None,
+        service: TranslationService | None = None,
+        memory: TranslationMemory | None = None
+    ):
         """Initializes translation manager with specified engine.
         
         Args:
             engine (Engine): Translation service to use. Defaults to MyMemory.
+            cache (TranslationCache, optional): Translation cache. Defaults to the
+                process-wide ``TranslationCache.shared()`` instance, so the text and
+                document tabs reuse each other's translations.
+            hedge_with (Engine, optional): Secondary engine used to hedge slow
+                requests and to fail over when the primary keeps erroring.
+            service (TranslationService, optional): Preconfigured service to use
+                instead of building one, e.g. pointed at ``StubTranslationServer``.
+                ``engine``, ``cache``, ``hedge_with`` and ``memory`` are ignored when given.
+            memory (TranslationMemory, optional): Local translation memory placed in
+                front of the engine; only its misses are sent to the engine.
         
         Note:
-            Automatically sets optimal chunk sizes:
-            - 200 chars for MyMemory (API limits)
-            - 5000 chars for other services
+            Chunk size, paragraphs per batch and requests in flight all come
+            from the engine's ``EngineProfile`` (e.g. 500 chars and 500
+            URL-encoded bytes per chunk for MyMemory, 50 segments per request
+            for DeepL), as does the inline markup used to keep run formatting
+            within a paragraph segment.
+            The document worker pool defaults to the profile's concurrency and
+            can be tuned per engine with the ``<engine>_workers`` setting or a
+            ``TRADUCTOR_<ENGINE>_WORKERS`` environment variable.
         """
-        self.service = TranslationService(engine)
-        self.chunk_size = 200 if engine == Engine.MY_MEMORY else 5000
+        self.service = service or TranslationService(
+            engine,
+            cache=cache or TranslationCache.shared(),
+            hedge_with=hedge_with,
+            memory=memory
+        )
+        profile = self.service.profile
+        self.chunk_size = profile.max_chars
+        self.chunk_bytes = profile.max_bytes
+        self.batch_size = profile.max_segments
+        self.concurrency = profile.concurrency
+        self.markup = profile.markup
+        self.workers = self.service.backend.workers
         
     def translate_text(self, text: str, lang_from: str, lang_to: str) -> str:
         """Translates a text string using the configured service.
@@ -49,6 +96,23 @@ class TranslationManager:
             TranslationFailed: Invalid translation response
         """
         return self.service.translate(text, lang_from, lang_to)
+
+    def translate_batch(self, texts: list[str], lang_from: str, lang_to: str) -> list[str]:
+        """Translates several text segments with as few requests as possible.
+        
+        Args:
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+
+        Returns:
+            list[str]: Translations in the same order as ``texts``
+
+        Raises:
+            TranslationServiceUnavailable: Service connection issues
+            TranslationFailed: Invalid translation response
+        """
+        return self.service.translate_batch(texts, lang_from, lang_to)
         
     def translate_document(
         self, 
@@ -57,18 +121,29 @@ class TranslationManager:
         lang_from: str, 
         lang_to: str, 
         progress_callback: Callable[[int, int], None] | None = None,
-        skip_pages: set[int] = set()
-    ) -> None:
+        skip_pages: set[int] = set(),
+        streaming: bool | None = None
+    ) -> SegmentStats:
         """Processes and translates a DOCX document.
         
+        Large documents are streamed (see ``StreamingDocxProcessor``) so memory
+        stays flat regardless of their size.
+        
         Args:
             input_path (str): Source document path
             output_path (str): Destination document path
             lang_from (str): Source language code
             lang_to (str): Target language code
             progress_callback (Callable[[int, int], None], optional): Optional progress reporting function
-                Parameters: (processed_paragraphs, total_paragraphs)
+                Parameters: (unique segments translated, total unique segments)
             skip_pages (set[int], optional): Set of pages to ignore in translation
+            streaming (bool, optional): Force (True) or disable (False) streaming. Defaults
+                to streaming when the main document part reaches ``STREAMING_THRESHOLD`` bytes,
+                in which case progress is reported in bytes read instead of segments.
+
+        Returns:
+            SegmentStats: Job summary with the segments planned, the segments sent
+                and the resulting dedup ratio
 
         Raises:
             DocumentNotFound: Missing input file
@@ -76,5 +151,90 @@ class TranslationManager:
             DocumentWriteError: Output file creation failure
             ParagraphTranslationError: Translation error in content
         """
-        processor = DocxProcessor(self.service, chunk_size=self.chunk_size)
-        processor.process_document(input_path, output_path, lang_from, lang_to, progress_callback, skip_pages)
\ No newline at end of file
+        processor = self._processor(input_path, streaming)
+        return processor.process_document(input_path, output_path, lang_from, lang_to, progress_callback, skip_pages)
+
+    def translate_document_targets(
+        self,
+        input_path: str,
+        output_path: str,
+        lang_from: str,
+        langs_to: list[str],
+        progress_callback: Callable[[int, int], None] | None = None,
+        skip_pages: set[int] = set(),
+        streaming: bool | None = None
+    ) -> dict[str, SegmentStats]:
+        """Translates a DOCX document into several languages in one pass.
+        
+        The source is read and segmented once and every language is
+        translated concurrently, so the whole job takes about as long as the
+        slowest language. Each language is written next to ``output_path``
+        with its code appended (see ``target_paths``).
+        
+        Args:
+            input_path (str): Source document path
+            output_path (str): Destination path the per-language paths derive from
+            lang_from (str): Source language code
+            langs_to (list[str]): Target language codes
+            progress_callback (Callable[[int, int], None], optional): Optional progress reporting function
+                Parameters: (unique segments translated, total unique segments) over all languages
+            skip_pages (set[int], optional): Set of pages to ignore in translation
+            streaming (bool, optional): Force (True) or disable (False) streaming, as in
+                ``translate_document``
+
+        Returns:
+            dict[str, SegmentStats]: Job summary of each target language
+
+        Raises:
+            ValueError: If no target language is given
+            DocumentNotFound: Missing input file
+            DocumentReadError: Document parsing failure
+            DocumentWriteError: Output file creation failure or a language that failed
+        """
+        outputs = self.target_paths(output_path, langs_to)
+        if not outputs:
+            raise ValueError("At least one target language is required")
+        
+        processor = self._processor(input_path, streaming)
+        return processor.process_targets(input_path, outputs, lang_from, progress_callback, skip_pages)
+
+    @staticmethod
+    def target_paths(output_path: str, langs_to: list[str]) -> dict[str, str]:
+        """Derives one output path per target language.
+        
+        Args:
+            output_path (str): Destination path chosen by the user
+            langs_to (list[str]): Target language codes; repeats are ignored
+            
+        Returns:
+            dict[str, str]: Output path of each language
+        
+        Example:
+            >>> TranslationManager.target_paths("out/manual.docx", ["fr", "ja"])
+            {'fr': 'out/manual_fr.docx', 'ja': 'out/manual_ja.docx'}
+        """
+        root, extension = os.path.splitext(output_path)
+        return {lang_to: f"{root}_{lang_to}{extension}" for lang_to in dict.fromkeys(langs_to)}
+
+    def _processor(self, input_path: str, streaming: bool | None) -> DocxProcessor:
+        """Creates the document processor for a file, streaming large ones.
+        
+        Args:
+            input_path (str): Source document path
+            streaming (bool | None): Forced choice, or None to decide by size
+            
+        Returns:
+            DocxProcessor: Processor configured for the current engine
+        """
+        if streaming is None:
+            streaming = StreamingDocxProcessor.document_size(input_path) >= self.STREAMING_THRESHOLD
+        
+        return (StreamingDocxProcessor if streaming else DocxProcessor)(
+            self.service,
+            chunk_size=self.chunk_size,
+            chunk_bytes=self.chunk_bytes,
+            batch_size=self.batch_size,
+            concurrency=self.concurrency,
+            markup=self.markup,
+            workers=self.workers
+        )
\ No newline at end of file
@@ -54,4 +54,50 @@ class TranslationFailed(TranslationError):
         Often indicates permanent issues requiring code/data changes
     """
     def __init__(self, message: str = "Translation process failed"):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class TranslationRateLimited(TranslationServiceUnavailable):
+    """Exception raised when a translation engine throttles the client.
+    
+    Common scenarios:
+    - HTTP 429 Too Many Requests
+    - HTTP 503 with a ``Retry-After`` header
+    - Quota headers reporting no remaining requests
+    
+    Attributes:
+        message (str): Human-readable description of the throttling
+        retry_after (float | None): Seconds the engine asked to wait, if known
+    
+    Example:
+        >>> raise TranslationRateLimited("DeepL 429", retry_after=2.0)
+        TranslationRateLimited: DeepL 429
+    
+    Note:
+        Retried automatically by TranslationService before reaching callers
+    """
+    def __init__(self, message: str = "Translation rate limit exceeded", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class TranslationCircuitOpen(TranslationServiceUnavailable):
+    """Exception raised without contacting an engine whose circuit breaker is open.
+    
+    Common scenarios:
+    - The engine timed out or refused several consecutive requests
+    - Background health probes have not yet seen it recover
+    
+    Attributes:
+        message (str): Human-readable description naming the engine
+        engine (str | None): Identifier of the unavailable engine
+    
+    Example:
+        >>> raise TranslationCircuitOpen("DeepL no responde", engine="deepl")
+        TranslationCircuitOpen: DeepL no responde
+    
+    Note:
+        Raised immediately, so callers can switch engines instead of waiting
+        out request timeouts
+    """
+    def __init__(self, message: str = "Translation engine temporarily unavailable", engine: str | None = None):
+        super().__init__(message)
+        self.engine = engine
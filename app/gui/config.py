@@ -13,7 +13,7 @@ from PyQt6.QtCore import Qt
 from .widgets.switch import Switch
 from .widgets.choose_engine import ChooseEngine
 from app.core.config import Config
-from app.core.constants import Engine
+from app.services.engines.registry import registered_engines
 from app.validators.validators import is_not_empty
 from app.utils.style_loader import load_stylesheet
 
@@ -67,13 +67,13 @@ class ConfigView(QWidget):
         api_layout = QVBoxLayout()
 
         # Create input fields for each engine requiring API keys
-        for engine in Engine:
-            if engine == Engine.MY_MEMORY:
-                continue  # Skip MyMemory which doesn't require API key
+        for engine in registered_engines():
+            if not engine.profile.requires_api_key:
+                continue  # Skip engines like MyMemory which don't require API key
             field = QLineEdit()
-            self.api_fields[engine.name] = field
+            self.api_fields[engine.id] = field
             self._create_api_field(api_layout, 
-                                 f"{engine.name.replace('_', ' ').title()} API:", 
+                                 f"{engine.label()} API:", 
                                  field)
 
         api_group.setLayout(api_layout)
@@ -98,12 +98,29 @@ class ConfigView(QWidget):
 
     def load_info(self) -> None:
         """Loads persisted configuration values into UI components."""
+        self._migrate_legacy_keys()
         for engine, line_edit in self.api_fields.items():
             key = f"{engine}_api"
             value = Config.get(key) or ""
             if is_not_empty(value):
                 line_edit.setText(value)
 
+    def _migrate_legacy_keys(self) -> None:
+        """Moves API keys saved under the former ``<ENGINE>_api`` names to ``<engine>_api``.
+
+        Earlier versions named the fields after the ``Engine`` member
+        (``DEEPL_api``), which case-sensitive stores keep apart from the
+        ``deepl_api`` key the services read. A key already set under the new
+        name wins, and case-insensitive stores find it under both names, so
+        nothing is moved twice.
+        """
+        for engine in self.api_fields:
+            key, legacy = f"{engine}_api", f"{engine.upper()}_api"
+            value = Config.get(legacy)
+            if key != legacy and value and not Config.get(key):
+                Config.set(key, value)
+                Config.delete(legacy)
+
     def _create_api_field(self, 
                          layout: QVBoxLayout, 
                          label_text: str, 
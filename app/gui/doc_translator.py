@@ -15,6 +15,8 @@ from app.exceptions.authorization import Unauthorized
 from .document_worker import DocumentWorker
 from .widgets.choose_engine import ChooseEngine
 from .widgets.skip_pages import SkipPages
+from .widgets.target_languages import TargetLanguages
+from app.core.segment_plan import SegmentStats
 from app.core.translator import TranslationManager
 from app.core.constants import LANGUAGES
 from app.utils.error_handler import handle_error
@@ -25,7 +27,7 @@ class DocTranslatorTab(QWidget):
     
     Provides a GUI for:
     - Selecting translation engine
-    - Choosing source/target languages
+    - Choosing source/target languages, optionally several targets in one pass
     - File selection and translation execution
     - Progress monitoring
     
@@ -44,6 +46,7 @@ class DocTranslatorTab(QWidget):
         self.engine = self.choose_engine.engine
         self.tm = TranslationManager(self.engine)
         self.skip_pages = SkipPages()
+        self.extra_targets = TargetLanguages(LANGUAGES)
         self.current_file = None
         self.languages = LANGUAGES
         self.init_ui()
@@ -100,6 +103,7 @@ class DocTranslatorTab(QWidget):
         button_layout.addWidget(self.translate_btn)
         
         layout.addLayout(lang_layout)
+        layout.addWidget(self.extra_targets)
         layout.addLayout(button_layout)
         layout.addWidget(self.file_label)
         layout.addWidget(self.skip_pages)
@@ -132,6 +136,7 @@ class DocTranslatorTab(QWidget):
         
         Raises:
             Unauthorized: If selected engine lacks required API configuration
+            TranslationCircuitOpen: If the selected engine is currently unreachable
             Exception: Propagates any errors during setup
         """
         try:
@@ -139,6 +144,7 @@ class DocTranslatorTab(QWidget):
                 return
             if not self.choose_engine.engine_available:
                 raise Unauthorized()
+            self.tm.service.breaker.check()  # Fail fast if the engine is known to be down
                 
             save_path, _ = QFileDialog.getSaveFileName(
                 self,
@@ -159,6 +165,9 @@ class DocTranslatorTab(QWidget):
             # Configure translation parameters
             lang_from = self.languages[self.combo_from.currentText()]
             lang_to = self.languages[self.combo_to.currentText()]
+            extra = [code for code in self.extra_targets.languages if code != lang_to]
+            if extra:
+                lang_to = [lang_to] + extra
             skip_pages = self.skip_pages.skip_pages
 
             # Start background worker
@@ -192,20 +201,28 @@ class DocTranslatorTab(QWidget):
         """
         self.progress_bar.setValue(value)
 
-    def on_translation_finished(self, output_path: str) -> None:
+    def on_translation_finished(self, output_path: str, summaries: dict[str, SegmentStats]) -> None:
         """Handles successful translation completion.
         
         Args:
-            output_path (str): Path to generated translated document
+            output_path (str): Path to generated translated document, one per line
+                when translating into several languages
+            summaries (dict[str, SegmentStats]): Segments planned and sent, by target language
         """
         self.worker_thread.quit()
         self.worker_thread.wait()
         self.progress_bar.setVisible(False)
         self.setEnabled(True)
+        lines = [
+            f"{lang}: {summary.segments} segments ({summary.unique} translated, "
+            f"{summary.saved} repeats reused, dedup ratio {summary.dedup_ratio:.2f}x), "
+            f"{summary.skipped} left as is ({summary.skipped_chars} characters)"
+            for lang, summary in summaries.items()
+        ]
         QMessageBox.information(
             self,
             "Translation Complete",
-            f"Document saved at:\n{output_path}"
+            f"Document saved at:\n{output_path}\n\n" + "\n".join(lines)
         )
     def show_error(self, error: Exception) -> None:
         """Handles translation errors from worker thread.
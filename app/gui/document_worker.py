@@ -8,14 +8,17 @@ class DocumentWorker(QObject):
     
     Signals:
         progress_updated (pyqtSignal): Emits translation progress percentage (0-100)
-        finished (pyqtSignal): Emits output path when translation completes successfully
+        finished (pyqtSignal): Emits the output path and a ``SegmentStats`` summary per
+            target language (``dict[str, SegmentStats]``) when translation completes
+            successfully; with several target languages, the output paths one per line
         error_occurred (pyqtSignal): Emits any exceptions during processing
     
     Args:
         input_path (str): Source document file path
         output_path (str): Target document save path
         lang_from (str): Source language code (ISO 639-1)
-        lang_to (str): Target language code (ISO 639-1)
+        lang_to (str | list[str]): Target language code (ISO 639-1), or several codes to
+            translate the document into all of them in one pass
         translation_manager (TranslationManager): Configured TranslationManager instance
         skip_pages (set[int]): Set of pages to ignore in translation
     
@@ -31,7 +34,7 @@ class DocumentWorker(QObject):
     """
     
     progress_updated = pyqtSignal(int)
-    finished = pyqtSignal(str)
+    finished = pyqtSignal(str, object)
     error_occurred = pyqtSignal(Exception)
 
     def __init__(
@@ -39,7 +42,7 @@ class DocumentWorker(QObject):
         input_path: str,
         output_path: str,
         lang_from: str,
-        lang_to: str,
+        lang_to: str | list[str],
         translation_manager: TranslationManager,
         skip_pages: set[int]
     ):
@@ -67,15 +70,29 @@ class DocumentWorker(QObject):
         Note:
             Runs in a background thread - no direct UI operations
         """
+        progress = lambda p, t: self.progress_updated.emit(int((p/t)*100) if t else 100)
         try:
-            self.tm.translate_document(
+            if isinstance(self.lang_to, str):
+                summary = self.tm.translate_document(
+                    input_path=self.input_path,
+                    output_path=self.output_path,
+                    lang_from=self.lang_from,
+                    lang_to=self.lang_to,
+                    progress_callback=progress,
+                    skip_pages=self.skip_pages
+                )
+                self.finished.emit(self.output_path, {self.lang_to: summary})
+                return
+            
+            summaries = self.tm.translate_document_targets(
                 input_path=self.input_path,
                 output_path=self.output_path,
                 lang_from=self.lang_from,
-                lang_to=self.lang_to,
-                progress_callback=lambda p, t: self.progress_updated.emit(int((p/t)*100)),
+                langs_to=self.lang_to,
+                progress_callback=progress,
                 skip_pages=self.skip_pages
             )
-            self.finished.emit(self.output_path)
+            paths = self.tm.target_paths(self.output_path, list(summaries))
+            self.finished.emit("\n".join(paths.values()), summaries)
         except Exception as e:
             self.error_occurred.emit(e)
\ No newline at end of file
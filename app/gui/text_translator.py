@@ -89,7 +89,7 @@ class TextTranslatorTab(QWidget):
     def translate_text(self) -> None:
         """Executes text translation while preserving formatting.
         
-        Processes input text line-by-line, maintaining:
+        Sends all lines in a single batch and rebuilds them line-by-line, maintaining:
         - Leading/trailing whitespace
         - Empty lines
         - Line break positions
@@ -112,20 +112,20 @@ class TextTranslatorTab(QWidget):
 
             # Preserve line structure and whitespace
             lines = original_text.splitlines(keepends=True)
+            segments = [line.strip() for line in lines]
+            translations = self.tm.translate_batch(
+                texts=segments,
+                lang_from=lang_from,
+                lang_to=lang_to
+            )
             translated_lines = []
 
-            for line in lines:
+            for line, segment, translated in zip(lines, segments, translations):
                 # Capture leading/trailing whitespace
                 leading_spaces = re.match(r'^\s*', line).group()
                 trailing_spaces = re.search(r'\s*$', line).group()
                 
-                stripped_line = line.strip()
-                if stripped_line:
-                    translated = self.tm.translate_text(
-                        text=stripped_line,
-                        lang_from=lang_from,
-                        lang_to=lang_to
-                    )
+                if segment:
                     translated_line = f"{leading_spaces}{translated}{trailing_spaces}"
                 else:
                     translated_line = line  # Preserve empty lines
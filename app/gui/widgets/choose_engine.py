@@ -2,6 +2,7 @@ from typing import Literal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QGroupBox, QHBoxLayout, QSizePolicy
 from app.core.constants import Engine
 from app.core.config import Config
+from app.services.engines.registry import get_profile, registered_engines
 
 class ChooseEngine(QWidget):
     """UI component for selecting translation engines with configuration support.
@@ -40,9 +41,8 @@ class ChooseEngine(QWidget):
         self.combo_engine = QComboBox()
         
         # Populate with formatted engine names
-        for engine in Engine:
-            engine_name = engine.name.replace('_', ' ').title()
-            self.combo_engine.addItem(engine_name)
+        for engine in registered_engines():
+            self.combo_engine.addItem(engine.label())
         
         # Set initial value from config
         combo_value = Config.get(f'engine_{self.section}') or 'My Memory'
@@ -70,9 +70,8 @@ class ChooseEngine(QWidget):
             section_layout = QHBoxLayout()
             combo = QComboBox()
             
-            for engine in Engine:
-                engine_name = engine.name.replace('_', ' ').title()
-                combo.addItem(engine_name)
+            for engine in registered_engines():
+                combo.addItem(engine.label())
 
             # Initialize from config
             saved_engine = Config.get(f"engine_{section}")
@@ -110,18 +109,22 @@ class ChooseEngine(QWidget):
             Engine: Engine enum value for the selected translation service
             
         Note:
-            Falls back to My Memory if no selection exists
+            Falls back to My Memory if no selection exists or the saved
+            engine is no longer registered
         """
-        engine = Config.get(f'engine_{self.section}') or 'My Memory'
-        return Engine[engine.replace(' ', '_').upper()]
+        label = Config.get(f'engine_{self.section}') or 'My Memory'
+        for engine in registered_engines():
+            if engine.label() == label:
+                return engine.id
+        return Engine.MY_MEMORY
     
     @property
     def engine_available(self) -> bool:
         """Verifies engine availability through API configuration.
         
         Returns:
-            bool: True if engine is My Memory or has valid API config.
+            bool: True if engine needs no API key or has valid API config.
             False for configured engines missing API credentials
         """
         api = Config.get(f'{self.engine}_api')
-        return api is not None or self.engine == Engine.MY_MEMORY
\ No newline at end of file
+        return api is not None or not get_profile(self.engine).requires_api_key
\ No newline at end of file
@@ -0,0 +1,45 @@
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QCheckBox, QSizePolicy
+
+class TargetLanguages(QWidget):
+    """Row of checkboxes adding target languages to a document translation.
+
+    The document is read once and translated into the main target language
+    and every checked one at the same time, one output file per language.
+
+    Attributes:
+        checks (dict[str, QCheckBox]): Checkbox of each language code
+
+    Example:
+        >>> targets = TargetLanguages(LANGUAGES)
+        >>> targets.checks["fr"].setChecked(True)
+        >>> targets.languages
+        ['fr']
+    """
+
+    def __init__(self, languages: dict[str, str]):
+        """Initializes one checkbox per language.
+
+        Args:
+            languages (dict[str, str]): Display name to language code mapping
+        """
+        super().__init__()
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.checks: dict[str, QCheckBox] = {}
+        self._init_ui(languages)
+
+    def _init_ui(self, languages: dict[str, str]):
+        """Initial configuration of the interface"""
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(QLabel("Also translate into:"))
+
+        for name, code in languages.items():
+            check = QCheckBox(name)
+            self.checks[code] = check
+            layout.addWidget(check)
+        layout.addStretch()
+
+    @property
+    def languages(self) -> list[str]:
+        """Codes of the checked languages, in display order"""
+        return [code for code, check in self.checks.items() if check.isChecked()]
@@ -0,0 +1,172 @@
+import asyncio
+from concurrent.futures import Future
+from app.core.constants import Engine
+from app.exceptions.translation import TranslationError
+from .engines.registry import get_profile
+from .translation_api import TranslationService
+
+class AsyncTranslationService:
+    """asyncio front-end for ``TranslationService`` with bounded concurrency.
+
+    Blocking HTTP calls run in worker threads through ``asyncio.to_thread`` and
+    reuse the wrapped service's keep-alive pool. A semaphore caps how many
+    requests are in flight against the engine at once.
+
+    Any other object implementing ``translate_batch(texts, lang_from, lang_to)``
+    can be wrapped too; each call then runs whole in a worker thread, without
+    the per-batch splitting, caching and deduplication of ``TranslationService``.
+
+    Attributes:
+        service (TranslationService): Synchronous service performing the requests
+        concurrency (int): Maximum simultaneous requests against the engine
+
+    Example:
+        >>> service = AsyncTranslationService(Engine.DEEPL, concurrency=8)
+        >>> await service.translate_batch(["Hello", "World"], "en", "es")
+        ['Hola', 'Mundo']
+    """
+
+    def __init__(
+        self,
+        engine: Engine = Engine.MY_MEMORY,
+        concurrency: int | None = None,
+        service: TranslationService | None = None
+    ) -> None:
+        """Initializes the async service.
+
+        Args:
+            engine (Engine, optional): Translation engine to use. Ignored when
+                ``service`` is given. Defaults to Engine.MY_MEMORY.
+            concurrency (int, optional): In-flight request limit. Defaults to the
+                engine profile's recommended concurrency.
+            service (TranslationService, optional): Existing service to wrap, so its
+                connection pool is shared with synchronous callers, or any
+                translator implementing ``translate_batch``.
+        """
+        if service is None:
+            limit = concurrency or get_profile(engine).concurrency
+            service = TranslationService(engine, pool_maxsize=max(10, limit))
+        self.service = service
+        profile = getattr(service, "profile", None)
+        self.concurrency = max(1, concurrency or (profile.concurrency if profile else 1))
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    @property
+    def engine(self) -> Engine | None:
+        """Engine used by the wrapped service, None if it does not expose one."""
+        return getattr(self.service, "engine", None)
+
+    async def translate(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Translates a single segment.
+
+        Args:
+            text (str): Text to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+
+        Raises:
+            TimeoutError: If the request exceeds the timeout.
+            TranslationServiceUnavailable: If an error occurred in the request.
+            TranslationFailed: If there was an error processing the response.
+
+        Returns:
+            str: Translated text
+        """
+        if not isinstance(self.service, TranslationService):
+            return (await self.translate_batch([text], lang_from, lang_to))[0]
+        async with self._semaphore:
+            return await asyncio.to_thread(self.service.translate, text, lang_from, lang_to)
+
+    async def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates several segments keeping up to ``concurrency`` requests in flight.
+
+        Batching engines send each packed batch concurrently; the rest send one
+        request per segment concurrently. Blank and cached segments are returned
+        without a request, and segments already in flight elsewhere are awaited
+        instead of sent again. Oversize plain-text segments are split and joined
+        back as in ``TranslationService.translate_batch``.
+
+        Args:
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments, see
+                ``TranslationService.translate_batch``. Defaults to None.
+
+        Raises:
+            TimeoutError: If a request exceeds the timeout.
+            TranslationServiceUnavailable: If an error occurred in a request.
+            TranslationFailed: If there was an error processing a response.
+            TranslationError: If the engine does not support ``markup``.
+
+        Returns:
+            list[str]: Translations in the same order as ``texts``
+        """
+        service = self.service
+        if not isinstance(service, TranslationService):
+            async with self._semaphore:
+                if markup is None:
+                    return await asyncio.to_thread(service.translate_batch, texts, lang_from, lang_to)
+                return await asyncio.to_thread(service.translate_batch, texts, lang_from, lang_to, markup=markup)
+        if markup is not None and markup != service.profile.markup:
+            raise TranslationError(f"El motor no admite etiquetas {markup}.")
+
+        split = service._split_oversize(texts, lang_from, markup)
+        if split:
+            pieces, layouts = split
+            return service._join_split(await self.translate_batch(pieces, lang_from, lang_to), layouts)
+
+        results, pending = service._from_cache(texts, lang_from, lang_to, markup)
+        leading, following = service._claim(texts, pending, lang_from, lang_to, markup)
+
+        if service.profile.batches:
+            batches = list(service._pack_batches(texts, list(leading)))
+        else:
+            batches = [[i] for i in leading]
+
+        try:
+            await asyncio.gather(
+                *(self._send(batch, texts, results, leading, lang_from, lang_to, markup) for batch in batches)
+            )
+        except BaseException as e:
+            service._abandon(texts, leading, e, lang_from, lang_to, markup)
+            raise
+
+        for i, future in following.items():
+            results[i] = await asyncio.wrap_future(future)
+        return results
+
+    async def _send(
+        self, batch: list[int], texts: list[str], results: list[str],
+        leading: dict[int, Future], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> None:
+        """Sends one request for the given segment indices and settles them.
+
+        Args:
+            batch (list[int]): Indices of the segments in ``texts``
+            texts (list[str]): All segments
+            results (list[str]): Translations aligned with ``texts``, filled in place
+            leading (dict[int, Future]): Futures claimed by this call
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+        """
+        segments = [texts[i] for i in batch]
+        async with self._semaphore:
+            if self.service.profile.batches:
+                translated = await asyncio.to_thread(
+                    self.service._send_batch, segments, lang_from, lang_to, markup
+                )
+            else:
+                translated = [await asyncio.to_thread(self.service._translate_one, segments[0], lang_from, lang_to)]
+        for i, text in zip(batch, translated):
+            results[i] = text
+        self.service._settle(texts, results, batch, leading, lang_from, lang_to, markup)
+
+    def close(self) -> None:
+        """Releases the wrapped service's pooled connections, if it has any."""
+        close = getattr(self.service, "close", None)
+        if close:
+            close()
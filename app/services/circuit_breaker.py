@@ -0,0 +1,230 @@
+import threading
+import time
+import weakref
+from enum import StrEnum
+from typing import Callable
+from app.exceptions.translation import TranslationCircuitOpen
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker.
+
+    Members:
+        CLOSED: Requests flow normally
+        OPEN: Requests fail fast while the engine is probed
+        HALF_OPEN: A single trial request (or probe) is checking recovery
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker guarding one translation engine.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    ``check`` raises ``TranslationCircuitOpen`` immediately instead of letting
+    callers wait out timeouts. While open, a background thread calls the
+    registered probe every ``probe_interval`` seconds (doubling up to
+    ``max_probe_interval``) and closes the circuit on the first success.
+    Without a probe, the first call after ``probe_interval`` is let through as
+    a trial instead.
+
+    A shared breaker serves every service of its engine, so each one
+    registers its probe and the oldest one still registered is used. Probes
+    that are bound methods are held weakly, and ``clear_probe`` removes a
+    closed service's probe, so probing never goes through a dead session.
+
+    Attributes:
+        name (str): Engine identifier used in messages
+        failure_threshold (int): Consecutive failures that open the circuit
+        probe_interval (float): Seconds before the first probe
+        max_probe_interval (float): Upper bound of the probe backoff
+
+    Example:
+        >>> breaker = CircuitBreaker("deepl", failure_threshold=3)
+        >>> breaker.subscribe(lambda state: print("deepl is", state))
+        >>> breaker.check()  # Raises TranslationCircuitOpen while open
+        >>> breaker.record_failure()
+    """
+
+    _registry: dict[str, "CircuitBreaker"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_threshold: int = 3,
+        probe_interval: float = 5.0,
+        max_probe_interval: float = 60.0
+    ) -> None:
+        """Initializes a closed breaker.
+
+        Args:
+            name (str, optional): Engine identifier. Defaults to "".
+            failure_threshold (int, optional): Failures before opening. Defaults to 3.
+            probe_interval (float, optional): First probe delay. Defaults to 5.0.
+            max_probe_interval (float, optional): Maximum probe delay. Defaults to 60.0.
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes: list[Callable[[], Callable[[], object] | None]] = []  # References, oldest first
+        self._prober: threading.Thread | None = None
+        self._listeners: list[Callable[[CircuitState], None]] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str) -> "CircuitBreaker":
+        """Returns the process-wide breaker of an engine, creating it on first use.
+
+        Every service of an engine shares its breaker, so a failure seen by the
+        document worker also protects the text tab.
+
+        Args:
+            key (str): Engine identifier
+
+        Returns:
+            CircuitBreaker: Shared breaker for ``key``
+        """
+        with cls._registry_lock:
+            breaker = cls._registry.get(key)
+            if breaker is None:
+                breaker = cls._registry[key] = cls(str(key))
+            return breaker
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while regular requests are being rejected."""
+        return self._state != CircuitState.CLOSED
+
+    def set_probe(self, probe: Callable[[], object]) -> None:
+        """Registers a health check run while the circuit is open.
+
+        Earlier probes still registered take precedence; this one is used once
+        they are cleared or their owners are garbage collected.
+
+        Args:
+            probe (Callable[[], object]): Cheap request that returns if the engine
+                is reachable and raises otherwise
+        """
+        reference = weakref.WeakMethod(probe) if hasattr(probe, "__self__") else (lambda: probe)
+        with self._lock:
+            self._probes.append(reference)
+
+    def clear_probe(self, probe: Callable[[], object]) -> None:
+        """Unregisters a health check, e.g. when its service is closed.
+
+        Args:
+            probe (Callable[[], object]): Probe passed to ``set_probe``
+        """
+        with self._lock:
+            self._probes = [reference for reference in self._probes if reference() not in (None, probe)]
+
+    def subscribe(self, listener: Callable[[CircuitState], None]) -> None:
+        """Registers a callback for state changes.
+
+        Callbacks run on the thread that caused the change (often a worker or
+        probe thread), so GUI code should forward them through a signal.
+
+        Args:
+            listener (Callable[[CircuitState], None]): Receives the new state
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def check(self) -> None:
+        """Fails fast if requests should not reach the engine.
+
+        Raises:
+            TranslationCircuitOpen: While the circuit is open or a trial is running.
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+            trial = (
+                self._state == CircuitState.OPEN
+                and self._current_probe() is None
+                and time.monotonic() - self._opened_at >= self.probe_interval
+            )
+            if trial:
+                self._state = CircuitState.HALF_OPEN
+        if trial:
+            self._notify(CircuitState.HALF_OPEN)
+            return
+        raise TranslationCircuitOpen(f"El motor {self.name} no responde; intenta con otro motor.", self.name)
+
+    def record_success(self) -> None:
+        """Resets the failure count and closes the circuit if it was open."""
+        with self._lock:
+            self._failures = 0
+            changed = self._state != CircuitState.CLOSED
+            self._state = CircuitState.CLOSED
+        if changed:
+            self._notify(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Counts a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            opening = (
+                self._state == CircuitState.HALF_OPEN
+                or (self._state == CircuitState.CLOSED and self._failures >= self.failure_threshold)
+            )
+            if not opening:
+                return
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            if self._current_probe() and (self._prober is None or not self._prober.is_alive()):
+                self._prober = threading.Thread(target=self._run_probes, daemon=True, name=f"probe-{self.name}")
+                self._prober.start()
+        self._notify(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Closes the circuit immediately, e.g. after the user changes settings."""
+        self.record_success()
+
+    def _run_probes(self) -> None:
+        """Probes the engine with backoff until it answers or the circuit closes."""
+        delay = self.probe_interval
+        while True:
+            time.sleep(delay)
+            with self._lock:
+                if self._state == CircuitState.CLOSED:
+                    return
+                probe = self._current_probe()
+                if probe is None:
+                    return  # Every probe was cleared; calls are let through as trials
+            try:
+                probe()
+            except Exception:
+                delay = min(delay * 2, self.max_probe_interval)
+                continue
+            self.record_success()
+            return
+
+    def _current_probe(self) -> Callable[[], object] | None:
+        """Returns the oldest live probe, dropping dead ones.
+
+        Must be called with the lock held.
+        """
+        while self._probes:
+            probe = self._probes[0]()
+            if probe is not None:
+                return probe
+            self._probes.pop(0)
+        return None
+
+    def _notify(self, state: CircuitState) -> None:
+        """Calls every listener with the new state."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(state)
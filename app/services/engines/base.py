@@ -0,0 +1,190 @@
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+import requests
+from app.core.config import Config
+
+if TYPE_CHECKING:
+    from app.services.translation_api import TranslationService
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Capabilities and limits declared by a translation engine.
+
+    The chunker, batcher and scheduler read these values to fill every request
+    as full as the engine allows without exceeding its limits.
+
+    Attributes:
+        max_chars (int): Characters per segment
+        max_bytes (int | None): URL-encoded UTF-8 bytes per segment, for engines
+            reading the text from the query string; None if only ``max_chars`` applies
+        max_segments (int): Segments per request; 1 means no native batching
+        max_batch_chars (int): Characters per request across all segments
+        concurrency (int): Recommended requests in flight
+        rate (float): Sustained requests per second
+        burst (int): Requests allowed back to back
+        markup (Literal['xml', 'html'] | None): Inline tag format the engine
+            preserves, or None if tags are not supported
+        requires_api_key (bool): Whether an API key/URL must be configured
+        offline (bool): Whether the engine answers locally without network
+            requests; its results are not written to the translation cache
+    """
+    max_chars: int = 5000
+    max_bytes: int | None = None
+    max_segments: int = 1
+    max_batch_chars: int = 5000
+    concurrency: int = 4
+    rate: float = 2.0
+    burst: int = 4
+    markup: Literal["xml", "html"] | None = None
+    requires_api_key: bool = True
+    offline: bool = False
+
+    @property
+    def batches(self) -> bool:
+        """True if the engine accepts several segments per request."""
+        return self.max_segments > 1
+
+class TranslationEngine:
+    """Base class for translation engine adapters.
+
+    Subclasses declare an ``id`` matching an ``Engine`` value, a ``profile`` and
+    usually a ``default_url``, implement ``translate_batch`` (and optionally
+    ``translate``) and are registered with ``@register_engine``. Requests go
+    through the owning ``TranslationService`` so pooling, rate limiting and
+    latency tracking apply to every engine.
+
+    Attributes:
+        id (str): Engine identifier, also used for configuration keys
+        default_url (str | None): Public endpoint of the engine
+        profile (EngineProfile): Engine capabilities
+        service (TranslationService): Service performing the requests
+
+    Example:
+        >>> @register_engine
+        ... class EchoEngine(TranslationEngine):
+        ...     id = "echo"
+        ...     profile = EngineProfile(requires_api_key=False)
+        ...     def translate_batch(self, texts, lang_from, lang_to, markup=None):
+        ...         return list(texts)
+    """
+
+    id: str = ""
+    default_url: str | None = None
+    profile: EngineProfile = EngineProfile()
+
+    def __init__(self, service: "TranslationService") -> None:
+        """Binds the engine to the service that sends its requests.
+
+        Args:
+            service (TranslationService): Owning service
+        """
+        self.service = service
+
+    @classmethod
+    def label(cls) -> str:
+        """Human-readable engine name (e.g. ``'My Memory'``)."""
+        return cls.id.replace('_', ' ').title()
+
+    @property
+    def url(self) -> str | None:
+        """Endpoint of the engine.
+
+        Precedence: the service's ``base_urls``, a ``TRADUCTOR_<ID>_URL``
+        environment variable, ``default_url``, then the configured API URL.
+
+        Returns:
+            (str, optional): Endpoint URL, or None if not configured
+        """
+        return (
+            self.service.base_urls.get(self.id)
+            or os.environ.get(f"TRADUCTOR_{self.id.upper()}_URL")
+            or self.default_url
+            or Config.get_api_url(self.id)
+        )
+
+    @property
+    def workers(self) -> int:
+        """Threads translating a document in parallel with this engine.
+
+        Precedence: a ``TRADUCTOR_<ID>_WORKERS`` environment variable, the
+        ``<id>_workers`` setting, then the profile's ``concurrency``. Values
+        that are not positive integers are ignored.
+
+        Returns:
+            int: Worker pool size, at least 1
+        """
+        for value in (os.environ.get(f"TRADUCTOR_{self.id.upper()}_WORKERS"), Config.get(f"{self.id}_workers")):
+            try:
+                workers = int(value)
+            except (TypeError, ValueError):
+                continue
+            if workers > 0:
+                return workers
+        return self.profile.concurrency
+
+    @property
+    def api_key(self) -> str | None:
+        """Configured API key of the engine."""
+        return Config.get_api_url(self.id)
+
+    def request(self, method: str, url: str, payload: int = 0, **kwargs) -> requests.Response:
+        """Sends an HTTP request through the owning service.
+
+        Unless ``timeout`` is given, the service picks connect and read timeouts
+        learned for requests of this engine and payload size.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            payload (int, optional): Characters of text sent. Defaults to 0.
+            **kwargs: Extra arguments for ``requests.Session.request``
+
+        Returns:
+            requests.Response: Engine response
+        """
+        return self.service._http(method, url, payload, **kwargs)
+
+    def translate(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Translates a single segment.
+
+        Args:
+            text (str): Text to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+
+        Returns:
+            str: Translated text
+        """
+        return self.translate_batch([text], lang_from, lang_to)[0]
+
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates segments that fit in a single request.
+
+        Args:
+            texts (list[str]): Segments within the profile limits
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments, only passed
+                when it matches ``profile.markup``. Defaults to None (plain text).
+
+        Returns:
+            list[str]: Translated segments in request order
+        """
+        raise NotImplementedError
+
+_REGISTRY: dict[str, type[TranslationEngine]] = {}
+
+def register_engine(cls: type[TranslationEngine]) -> type[TranslationEngine]:
+    """Class decorator adding an engine to the registry.
+
+    Args:
+        cls (type[TranslationEngine]): Engine class with a unique ``id``
+
+    Returns:
+        type[TranslationEngine]: The same class, unchanged
+    """
+    _REGISTRY[cls.id] = cls
+    return cls
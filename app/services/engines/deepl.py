@@ -0,0 +1,59 @@
+from app.core.constants import Engine
+from app.exceptions.translation import TranslationFailed
+from .base import EngineProfile, TranslationEngine, register_engine
+
+@register_engine
+class DeepLEngine(TranslationEngine):
+    """DeepL API adapter.
+
+    Accepts up to 50 ``text`` fields per request and preserves XML tags.
+    """
+
+    id = Engine.DEEPL
+    default_url = "https://api-free.deepl.com/v2/translate"
+    profile = EngineProfile(
+        max_chars=5000,
+        max_segments=50,
+        max_batch_chars=100_000,
+        concurrency=8,
+        rate=5.0,
+        burst=10,
+        markup="xml",
+    )
+
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates several segments in one DeepL request.
+        
+        Segments are sent as repeated ``text`` form fields. XML segments enable
+        DeepL's tag handling so inline tags come back in place.
+        
+        Args:
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language
+            lang_to (str): Target language
+            markup (str, optional): ``'xml'`` for tagged segments
+            
+        Raises:
+            TranslationFailed: No valid translations in response
+            
+        Returns:
+            list[str]: Translated segments in request order
+        """
+        params = {
+            "auth_key": self.api_key,
+            "text": texts,
+            "source_lang": lang_from.upper(),
+            "target_lang": lang_to.upper(),
+        }
+        if markup == "xml":
+            params["tag_handling"] = "xml"
+
+        response = self.request("POST", self.url, payload=sum(map(len, texts)), data=params)
+        data = response.json()
+
+        if "translations" in data:
+            return [item["text"] for item in data["translations"]]
+
+        raise TranslationFailed("Error en respuesta de DeepL.")
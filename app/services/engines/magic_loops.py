@@ -0,0 +1,61 @@
+from app.core.constants import Engine
+from app.exceptions.translation import TranslationFailed, TranslationServiceUnavailable
+from .base import EngineProfile, TranslationEngine, register_engine
+
+@register_engine
+class MagicLoopsEngine(TranslationEngine):
+    """Magic Loops custom API adapter.
+
+    The endpoint URL itself is the configured credential.
+    """
+
+    id = Engine.MAGIC_LOOPS
+    profile = EngineProfile(
+        max_chars=5000,
+        max_batch_chars=5000,
+        concurrency=4,
+        rate=2.0,
+        burst=4,
+    )
+
+    def translate(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Translates text using Magic Loops custom API.
+        
+        Requires configured endpoint URL.
+        
+        Args:
+            text (str): Text to translate
+            lang_from (str): Source language
+            lang_to (str): Target language
+            
+        Raises:
+            TranslationServiceUnavailable: Missing endpoint configuration
+            TranslationFailed: Invalid response structure
+
+        Returns:
+            str: Translated text
+        """
+        url = self.url
+        if not url:
+            raise TranslationServiceUnavailable("URL de Magic Loops no configurada.")
+
+        response = self.request(
+            "GET",
+            url,
+            payload=len(text),
+            json={"text": text, "source": lang_from, "target": lang_to},
+        )
+        data: dict = response.json()
+
+        response = data.get("translatedText")
+
+        if not response:
+            raise TranslationFailed("La respuesta no contiene 'translatedText'.")
+
+        return response
+
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates each segment with its own request (no native batching)."""
+        return [self.translate(text, lang_from, lang_to) for text in texts]
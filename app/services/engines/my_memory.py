@@ -0,0 +1,56 @@
+from app.core.constants import Engine
+from app.exceptions.translation import TranslationFailed, TranslationRateLimited
+from .base import EngineProfile, TranslationEngine, register_engine
+
+@register_engine
+class MyMemoryEngine(TranslationEngine):
+    """MyMemory Translation API adapter.
+
+    Free service without API key; one segment per GET request. The query
+    is limited to 500 bytes of URL-encoded text, so accented or Japanese
+    segments hold far fewer than 500 characters.
+    """
+
+    id = Engine.MY_MEMORY
+    default_url = "https://api.mymemory.translated.net/get"
+    profile = EngineProfile(
+        max_chars=500,
+        max_bytes=500,
+        max_batch_chars=500,
+        concurrency=4,
+        rate=2.0,
+        burst=4,
+        requires_api_key=False,
+    )
+
+    def translate(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Translates text using MyMemory Translation API.
+        
+        Args:
+            text (str): Text to translate
+            lang_from (str): Source language
+            lang_to (str): Target language
+        
+        Raises:
+            TranslationRateLimited: If the daily or per-IP quota is exhausted
+            TranslationFailed: If API returns non-200 status
+
+        Returns:
+            str: Translated text
+        """
+        params = {"q": text, "langpair": f"{lang_from}|{lang_to}"}
+        response = self.request("GET", self.url, payload=len(text), params=params)
+        data: dict = response.json()
+
+        if data.get("responseStatus") in (429, "429"):
+            raise TranslationRateLimited(data.get("responseDetails", "Límite de MyMemory alcanzado."))
+        if data.get("responseStatus") != 200:
+            raise TranslationFailed(data.get("responseDetails", "Error desconocido en MyMemory."))
+
+        return data["responseData"]["translatedText"]
+
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates each segment with its own request (no native batching)."""
+        return [self.translate(text, lang_from, lang_to) for text in texts]
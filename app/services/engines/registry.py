@@ -0,0 +1,42 @@
+from app.exceptions.translation import TranslationError
+from .base import _REGISTRY, EngineProfile, TranslationEngine
+from . import my_memory, magic_loops, deepl, google, translation_memory  # noqa: F401  Registers built-in engines
+
+def get_engine_class(engine: str) -> type[TranslationEngine]:
+    """Looks up a registered engine class.
+
+    Args:
+        engine (str): Engine identifier (``Engine`` member or plain string)
+
+    Raises:
+        TranslationError: If no engine is registered under ``engine``
+
+    Returns:
+        type[TranslationEngine]: Registered engine class
+    """
+    try:
+        return _REGISTRY[str(engine)]
+    except KeyError:
+        raise TranslationError("Engine no soportado.")
+
+def get_profile(engine: str) -> EngineProfile:
+    """Returns the capability profile of a registered engine.
+
+    Args:
+        engine (str): Engine identifier
+
+    Raises:
+        TranslationError: If no engine is registered under ``engine``
+
+    Returns:
+        EngineProfile: Engine capabilities
+    """
+    return get_engine_class(engine).profile
+
+def registered_engines() -> list[type[TranslationEngine]]:
+    """Lists registered engines in registration order.
+
+    Returns:
+        list[type[TranslationEngine]]: Engine classes
+    """
+    return list(_REGISTRY.values())
@@ -0,0 +1,49 @@
+from app.core.constants import Engine
+from app.services.translation_memory import TranslationMemory
+from .base import EngineProfile, TranslationEngine, register_engine
+
+@register_engine
+class TranslationMemoryEngine(TranslationEngine):
+    """Offline engine answering from local TMX/TSV translation memories.
+
+    Uses the service's ``memory`` if set, otherwise ``TranslationMemory.shared()``.
+    Segments without an exact or fuzzy match are returned unchanged, so a
+    document can be pre-translated and the rest finished with another engine.
+    """
+
+    id = Engine.TRANSLATION_MEMORY
+    profile = EngineProfile(
+        max_chars=5000,
+        max_segments=1000,
+        max_batch_chars=1_000_000,
+        concurrency=1,
+        rate=1_000_000.0,
+        burst=1_000_000,
+        requires_api_key=False,
+        offline=True,
+    )
+
+    @property
+    def memory(self) -> TranslationMemory:
+        """Translation memory consulted by the engine."""
+        return self.service.memory or TranslationMemory.shared()
+
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Looks up every segment in the translation memory.
+
+        Args:
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+
+        Returns:
+            list[str]: Stored translations, or the source segment on a miss
+        """
+        memory = self.memory
+        results = []
+        for text in texts:
+            translated = memory.translate(text, lang_from, lang_to)
+            results.append(text if translated is None else translated)
+        return results
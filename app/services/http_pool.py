@@ -0,0 +1,94 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+class HTTPSessionPool:
+    """Long-lived keep-alive HTTP connection pools grouped by key.
+
+    Each key (usually a translation engine) owns a single ``HTTPAdapter`` whose
+    urllib3 pool is shared by every thread, so TCP/TLS connections are reused
+    across chunks, paragraphs and documents. ``requests.Session`` objects are not
+    guaranteed to be thread-safe, so every thread gets its own lightweight session
+    mounted on the shared adapter.
+
+    Attributes:
+        pool_connections (int): Number of distinct hosts kept in each key's pool
+        pool_maxsize (int): Maximum simultaneous connections per host
+        pool_block (bool): If True, callers wait for a free connection instead of
+            opening extra ones above ``pool_maxsize``
+
+    Example:
+        >>> pool = HTTPSessionPool(pool_maxsize=4)
+        >>> response = pool.session("deepl").post(url, data=params, timeout=10)
+        >>> pool.close()
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10, pool_block: bool = True) -> None:
+        """Initializes an empty pool registry.
+
+        Args:
+            pool_connections (int, optional): Hosts cached per key. Defaults to 4.
+            pool_maxsize (int, optional): Connections per host. Defaults to 10.
+            pool_block (bool, optional): Block when the per-host limit is reached.
+                Defaults to True.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def session(self, key: str) -> requests.Session:
+        """Returns the calling thread's session for the given key.
+
+        Args:
+            key (str): Pool identifier, typically an ``Engine`` value
+
+        Returns:
+            requests.Session: Session bound to the key's shared connection pool
+        """
+        sessions: dict[str, requests.Session] = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+
+        session = sessions.get(key)
+        if session is None:
+            adapter = self._adapter(key)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            sessions[key] = session
+        return session
+
+    def _adapter(self, key: str) -> HTTPAdapter:
+        """Gets or lazily creates the shared adapter for a key.
+
+        Args:
+            key (str): Pool identifier
+
+        Returns:
+            HTTPAdapter: Thread-safe adapter holding the connection pool
+        """
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                )
+                self._adapters[key] = adapter
+            return adapter
+
+    def close(self) -> None:
+        """Closes every pooled connection.
+
+        Sessions created afterwards transparently open new pools.
+        """
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        self._local = threading.local()
+        for adapter in adapters:
+            adapter.close()
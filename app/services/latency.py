@@ -0,0 +1,80 @@
+import threading
+from collections import deque
+
+class LatencyTracker:
+    """Rolling per-key record of request latencies.
+
+    Keeps the most recent ``window`` samples for each key and answers
+    percentile queries, so thresholds derived from it adapt as an engine gets
+    faster or slower.
+
+    Attributes:
+        window (int): Samples kept per key
+        min_samples (int): Samples required before percentiles are reported
+
+    Example:
+        >>> tracker = LatencyTracker()
+        >>> tracker.record("deepl", 0.42)
+        >>> tracker.percentile("deepl", 0.95)
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        """Initializes an empty tracker.
+
+        Args:
+            window (int, optional): Samples kept per key. Defaults to 200.
+            min_samples (int, optional): Minimum samples for a percentile. Defaults to 20.
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """Adds a latency sample.
+
+        Args:
+            key (str): Sample group, e.g. an engine
+            seconds (float): Observed latency
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """Returns the ``q`` quantile of the recorded samples.
+
+        Args:
+            key (str): Sample group
+            q (float): Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            (float, optional): Latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def count(self, key: str) -> int:
+        """Returns how many samples are held for a key."""
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def snapshot(self) -> dict[str, list[float]]:
+        """Returns a copy of every key's samples, oldest first."""
+        with self._lock:
+            return {key: list(samples) for key, samples in self._samples.items()}
+
+    def load(self, snapshot: dict[str, list[float]]) -> None:
+        """Replaces the samples of the given keys, e.g. from a saved snapshot.
+
+        Args:
+            snapshot (dict[str, list[float]]): Samples by key, oldest first
+        """
+        with self._lock:
+            for key, values in snapshot.items():
+                self._samples[key] = deque(values, maxlen=self.window)
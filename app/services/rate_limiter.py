@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to an engine's quota.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Every
+    request takes one token, waiting if none is available. When an engine
+    throttles, ``pause`` holds every caller sharing the bucket until the
+    engine's requested delay has passed.
+
+    Attributes:
+        rate (float): Sustained requests per second
+        burst (int): Maximum requests allowed back to back
+
+    Example:
+        >>> bucket = TokenBucket(rate=5, burst=10)
+        >>> bucket.acquire()
+        >>> bucket.pause(2.0)  # After a 429 with Retry-After: 2
+    """
+
+    _registry: dict[str, "TokenBucket"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initializes a full bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Bucket capacity
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str, rate: float, burst: int) -> "TokenBucket":
+        """Returns the process-wide bucket for a key, creating it on first use.
+
+        Services for the same engine share a bucket so their combined traffic
+        stays within the engine's quota.
+
+        Args:
+            key (str): Bucket identifier, typically an ``Engine`` value
+            rate (float): Tokens per second if the bucket is created
+            burst (int): Capacity if the bucket is created
+
+        Returns:
+            TokenBucket: Shared bucket for ``key``
+        """
+        with cls._registry_lock:
+            bucket = cls._registry.get(key)
+            if bucket is None:
+                bucket = cls._registry[key] = cls(rate, burst)
+            return bucket
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def try_acquire(self) -> float:
+        """Consumes a token if one is available, without blocking.
+
+        Returns:
+            float: 0.0 on success, otherwise seconds until a token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Stops handing out tokens for the given time and empties the bucket.
+
+        Args:
+            seconds (float): Delay requested by the engine
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Adds the tokens earned since the last update. Requires the lock."""
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Computes a jittered exponential backoff delay.
+
+    Uses "equal jitter": half of the exponential delay is fixed and the other
+    half is random, so concurrent callers spread out without retrying too early.
+
+    Args:
+        attempt (int): Zero-based retry number
+        base (float, optional): Delay of the first retry in seconds. Defaults to 0.5.
+        cap (float, optional): Upper bound in seconds. Defaults to 30.0.
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a ``Retry-After`` header given either in seconds or as an HTTP date.
+
+    Args:
+        value (str, optional): Raw header value
+
+    Returns:
+        (float, optional): Seconds to wait, or None if absent or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def quota_delay(headers) -> float | None:
+    """Reads common quota headers and returns how long to wait if exhausted.
+
+    Understands ``X-RateLimit-Remaining`` together with ``X-RateLimit-Reset``
+    given as seconds from now or as a Unix timestamp.
+
+    Args:
+        headers (Mapping[str, str]): Response headers (case-insensitive)
+
+    Returns:
+        (float, optional): Seconds until the quota resets, or None if not exhausted
+    """
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(float(remaining)) > 0:
+            return None
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    # Large values are absolute epoch timestamps, small ones relative seconds
+    if reset_value > 1e9:
+        reset_value -= time.time()
+    return max(0.0, reset_value)
@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import Future
+from typing import Hashable
+
+class SingleFlight:
+    """Coalesces identical calls that are in flight at the same time.
+
+    The first caller to ``claim`` a key becomes its leader and must settle the
+    returned future with ``resolve`` or ``reject``; later callers get the same
+    future and simply wait on it (``future.result()`` from threads,
+    ``asyncio.wrap_future`` from coroutines). Keys are released as soon as they
+    are settled, so a later call is sent again (and will usually hit the cache).
+
+    Attributes:
+        saved (int): Calls answered by waiting on an in-flight leader
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> future, leader = flights.claim(("deepl", "en", "es", "N/A"))
+        >>> if leader:
+        ...     flights.resolve(("deepl", "en", "es", "N/A"), future, "N/D")
+        >>> future.result()
+        'N/D'
+    """
+
+    _registry: dict[str, "SingleFlight"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initializes an empty in-flight table."""
+        self.saved = 0
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str) -> "SingleFlight":
+        """Returns the process-wide table for a key, creating it on first use.
+
+        Services for the same engine share a table so duplicates are coalesced
+        across the text tab, document workers and any other callers.
+
+        Args:
+            key (str): Table identifier, typically an ``Engine`` value
+
+        Returns:
+            SingleFlight: Shared table for ``key``
+        """
+        with cls._registry_lock:
+            flights = cls._registry.get(key)
+            if flights is None:
+                flights = cls._registry[key] = cls()
+            return flights
+
+    def claim(self, key: Hashable) -> tuple[Future, bool]:
+        """Joins the in-flight call for a key or starts a new one.
+
+        Args:
+            key (Hashable): Call identity
+
+        Returns:
+            tuple[Future, bool]: Future carrying the result, and True if the
+                caller is the leader and must perform the call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.saved += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def resolve(self, key: Hashable, future: Future, value) -> None:
+        """Releases a key and hands its result to every waiter.
+
+        Args:
+            key (Hashable): Call identity
+            future (Future): Future returned to the leader by ``claim``
+            value: Result of the call
+        """
+        self._release(key, future)
+        if not future.done():
+            future.set_result(value)
+
+    def reject(self, key: Hashable, future: Future, error: BaseException) -> None:
+        """Releases a key and raises ``error`` in every waiter.
+
+        Args:
+            key (Hashable): Call identity
+            future (Future): Future returned to the leader by ``claim``
+            error (BaseException): Failure of the call
+        """
+        self._release(key, future)
+        if not future.done():
+            future.set_exception(error)
+
+    def in_flight(self) -> int:
+        """Returns how many distinct calls are currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def _release(self, key: Hashable, future: Future) -> None:
+        """Removes a key unless a newer call already took it over."""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
@@ -0,0 +1,259 @@
+"""Local stand-in for the translation engines, for benchmarks and offline runs.
+
+Usage:
+    $ python -m app.services.stub_server --port 8765 --latency 0.05
+    $ TRADUCTOR_DEEPL_URL=http://127.0.0.1:8765/deepl python main.py
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlsplit
+from app.core.constants import Engine
+from .rate_limiter import TokenBucket
+
+class StubTranslationServer:
+    """Threaded HTTP server speaking the request/response shapes of every engine.
+
+    Each engine is served under ``/<engine value>`` (e.g. ``/deepl``), and
+    ``urls()`` returns a mapping ready for ``TranslationService(base_urls=...)``.
+    "Translations" are deterministic: the target code prefixed to the source text.
+
+    Attributes:
+        latency (float): Base response delay in seconds
+        jitter (float): Random extra delay in seconds (0 to ``jitter``)
+        error_rate (float): Probability of answering 500
+        rate_limit (float | None): Requests per second before answering 429
+        max_chars (dict[Engine, int]): Per-request character limit by engine; MyMemory's
+            counts URL-encoded bytes, as the real service does
+        stats (dict[str, int]): Counters for requests, segments, throttled and errors
+
+    Example:
+        >>> with StubTranslationServer(latency=0.02) as server:
+        ...     service = TranslationService(Engine.DEEPL, base_urls=server.urls())
+        ...     service.translate("Hello", "en", "es")
+        'es:Hello'
+    """
+
+    DEFAULT_MAX_CHARS: dict[Engine, int] = {
+        Engine.MY_MEMORY: 500,
+        Engine.MAGIC_LOOPS: 5_000,
+        Engine.DEEPL: 128_000,
+        Engine.GOOGLE: 30_000,
+    }
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float | None = None,
+        max_chars: dict[Engine, int] | None = None
+    ) -> None:
+        """Creates the server without starting it.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind, 0 for any free port. Defaults to 0.
+            latency (float, optional): Base delay in seconds. Defaults to 0.0.
+            jitter (float, optional): Maximum random extra delay. Defaults to 0.0.
+            error_rate (float, optional): Probability of a 500 response. Defaults to 0.0.
+            rate_limit (float, optional): Requests per second allowed before 429
+                responses with ``Retry-After``. Defaults to None (unlimited).
+            max_chars (dict[Engine, int], optional): Overrides of ``DEFAULT_MAX_CHARS``.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.max_chars = {**self.DEFAULT_MAX_CHARS, **(max_chars or {})}
+        self.stats = {"requests": 0, "segments": 0, "throttled": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+        self._bucket = TokenBucket(rate_limit, max(1, int(rate_limit))) if rate_limit else None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def urls(self) -> dict[Engine, str]:
+        """Returns the endpoint of every emulated engine.
+
+        Returns:
+            dict[Engine, str]: Engine to URL mapping
+        """
+        return {engine: f"{self.base_url}/{engine.value}" for engine in Engine if engine in self.max_chars}
+
+    def start(self) -> "StubTranslationServer":
+        """Serves requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and releases the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Serves requests on the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def reset_stats(self) -> None:
+        """Zeroes every counter."""
+        with self._stats_lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def __enter__(self) -> "StubTranslationServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Builds the request handler bound to this server's settings."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real engines
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                self._handle()
+
+            def do_POST(self) -> None:
+                self._handle()
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode("utf-8") if length else ""
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                stub._count("requests")
+
+                try:
+                    engine = Engine(parts.path.strip("/").split("/")[0])
+                except ValueError:
+                    return self._send(404, {"message": "Unknown engine"})
+
+                if stub._bucket:
+                    wait = stub._bucket.try_acquire()
+                    if wait:
+                        stub._count("throttled")
+                        return self._send(429, {"message": "Too many requests"}, {"Retry-After": str(math.ceil(wait))})
+
+                time.sleep(stub.latency + random.uniform(0, stub.jitter))
+                if random.random() < stub.error_rate:
+                    stub._count("errors")
+                    return self._send(500, {"message": "Internal error"})
+
+                match engine:
+                    case Engine.MY_MEMORY:
+                        self._my_memory(query)
+                    case Engine.MAGIC_LOOPS:
+                        self._magic_loops(json.loads(body or "{}"))
+                    case Engine.DEEPL:
+                        self._deepl(parse_qs(body))
+                    case Engine.GOOGLE:
+                        self._google(parse_qs(body))
+
+            def _too_long(self, engine: Engine, texts: list[str]) -> bool:
+                if engine == Engine.MY_MEMORY:
+                    return sum(len(quote_plus(text)) for text in texts) > stub.max_chars[engine]
+                return sum(len(text) for text in texts) > stub.max_chars[engine]
+
+            def _my_memory(self, query: dict) -> None:
+                text = query.get("q", [""])[0]
+                lang_from, _, lang_to = query.get("langpair", ["|"])[0].partition("|")
+                if self._too_long(Engine.MY_MEMORY, [text]):
+                    limit = stub.max_chars[Engine.MY_MEMORY]
+                    return self._send(200, {
+                        "responseStatus": 403,
+                        "responseDetails": f"QUERY LENGTH LIMIT EXCEEDED. MAX ALLOWED QUERY : {limit} CHARS",
+                    })
+                stub._count("segments")
+                self._send(200, {
+                    "responseStatus": 200,
+                    "responseData": {"translatedText": f"{lang_to}:{text}"},
+                })
+
+            def _magic_loops(self, payload: dict) -> None:
+                text = payload.get("text", "")
+                if self._too_long(Engine.MAGIC_LOOPS, [text]):
+                    return self._send(413, {"error": "Payload too large"})
+                stub._count("segments")
+                self._send(200, {"translatedText": f"{payload.get('target', '')}:{text}"})
+
+            def _deepl(self, form: dict) -> None:
+                texts = form.get("text", [])
+                target = form.get("target_lang", [""])[0].lower()
+                if self._too_long(Engine.DEEPL, texts):
+                    return self._send(413, {"message": "Request Entity Too Large"})
+                stub._count("segments", len(texts))
+                self._send(200, {"translations": [
+                    {"detected_source_language": form.get("source_lang", [""])[0], "text": f"{target}:{text}"}
+                    for text in texts
+                ]})
+
+            def _google(self, form: dict) -> None:
+                texts = form.get("q", [])
+                target = form.get("target", [""])[0]
+                if self._too_long(Engine.GOOGLE, texts):
+                    return self._send(400, {"error": {"code": 400, "message": "Text too long"}})
+                stub._count("segments", len(texts))
+                self._send(200, {"data": {"translations": [
+                    {"translatedText": f"{target}:{text}"} for text in texts
+                ]}})
+
+            def _send(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+def main() -> None:
+    """Runs the stub server from the command line."""
+    parser = argparse.ArgumentParser(description="Local translation engine stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum extra random delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of HTTP 500")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests/sec before HTTP 429")
+    args = parser.parse_args()
+
+    server = StubTranslationServer(
+        args.host, args.port, args.latency, args.jitter, args.error_rate, args.rate_limit
+    )
+    for engine, url in server.urls().items():
+        print(f"TRADUCTOR_{engine.name}_URL={url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
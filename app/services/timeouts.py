@@ -0,0 +1,193 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+from .latency import LatencyTracker
+
+class AdaptiveTimeouts:
+    """Learns per-engine, per-payload-size request timeouts from observed latency.
+
+    Latencies are grouped by engine and by payload size bucket (powers of two
+    from 64 characters up). A request's read timeout is the ``quantile``
+    latency of its bucket times ``headroom``; buckets without enough samples
+    borrow from the next larger bucket, and the defaults apply until any data
+    exists. The connect timeout follows the smallest payloads, which are
+    dominated by network round trips. Both are clamped to the configured
+    bounds. Timed-out requests are recorded at the timeout value, so a timeout
+    that proves too short grows on the next requests.
+
+    Samples are saved as JSON every ``save_every`` records and at exit, and
+    loaded again on start.
+
+    Attributes:
+        path (str | None): JSON file with the learned samples, None to keep them in memory
+        connect_bounds (tuple[float, float]): Minimum and maximum connect timeout
+        read_bounds (tuple[float, float]): Minimum and maximum read timeout
+        default (tuple[float, float]): Connect and read timeouts used without data
+        quantile (float): Latency quantile the timeout is based on
+        headroom (float): Multiplier applied to that quantile
+
+    Example:
+        >>> timeouts = AdaptiveTimeouts(path=None, read_bounds=(1.0, 60.0))
+        >>> timeouts.record("deepl", 4800, 1.2)
+        >>> timeouts.timeout("deepl", 4800)
+        (3.05, 10.0)
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".traductor-inador", "latency.json")
+    MIN_BUCKET_CHARS = 64
+    MAX_BUCKET = 16
+
+    _shared: "AdaptiveTimeouts | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str | None = DEFAULT_PATH,
+        connect_bounds: tuple[float, float] = (0.5, 5.0),
+        read_bounds: tuple[float, float] = (1.0, 60.0),
+        default: tuple[float, float] = (3.05, 10.0),
+        quantile: float = 0.99,
+        headroom: float = 3.0,
+        min_samples: int = 10,
+        save_every: int = 100
+    ) -> None:
+        """Creates the model, loading saved samples from ``path`` if present.
+
+        Args:
+            path (str, optional): JSON file for persistence. Defaults to
+                ``~/.traductor-inador/latency.json``; None disables persistence.
+            connect_bounds (tuple[float, float], optional): Connect timeout range.
+                Defaults to (0.5, 5.0).
+            read_bounds (tuple[float, float], optional): Read timeout range.
+                Defaults to (1.0, 60.0).
+            default (tuple[float, float], optional): Timeouts before any data.
+                Defaults to (3.05, 10.0).
+            quantile (float, optional): Latency quantile to cover. Defaults to 0.99.
+            headroom (float, optional): Multiplier over that quantile. Defaults to 3.0.
+            min_samples (int, optional): Samples a bucket needs to be used. Defaults to 10.
+            save_every (int, optional): Records between saves. Defaults to 100.
+        """
+        self.path = path
+        self.connect_bounds = connect_bounds
+        self.read_bounds = read_bounds
+        self.default = default
+        self.quantile = quantile
+        self.headroom = headroom
+        self.save_every = save_every
+        self._tracker = LatencyTracker(window=200, min_samples=min_samples)
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def shared(cls) -> "AdaptiveTimeouts":
+        """Returns the process-wide model stored at ``DEFAULT_PATH``, saved at exit.
+
+        Returns:
+            AdaptiveTimeouts: Lazily created shared instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.save)
+            return cls._shared
+
+    @classmethod
+    def bucket(cls, size: int) -> int:
+        """Maps a payload size in characters to its bucket.
+
+        Args:
+            size (int): Characters sent in the request
+
+        Returns:
+            int: 0 for up to 64 characters, 1 up to 128, 2 up to 256, ...
+        """
+        bucket = (max(size, 1) - 1).bit_length() - (cls.MIN_BUCKET_CHARS - 1).bit_length()
+        return min(cls.MAX_BUCKET, max(0, bucket))
+
+    def timeout(self, engine: str, size: int) -> tuple[float, float]:
+        """Returns the connect and read timeouts for a request.
+
+        Args:
+            engine (str): Engine identifier
+            size (int): Characters sent in the request
+
+        Returns:
+            tuple[float, float]: ``(connect, read)`` timeouts in seconds
+        """
+        connect = self._estimate(engine, 0)
+        read = self._estimate(engine, self.bucket(size))
+        return (
+            self.default[0] if connect is None else self._clamp(connect, self.connect_bounds),
+            self.default[1] if read is None else self._clamp(read, self.read_bounds),
+        )
+
+    def record(self, engine: str, size: int, seconds: float) -> None:
+        """Adds a latency sample and saves periodically.
+
+        Args:
+            engine (str): Engine identifier
+            size (int): Characters sent in the request
+            seconds (float): Observed latency, or the timeout if it expired
+        """
+        self._tracker.record(self._key(engine, self.bucket(size)), seconds)
+        with self._lock:
+            self._unsaved += 1
+            due = self.path is not None and self._unsaved >= self.save_every
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Writes the samples to ``path`` atomically, ignoring write errors.
+
+        Each save goes through its own temporary file, so processes sharing
+        ``path`` (batch workers) replace it whole instead of racing on one
+        temporary name. The last writer wins.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            self._unsaved = 0
+            snapshot = self._tracker.snapshot()
+            folder = os.path.dirname(os.path.abspath(self.path))
+            temp_path = None
+            try:
+                os.makedirs(folder, exist_ok=True)
+                descriptor, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                    json.dump(snapshot, file)
+                os.replace(temp_path, self.path)
+            except OSError:
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def _load(self) -> None:
+        """Restores saved samples, ignoring a missing or corrupt file."""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+            self._tracker.load({
+                str(key): [float(value) for value in values] for key, values in snapshot.items()
+            })
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def _estimate(self, engine: str, bucket: int) -> float | None:
+        """Scaled latency quantile of a bucket, or of the next larger bucket with data."""
+        for candidate in range(bucket, self.MAX_BUCKET + 1):
+            latency = self._tracker.percentile(self._key(engine, candidate), self.quantile)
+            if latency is not None:
+                return latency * self.headroom
+        return None
+
+    @staticmethod
+    def _key(engine: str, bucket: int) -> str:
+        return f"{engine}:{bucket}"
+
+    @staticmethod
+    def _clamp(value: float, bounds: tuple[float, float]) -> float:
+        return min(bounds[1], max(bounds[0], value))
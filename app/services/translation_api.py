@@ -1,33 +1,167 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+from urllib.parse import quote_plus
 import requests
 from requests.exceptions import RequestException
-from app.core.config import Config
 from app.core.constants import Engine
+from app.core.segmenter import Segmenter
+from .engines.registry import get_engine_class
+from .http_pool import HTTPSessionPool
+from .translation_cache import TranslationCache
+from .translation_memory import TranslationMemory
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker
+from .timeouts import AdaptiveTimeouts
+from .latency import LatencyTracker
+from .rate_limiter import TokenBucket, backoff_delay, parse_retry_after, quota_delay
 from app.exceptions.translation import (
-    TranslationError,
     TranslationServiceUnavailable,
     TranslationFailed,
+    TranslationRateLimited,
+    TranslationCircuitOpen,
+    TranslationError,
 )
 
+T = TypeVar("T")
+
 class TranslationService:
     """Text translation service using different translation engines.
     
-    Supports multiple providers through dynamic configuration.
+    Supports multiple providers through the engine registry: each engine is a
+    ``TranslationEngine`` class whose ``EngineProfile`` drives batching, pacing
+    and concurrency, so the service itself has no per-engine code. Requests go through
+    a keep-alive connection pool owned by the service, so consecutive chunks reuse
+    the same TCP/TLS connection instead of opening a new one each time. An optional
+    ``TranslationCache`` answers repeated segments without touching the network,
+    and an optional ``TranslationMemory`` in front of the engine answers segments
+    stored verbatim in local TMX/TSV memories, so only the misses are sent.
+    Fuzzy matches are never used there, since a near-identical segment may
+    differ in a number, a date or a name the engine must translate.
+    Every request is paced by a per-engine token bucket, and throttled requests
+    (429, ``Retry-After``, exhausted quota headers) are retried with jittered
+    exponential backoff instead of failing the whole job. Identical segments already
+    in flight from another thread or coroutine are not sent again: callers wait for
+    the first request and share its result.
+
+    With ``hedge_with`` set, a request that outlives the primary engine's observed
+    p95 latency is duplicated to the secondary engine and the first answer wins;
+    while the primary's circuit is open the secondary takes over.
+
+    Request timeouts are not fixed: ``AdaptiveTimeouts`` derives each request's
+    connect and read timeouts from the latencies observed for the engine at that
+    payload size, so tiny lookups give up quickly and large batches get time.
+
+    Every request passes through the engine's ``CircuitBreaker``: after several
+    consecutive failures or timeouts it opens and requests fail fast with
+    ``TranslationCircuitOpen`` (or go straight to the secondary engine) while a
+    background probe waits for the engine to recover.
+
+    Engine endpoints can be redirected (e.g. to ``StubTranslationServer``) with the
+    ``base_urls`` argument or a ``TRADUCTOR_<ENGINE>_URL`` environment variable.
     
     Attributes:
         engine (Engine): Translation engine to use (MY_MEMORY|MAGIC_LOOPS|GOOGLE|DEEPL)
+        backend (TranslationEngine): Registered adapter for ``engine``
+        profile (EngineProfile): Capabilities and limits of ``engine``
+        pool (HTTPSessionPool): Per-engine connection pools shared across threads
+        cache (TranslationCache | None): Persistent cache consulted before each request
+        memory (TranslationMemory | None): Translation memory consulted after the cache
+        rate_limiter (TokenBucket): Bucket pacing requests to the engine
+        max_retries (int): Retries allowed for a throttled request
+        latency (LatencyTracker): Observed request latencies of the engine
+        flights (SingleFlight): In-flight segments shared by services of the engine
+        secondary (TranslationService | None): Hedge/failover service, if enabled
+        breaker (CircuitBreaker): Health of the engine, shared by its services
+        timeouts (AdaptiveTimeouts): Learned request timeouts
+        base_urls (dict[Engine, str]): Endpoint overrides by engine
     
     Example:
         >>> service = TranslationService(Engine.GOOGLE)
         >>> translated = service.translate("Hello", "en", "es")
+        >>> service.translate_batch(["Hello", "World"], "en", "es")
+        ['Hola', 'Mundo']
     """
 
-    def __init__(self, engine: Engine = Engine.MY_MEMORY) -> None:
+    HEDGE_DEFAULT_DELAY: float = 3.0
+    """Hedge threshold (seconds) used until enough latency samples exist."""
+
+    def __init__(
+        self,
+        engine: Engine = Engine.MY_MEMORY,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        cache: TranslationCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 5,
+        hedge_with: Engine | None = None,
+        breaker: CircuitBreaker | None = None,
+        timeouts: AdaptiveTimeouts | None = None,
+        base_urls: dict[Engine, str] | None = None,
+        memory: TranslationMemory | None = None
+    ) -> None:
         """Initializes the service with specified translation engine.
 
         Args:
             engine (Engine, optional):Translation engine to use. Defaults to Engine.MY_MEMORY.
+                Any identifier registered with ``register_engine`` is accepted.
+            pool_connections (int, optional): Hosts kept alive per engine pool. Defaults to 4.
+            pool_maxsize (int, optional): Maximum connections per host. Defaults to 10.
+            cache (TranslationCache, optional): Translation cache to use. Defaults to None.
+            rate_limiter (TokenBucket, optional): Request pacing. Defaults to the bucket
+                shared by every service of the same engine, sized from its profile.
+            max_retries (int, optional): Retries for throttled requests. Defaults to 5.
+            hedge_with (Engine, optional): Secondary engine for hedging and failover.
+                Defaults to None (disabled).
+            breaker (CircuitBreaker, optional): Engine health tracking. Defaults to the
+                breaker shared by every service of the same engine.
+            timeouts (AdaptiveTimeouts, optional): Timeout model. Defaults to the
+                process-wide model persisted in ``~/.traductor-inador``.
+            base_urls (dict[Engine, str], optional): Endpoint overrides by engine,
+                shared with the secondary service. Defaults to None.
+            memory (TranslationMemory, optional): Translation memory answering
+                exact matches before the engine is called, also used (with fuzzy
+                matches) as the source of the offline ``TRANSLATION_MEMORY``
+                engine. Defaults to None.
+
+        Raises:
+            TranslationError: If the engine is not registered.
         """
         self.engine = engine
+        self.backend = get_engine_class(engine)(self)
+        self.profile = self.backend.profile
+        self.segmenter = Segmenter(self.profile.max_chars, self.profile.max_bytes)
+        self.pool = HTTPSessionPool(pool_connections, pool_maxsize)
+        self.cache = None if self.profile.offline else cache
+        self.memory = memory
+        self.rate_limiter = rate_limiter or TokenBucket.shared(engine, self.profile.rate, self.profile.burst)
+        self.max_retries = max_retries
+        self.latency = LatencyTracker()
+        self.flights = SingleFlight.shared(engine)
+        self.breaker = breaker or CircuitBreaker.shared(engine)
+        self.breaker.set_probe(self._probe)
+        self.timeouts = timeouts or AdaptiveTimeouts.shared()
+        self.base_urls = dict(base_urls or {})
+        self.secondary = None
+        if hedge_with and hedge_with != engine:
+            self.secondary = TranslationService(
+                hedge_with, pool_connections, pool_maxsize,
+                cache=cache, max_retries=max_retries, timeouts=self.timeouts,
+                base_urls=self.base_urls, memory=memory
+            )
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._health_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Releases all pooled connections held by the service and stops it probing the engine."""
+        self.breaker.clear_probe(self._probe)
+        self.pool.close()
+        if self.secondary:
+            self.secondary.close()
+        if self._hedge_executor:
+            self._hedge_executor.shutdown(wait=False)
 
     def translate(self, text: str, lang_from: str, lang_to: str) -> str:
         """Translates text using the configured engine.
@@ -38,7 +172,6 @@ class TranslationService:
             lang_to (str): Target language code (e.g., 'es')
 
         Raises:
-            TranslationError: If the engine is not supported.
             TimeoutError: If the request exceeds the timeout.
             TranslationServiceUnavailable: If an error occurred in the request.
             TranslationFailed: If there was an error processing the response.
@@ -46,145 +179,511 @@ class TranslationService:
         Returns:
             str: Translated text
         """
-        try:
-            match self.engine:
-                case Engine.MY_MEMORY:
-                    return self._from_my_memory(text, lang_from, lang_to)
-                case Engine.MAGIC_LOOPS:
-                    return self._from_magic_loops(text, lang_from, lang_to)
-                case Engine.GOOGLE:
-                    return self._from_google_translate(text, lang_from, lang_to)
-                case Engine.DEEPL:
-                    return self._from_deepl(text, lang_from, lang_to)
-                case _:
-                    raise TranslationError("Engine no soportado.")
-                
-        except requests.Timeout:
-            raise TimeoutError()
-        except RequestException:
-            raise TranslationServiceUnavailable("Error en la solicitud.")
-        except (KeyError, ValueError):
-            raise TranslationFailed("Error procesando respuesta.")
+        return self.translate_batch([text], lang_from, lang_to)[0]
+
+    @property
+    def available(self) -> bool:
+        """False while the engine's circuit breaker is rejecting requests."""
+        return not self.breaker.is_open
+
+    @property
+    def coalesced(self) -> int:
+        """Segment requests saved by joining identical in-flight requests."""
+        return self.flights.saved
+
+    def _translate_one(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Sends a single segment to the configured engine, bypassing the cache.
 
-    def _from_my_memory(self, text: str, lang_from: str, lang_to: str) -> str:
-        """Translates text using MyMemory Translation API.
-        
         Args:
             text (str): Text to translate
-            source_lang (str): Source language
-            target_lang (str): Target language
-        
-        Raises:
-            TranslationFailed: If API returns non-200 status
+            lang_from (str): Source language code
+            lang_to (str): Target language code
 
         Returns:
             str: Translated text
         """
-        url = f"https://api.mymemory.translated.net/get?q={text}&langpair={lang_from}|{lang_to}"
-        response = requests.get(url, timeout=10)
-        data: dict = response.json()
-
-        if data.get("responseStatus") != 200:
-            raise TranslationFailed(data.get("responseDetails", "Error desconocido en MyMemory."))
+        return self._hedged(
+            lambda: self._with_retries(self._dispatch, text, lang_from, lang_to),
+            lambda: self.secondary._translate_one(text, lang_from, lang_to),
+        )
 
-        return data["responseData"]["translatedText"]
+    def _dispatch(self, text: str, lang_from: str, lang_to: str) -> str:
+        """Routes a single segment to the engine-specific implementation.
 
-    def _from_magic_loops(self, text: str, lang_from: str, lang_to: str) -> str:
-        """Translates text using Magic Loops custom API.
-        
-        Requires configured endpoint URL.
-        
         Args:
             text (str): Text to translate
-            source_lang (str): Source language
-            target_lang (str): Target language
-            
-        Raises:
-            TranslationServiceUnavailable: Missing endpoint configuration
-            TranslationFailed: Invalid response structure
+            lang_from (str): Source language code
+            lang_to (str): Target language code
 
         Returns:
             str: Translated text
         """
-        url = Config.get_api_url(self.engine)
-        if not url:
-            raise TranslationServiceUnavailable("URL de Magic Loops no configurada.")
+        with self._request_errors():
+            return self.backend.translate(text, lang_from, lang_to)
 
-        response = requests.get(
-            url,
-            json={"text": text, "source": lang_from, "target": lang_to},
-            timeout=10,
-        )
-        data: dict = response.json()
+    def translate_batch(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Translates several segments, packing them into as few requests as possible.
+
+        Segments are grouped up to the limits in the engine's profile. Engines without
+        native batching fall back to one request per segment. Blank segments are
+        returned unchanged without reaching the engine, and segments already in
+        flight (here or in another thread) wait for that request instead.
+        Plain-text segments over the engine's character or byte limit are split
+        at sentence boundaries (see ``Segmenter``) and joined back after translation.
+
+        Args:
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code (e.g., 'en')
+            lang_to (str): Target language code (e.g., 'es')
+            markup (str, optional): ``'xml'`` or ``'html'`` if the segments are
+                escaped markup whose inline tags must be preserved. Must match the
+                engine profile's ``markup``. Defaults to None (plain text).
 
-        response = data.get("translatedText")
+        Raises:
+            TimeoutError: If a request exceeds the timeout.
+            TranslationServiceUnavailable: If an error occurred in a request.
+            TranslationFailed: If there was an error processing a response.
+            TranslationError: If the engine does not support ``markup``.
 
-        if not response:
-            raise TranslationFailed("La respuesta no contiene 'translatedText'.")
+        Returns:
+            list[str]: Translations in the same order as ``texts``
+        """
+        if markup is not None and markup != self.profile.markup:
+            raise TranslationError(f"El motor no admite etiquetas {markup}.")
 
-        return response
+        split = self._split_oversize(texts, lang_from, markup)
+        if split:
+            pieces, layouts = split
+            return self._join_split(self.translate_batch(pieces, lang_from, lang_to), layouts)
+
+        results, pending = self._from_cache(texts, lang_from, lang_to, markup)
+        leading, following = self._claim(texts, pending, lang_from, lang_to, markup)
+
+        try:
+            if not self.profile.batches:
+                for i in leading:
+                    results[i] = self._translate_one(texts[i], lang_from, lang_to)
+                    self._settle(texts, results, [i], leading, lang_from, lang_to, markup)
+            else:
+                for batch in self._pack_batches(texts, list(leading)):
+                    translated = self._send_batch([texts[i] for i in batch], lang_from, lang_to, markup)
+                    for i, text in zip(batch, translated):
+                        results[i] = text
+                    self._settle(texts, results, batch, leading, lang_from, lang_to, markup)
+        except BaseException as e:
+            self._abandon(texts, leading, e, lang_from, lang_to, markup)
+            raise
+
+        for i, future in following.items():
+            results[i] = future.result()
+        return results
+
+    def _from_cache(
+        self, texts: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> tuple[list[str], list[int]]:
+        """Resolves segments from the cache and the translation memory.
 
-    def _from_google_translate(self, text: str, lang_from: str, lang_to: str) -> str:
-        """Translates text using Google Cloud Translation API.
-        
-        Requires valid API key configuration.
-        
         Args:
-            text (str): Text to translate
-            source_lang (str): Source language
-            target_lang (str): Target language
-            
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+
+        Returns:
+            tuple[list[str], list[int]]: Results prefilled with cached, memory and
+                blank segments, and the indices that still need a request
+        """
+        results = list(texts)
+        pending = []
+
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            cached = self.cache.get(self._namespace(markup), lang_from, lang_to, text) if self.cache else None
+            if cached is None and self.memory and not self.profile.offline and markup is None:
+                cached = self.memory.translate(text, lang_from, lang_to, threshold=1.0)
+            if cached is None:
+                pending.append(i)
+            else:
+                results[i] = cached
+
+        return results, pending
+
+    def _store(
+        self, texts: list[str], results: list[str], indices: list[int],
+        lang_from: str, lang_to: str, markup: str | None = None
+    ) -> None:
+        """Saves freshly translated segments in the cache.
+
+        Args:
+            texts (list[str]): Source segments
+            results (list[str]): Translations aligned with ``texts``
+            indices (list[int]): Positions that were just translated
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+        """
+        if self.cache:
+            for i in indices:
+                self.cache.put(self._namespace(markup), lang_from, lang_to, texts[i], results[i])
+
+    def _namespace(self, markup: str | None) -> str:
+        """Cache and in-flight key prefix, keeping markup and plain segments apart."""
+        return str(self.engine) if markup is None else f"{self.engine}:{markup}"
+
+    def _flight_key(
+        self, text: str, lang_from: str, lang_to: str, markup: str | None = None
+    ) -> tuple[str, str, str, str]:
+        """Identity of a segment request, matching the cache key."""
+        return (self._namespace(markup), lang_from, lang_to, TranslationCache.normalize(text))
+
+    def _claim(
+        self, texts: list[str], pending: list[int], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> tuple[dict[int, Future], dict[int, Future]]:
+        """Splits pending segments into those this call sends and those it waits for.
+
+        Duplicates within ``texts`` follow their first occurrence, so each
+        distinct segment is requested once.
+
+        Args:
+            texts (list[str]): All segments
+            pending (list[int]): Positions needing a request
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+
+        Returns:
+            tuple[dict[int, Future], dict[int, Future]]: Futures this call must
+                settle, and futures of segments already in flight, by position
+        """
+        leading: dict[int, Future] = {}
+        following: dict[int, Future] = {}
+        for i in pending:
+            future, leader = self.flights.claim(self._flight_key(texts[i], lang_from, lang_to, markup))
+            (leading if leader else following)[i] = future
+        return leading, following
+
+    def _settle(
+        self, texts: list[str], results: list[str], indices: list[int],
+        leading: dict[int, Future], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> None:
+        """Caches fresh translations and hands them to waiting callers.
+
+        Args:
+            texts (list[str]): Source segments
+            results (list[str]): Translations aligned with ``texts``
+            indices (list[int]): Positions that were just translated
+            leading (dict[int, Future]): Futures claimed by this call
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+        """
+        self._store(texts, results, indices, lang_from, lang_to, markup)
+        for i in indices:
+            key = self._flight_key(texts[i], lang_from, lang_to, markup)
+            self.flights.resolve(key, leading[i], results[i])
+
+    def _abandon(
+        self, texts: list[str], leading: dict[int, Future], error: BaseException,
+        lang_from: str, lang_to: str, markup: str | None = None
+    ) -> None:
+        """Fails every unsettled segment claimed by this call, releasing its waiters.
+
+        Args:
+            texts (list[str]): Source segments
+            leading (dict[int, Future]): Futures claimed by this call
+            error (BaseException): Error raised while translating
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+        """
+        for i, future in leading.items():
+            if not future.done():
+                self.flights.reject(self._flight_key(texts[i], lang_from, lang_to, markup), future, error)
+
+    def _send_batch(
+        self, segments: list[str], lang_from: str, lang_to: str, markup: str | None = None
+    ) -> list[str]:
+        """Sends one packed batch to an engine with native batching.
+
+        Markup batches are only hedged to a secondary engine with the same
+        markup support.
+
+        Args:
+            segments (list[str]): Segments that fit in a single request
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            markup (str, optional): Markup format of the segments
+
         Raises:
-            TranslationFailed: Invalid response structure
-            
+            TranslationFailed: If the response does not match the request size.
+
         Returns:
-            str: Translated text
+            list[str]: Translated segments in request order
         """
-        url = "https://translation.googleapis.com/language/translate/v2"
-        params = {
-            "q": text,
-            "source": lang_from,
-            "target": lang_to,
-            "format": "text",
-            "key": Config.get_api_url(self.engine),
-        }
+        secondary = None
+        if self.secondary and (markup is None or self.secondary.profile.markup == markup):
+            secondary = lambda: self.secondary.translate_batch(segments, lang_from, lang_to, markup)
+        translated = self._hedged(
+            lambda: self._with_retries(
+                self._guarded, self.backend.translate_batch, segments, lang_from, lang_to, markup
+            ),
+            secondary,
+        )
 
-        response = requests.post(url, params=params, timeout=10)
-        data = response.json()
+        if len(translated) != len(segments):
+            raise TranslationFailed("El número de traducciones no coincide.")
+        return translated
 
-        if "data" in data and "translations" in data["data"]:
-            return data["data"]["translations"][0]["translatedText"]
+    def _split_oversize(
+        self, texts: list[str], lang_from: str, markup: str | None = None
+    ) -> tuple[list[str], list[list[tuple[str, str]]]] | None:
+        """Splits segments the engine would reject for their size.
 
-        raise TranslationFailed("Error en respuesta de Google Translate.")
+        Markup segments are never split, since a split could fall inside a tag;
+        callers sending markup size their segments with ``Segmenter.fits``.
 
-    def _from_deepl(self, text: str, lang_from: str, lang_to: str) -> str:
-        """Translates text using DeepL API.
-        
-        Requires valid API key configuration.
-        
         Args:
-            text (str): Text to translate
-            source_lang (str): Source language
-            target_lang (str): Target language
-            
+            texts (list[str]): Segments to translate
+            lang_from (str): Source language code, for the sentence boundaries
+            markup (str, optional): Markup format of the segments
+
+        Returns:
+            (tuple[list[str], list[list[tuple[str, str]]]], optional): Pieces to
+                translate and, per segment, the whitespace around each of its
+                pieces; None if every segment fits
+        """
+        if markup is not None or all(self.segmenter.fits(text.strip()) for text in texts):
+            return None
+
+        pieces = []
+        layouts = []
+        for text in texts:
+            if self.segmenter.fits(text.strip()):
+                pieces.append(text)
+                layouts.append([("", "")])
+                continue
+            layout = []
+            for chunk in self.segmenter.split(text, lang_from):
+                core = chunk.strip()
+                start = chunk.find(core) if core else len(chunk)
+                pieces.append(core)
+                layout.append((chunk[:start], chunk[start + len(core):]))
+            layouts.append(layout)
+        return pieces, layouts
+
+    @staticmethod
+    def _join_split(translated: list[str], layouts: list[list[tuple[str, str]]]) -> list[str]:
+        """Rebuilds the segments split by ``_split_oversize`` from their translated pieces.
+
+        Args:
+            translated (list[str]): Translations of the pieces, in order
+            layouts (list[list[tuple[str, str]]]): Whitespace around each piece, per segment
+
+        Returns:
+            list[str]: One translation per original segment
+        """
+        pieces = iter(translated)
+        return ["".join(lead + next(pieces) + trail for lead, trail in layout) for layout in layouts]
+
+    def _pack_batches(self, texts: list[str], indices: list[int]) -> Iterator[list[int]]:
+        """Groups segment indices into batches that respect the engine limits.
+
+        Segments are measured like ``Segmenter.fits`` does: in URL-encoded bytes
+        for engines with a byte limit, in characters otherwise. A segment over
+        the request limit is sent alone in its own batch.
+
+        Args:
+            texts (list[str]): All segments
+            indices (list[int]): Positions in ``texts`` to translate
+
+        Yields:
+            list[int]: Indices of the segments for one request, in original order
+        """
+        max_segments, max_chars = self.profile.max_segments, self.profile.max_batch_chars
+        batch: list[int] = []
+        size = 0
+
+        for i in indices:
+            length = len(quote_plus(texts[i])) if self.profile.max_bytes else len(texts[i])
+            if batch and (len(batch) >= max_segments or size + length > max_chars):
+                yield batch
+                batch, size = [], 0
+            batch.append(i)
+            size += length
+
+        if batch:
+            yield batch
+
+    def _hedged(self, primary: Callable[[], T], secondary: Callable[[], T] | None) -> T:
+        """Runs a request on the primary engine, hedging to the secondary if slow.
+
+        Without a secondary engine, or when ``secondary`` is None, this simply
+        calls ``primary`` through the circuit breaker. While the primary's circuit is open, ``secondary`` is
+        called directly. Otherwise the primary gets until its p95 latency to
+        answer before the secondary is raced against it.
+
+        Args:
+            primary (Callable[[], T]): Request against the configured engine
+            secondary (Callable[[], T] | None): Same request against the secondary
+                engine, or None if it cannot serve this request
+
+        Returns:
+            T: First successful result
+        """
+        if self.secondary is None or secondary is None:
+            return self._tracked(primary)
+        if self.breaker.is_open:
+            return secondary()
+
+        if self._hedge_executor is None:
+            with self._health_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+
+        first = self._hedge_executor.submit(self._tracked, primary)
+        threshold = self.latency.percentile(self.engine, 0.95) or self.HEDGE_DEFAULT_DELAY
+        done, _ = wait([first], timeout=threshold)
+        if done:
+            if isinstance(first.exception(), TranslationCircuitOpen):
+                return secondary()
+            return first.result()
+
+        futures: set[Future] = {first, self._hedge_executor.submit(secondary)}
+        error: BaseException | None = None
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _tracked(self, primary: Callable[[], T]) -> T:
+        """Calls the primary engine through its circuit breaker.
+
+        Transport errors and timeouts count as failures; any answer from the
+        engine, even a throttling or malformed one, counts as a success.
+
+        Raises:
+            TranslationCircuitOpen: If the circuit is open.
+        """
+        self.breaker.check()
+        try:
+            result = primary()
+        except (TranslationRateLimited, TranslationFailed):
+            self.breaker.record_success()
+            raise
+        except (TranslationServiceUnavailable, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _probe(self) -> None:
+        """Health check run by the circuit breaker while the circuit is open.
+
+        Raises:
+            TimeoutError: If the engine does not answer in time.
+            TranslationServiceUnavailable: If the engine is unreachable.
+        """
+        self.rate_limiter.acquire()
+        try:
+            self._dispatch("Hello", "en", "es")
+        except (TranslationRateLimited, TranslationFailed):
+            pass  # The engine answered, so it is back
+
+    def _guarded(self, send: Callable[..., T], *args) -> T:
+        """Calls an engine method with transport errors mapped to app exceptions."""
+        with self._request_errors():
+            return send(*args)
+
+    def _with_retries(self, call: Callable[..., T], *args) -> T:
+        """Runs a request under the rate limiter, retrying while throttled.
+
+        Each attempt takes a token from the engine's bucket. When the engine
+        throttles, the whole bucket is paused for ``Retry-After`` (or a jittered
+        exponential backoff) so concurrent callers back off together.
+
+        Args:
+            call (Callable[..., T]): Request to perform
+            *args: Arguments for ``call``
+
         Raises:
-            TranslationFailed: No valid translations in response
-            
+            TranslationRateLimited: If still throttled after ``max_retries`` retries.
+
         Returns:
-            str: Translated text
+            T: Result of ``call``
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                return call(*args)
+            except TranslationRateLimited as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = e.retry_after if e.retry_after is not None else backoff_delay(attempt)
+                self.rate_limiter.pause(delay)
+                time.sleep(delay)
+                attempt += 1
+
+    def _http(self, method: str, url: str, payload: int = 0, **kwargs) -> requests.Response:
+        """Sends a pooled request and detects throttling responses.
+
+        The request gets adaptive timeouts for its payload size unless
+        ``timeout`` is passed, and its latency feeds the timeout model.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            payload (int, optional): Characters of text sent. Defaults to 0.
+            **kwargs: Extra arguments for ``requests.Session.request``
+
+        Raises:
+            TranslationRateLimited: On 429, on 503 with ``Retry-After`` or when
+                quota headers report no remaining requests.
+
+        Returns:
+            requests.Response: Engine response
         """
-        url = "https://api-free.deepl.com/v2/translate"
-        params = {
-            "auth_key": Config.get_api_url(self.engine),
-            "text": text,
-            "source_lang": lang_from.upper(),
-            "target_lang": lang_to.upper(),
-        }
+        kwargs.setdefault("timeout", self.timeouts.timeout(self.engine, payload))
+        start = time.perf_counter()
+        try:
+            response = self.pool.session(self.engine).request(method, url, **kwargs)
+        except requests.ReadTimeout:
+            # Censored sample: the real latency is at least this long
+            self.timeouts.record(self.engine, payload, time.perf_counter() - start)
+            raise
+        elapsed = time.perf_counter() - start
+        self.latency.record(self.engine, elapsed)
+        self.timeouts.record(self.engine, payload, elapsed)
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
 
-        response = requests.post(url, data=params, timeout=10)
-        data = response.json()
+        if response.status_code == 429 or (response.status_code == 503 and retry_after is not None):
+            raise TranslationRateLimited(f"Límite de solicitudes alcanzado ({response.status_code}).", retry_after)
 
-        if "translations" in data:
-            return data["translations"][0]["text"]
+        delay = quota_delay(response.headers)
+        if delay:
+            self.rate_limiter.pause(delay)
+        return response
+
+    @contextmanager
+    def _request_errors(self) -> Iterator[None]:
+        """Maps transport and parsing errors to the application exceptions.
 
-        raise TranslationFailed("Error en respuesta de DeepL.")
\ No newline at end of file
+        Raises:
+            TimeoutError: If the request exceeds the timeout.
+            TranslationServiceUnavailable: If an error occurred in the request.
+            TranslationFailed: If there was an error processing the response.
+        """
+        try:
+            yield
+        except requests.Timeout:
+            raise TimeoutError()
+        except RequestException:
+            raise TranslationServiceUnavailable("Error en la solicitud.")
+        except (KeyError, ValueError, IndexError):
+            raise TranslationFailed("Error procesando respuesta.")
@@ -0,0 +1,289 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+
+@dataclass
+class CacheStats:
+    """Counters describing translation cache effectiveness.
+
+    Attributes:
+        memory_hits (int): Lookups answered by the in-memory tier
+        disk_hits (int): Lookups answered by the SQLite tier
+        misses (int): Lookups that required a network call
+        bytes_saved (int): UTF-8 bytes of source text not sent to the engine
+        bytes_stored (int): UTF-8 bytes currently held on disk
+        entries (int): Segments currently held on disk
+    """
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    bytes_stored: int = 0
+    entries: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Total lookups served from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 - 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class TranslationCache:
+    """Two-tier persistent translation cache with LRU eviction.
+
+    Segments are keyed on (engine, lang_from, lang_to, normalized text). A bounded
+    in-memory LRU sits in front of a SQLite database whose total size is capped;
+    when the cap is exceeded the least recently used rows are evicted. A single
+    lock guards both tiers, so one instance can be shared by the GUI thread and
+    ``DocumentWorker`` threads.
+
+    Hits in the memory tier do not write to SQLite; their times are recorded
+    and written in one batch on the next ``put``, before evicting, on ``close``
+    or once ``TOUCH_BATCH`` are pending. The rows used most therefore stay the
+    most recent on disk and are evicted last.
+
+    Attributes:
+        path (str): SQLite database location
+        max_bytes (int): Size cap for stored source and target text
+        memory_entries (int): Capacity of the in-memory tier
+
+    Example:
+        >>> cache = TranslationCache("cache.db")
+        >>> cache.put("deepl", "en", "es", "Hello", "Hola")
+        >>> cache.get("deepl", "en", "es", "Hello")
+        'Hola'
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".traductor-inador", "translations.db")
+
+    TOUCH_BATCH = 256
+    """Memory-tier hits pending before their ``last_used`` times are written."""
+
+    _shared: "TranslationCache | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = DEFAULT_PATH, max_bytes: int = 64 * 1024 * 1024, memory_entries: int = 5000) -> None:
+        """Opens (or creates) the cache database.
+
+        Args:
+            path (str, optional): SQLite file path, or ``":memory:"``. Defaults to
+                ``~/.traductor-inador/translations.db``.
+            max_bytes (int, optional): Disk tier size cap. Defaults to 64 MiB.
+            memory_entries (int, optional): In-memory tier capacity. Defaults to 5000.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[tuple[str, str, str, str], str] = OrderedDict()
+        self._touched: dict[tuple[str, str, str, str], float] = {}  # Memory-tier hits -> time of use
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS translations (
+                engine TEXT NOT NULL,
+                lang_from TEXT NOT NULL,
+                lang_to TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (engine, lang_from, lang_to, source)
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON translations (last_used)")
+        row = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM translations").fetchone()
+        self._stats.entries, self._stats.bytes_stored = row
+
+    @classmethod
+    def shared(cls) -> "TranslationCache":
+        """Returns the process-wide cache stored at ``DEFAULT_PATH``.
+
+        Returns:
+            TranslationCache: Lazily created shared instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalizes a segment for use as a cache key.
+
+        Applies Unicode NFC, trims the ends and collapses inner whitespace runs.
+
+        Args:
+            text (str): Raw segment
+
+        Returns:
+            str: Normalized segment
+        """
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+    def get(self, engine: str, lang_from: str, lang_to: str, text: str) -> str | None:
+        """Looks up a cached translation.
+
+        Args:
+            engine (str): Engine identifier
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            text (str): Source segment
+
+        Returns:
+            (str, optional): Cached translation, or None on a miss
+        """
+        key = (str(engine), lang_from, lang_to, self.normalize(text))
+        size = len(text.encode("utf-8"))
+
+        with self._lock:
+            target = self._memory.get(key)
+            if target is not None:
+                self._memory.move_to_end(key)
+                self._touched[key] = time.time()
+                if len(self._touched) >= self.TOUCH_BATCH:
+                    self._flush_touched()
+                self._stats.memory_hits += 1
+                self._stats.bytes_saved += size
+                return target
+
+            row = self._db.execute(
+                "SELECT target FROM translations WHERE engine=? AND lang_from=? AND lang_to=? AND source=?",
+                key,
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            self._db.execute(
+                "UPDATE translations SET last_used=? WHERE engine=? AND lang_from=? AND lang_to=? AND source=?",
+                (time.time(), *key),
+            )
+            self._remember(key, row[0])
+            self._stats.disk_hits += 1
+            self._stats.bytes_saved += size
+            return row[0]
+
+    def put(self, engine: str, lang_from: str, lang_to: str, text: str, translation: str) -> None:
+        """Stores a translation, evicting old entries if the size cap is exceeded.
+
+        Args:
+            engine (str): Engine identifier
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            text (str): Source segment
+            translation (str): Translated segment
+        """
+        key = (str(engine), lang_from, lang_to, self.normalize(text))
+        size = len(key[3].encode("utf-8")) + len(translation.encode("utf-8"))
+
+        with self._lock:
+            self._touched.pop(key, None)
+            self._flush_touched()
+            previous = self._db.execute(
+                "SELECT size FROM translations WHERE engine=? AND lang_from=? AND lang_to=? AND source=?",
+                key,
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, translation, size, time.time()),
+            )
+            if previous:
+                self._stats.bytes_stored += size - previous[0]
+            else:
+                self._stats.entries += 1
+                self._stats.bytes_stored += size
+            self._remember(key, translation)
+
+            if self._stats.bytes_stored > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: Copy of the current counters
+        """
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        """Removes every cached translation from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM translations")
+            self._stats.entries = 0
+            self._stats.bytes_stored = 0
+
+    def close(self) -> None:
+        """Writes pending memory-tier hits and closes the database connection."""
+        with self._lock:
+            self._flush_touched()
+            self._db.close()
+
+    def _remember(self, key: tuple[str, str, str, str], translation: str) -> None:
+        """Adds an entry to the in-memory tier, dropping its oldest entry if full.
+
+        Must be called with the lock held.
+        """
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self) -> None:
+        """Writes the ``last_used`` times of pending memory-tier hits.
+
+        Must be called with the lock held.
+        """
+        if not self._touched:
+            return
+        self._db.executemany(
+            "UPDATE translations SET last_used=? WHERE engine=? AND lang_from=? AND lang_to=? AND source=?",
+            [(used, *key) for key, used in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        """Deletes least recently used rows until the disk tier is at 90% of its cap.
+
+        Must be called with the lock held.
+        """
+        self._flush_touched()
+        target = int(self.max_bytes * 0.9)
+        freed = 0
+        removed = 0
+        rows = self._db.execute(
+            "SELECT engine, lang_from, lang_to, source, size FROM translations ORDER BY last_used"
+        )
+        doomed = []
+        for *key, size in rows:
+            if self._stats.bytes_stored - freed <= target:
+                break
+            doomed.append(tuple(key))
+            freed += size
+            removed += 1
+
+        self._db.executemany(
+            "DELETE FROM translations WHERE engine=? AND lang_from=? AND lang_to=? AND source=?",
+            doomed,
+        )
+        for key in doomed:
+            self._memory.pop(key, None)
+        self._stats.bytes_stored -= freed
+        self._stats.entries -= removed
@@ -0,0 +1,364 @@
+import csv
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from .translation_cache import TranslationCache
+
+@dataclass(frozen=True)
+class MemoryMatch:
+    """Translation memory entry returned by a lookup.
+
+    Attributes:
+        source (str): Stored source segment (normalized)
+        target (str): Stored translation
+        score (float): Similarity to the query, 1.0 for an exact match
+    """
+    source: str
+    target: str
+    score: float
+
+    @property
+    def exact(self) -> bool:
+        """True if the stored source equals the normalized query."""
+        return self.score >= 1.0
+
+class TranslationMemory:
+    """In-memory translation memory with exact and fuzzy lookup.
+
+    Entries are loaded from TMX or TSV files and kept per language pair. Exact
+    matches are a dictionary lookup on the normalized source. Fuzzy matches use
+    a MinHash signature over character n-grams split into LSH bands, so only
+    segments sharing a band with the query are compared with
+    ``difflib.SequenceMatcher``; lookup cost stays flat as the memory grows to
+    millions of segments. A fuzzy match is rejected when its numbers differ
+    from the query's, so "Pay 900 dollars" never gets the stored translation of
+    "Pay 100 dollars". Nothing here touches the network.
+
+    Attributes:
+        threshold (float): Minimum similarity (0-1) for a fuzzy match to be used
+
+    Example:
+        >>> memory = TranslationMemory(threshold=0.85)
+        >>> memory.add("All rights reserved.", "Todos los derechos reservados.", "en", "es")
+        >>> memory.lookup("All rights reserved", "en", "es")
+        MemoryMatch(source='All rights reserved.', target='Todos los derechos reservados.', score=0.97...)
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".traductor-inador", "memory")
+    """Directory whose ``.tmx``/``.tsv`` files ``shared()`` loads."""
+
+    EXTENSIONS = (".tmx", ".tsv")
+    """File extensions ``load`` and ``load_directory`` accept."""
+
+    NGRAM = 3
+    PERMUTATIONS = 16
+    BANDS = 8
+    MAX_CANDIDATES = 50
+    """Most promising LSH candidates verified per fuzzy lookup."""
+
+    _NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+    # Inline TMX elements whose text is native markup rather than translatable content
+    _TMX_CODES = {"bpt", "ept", "it", "ph", "ut"}
+
+    _shared: "TranslationMemory | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, threshold: float = 0.9) -> None:
+        """Creates an empty memory.
+
+        Args:
+            threshold (float, optional): Minimum fuzzy similarity; 1.0 disables
+                fuzzy matching. Defaults to 0.9.
+        """
+        self.threshold = threshold
+        self._sources: list[str] = []
+        self._targets: list[str] = []
+        self._exact: dict[tuple[str, str], dict[str, int]] = {}
+        # Band key -> entry id, or list of ids once several entries share it
+        self._buckets: dict[tuple[str, str], dict[int, int | list[int]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "TranslationMemory":
+        """Returns the process-wide memory, loading it on first use.
+
+        Loads every file in ``DEFAULT_PATH`` and in the paths listed (separated by
+        ``os.pathsep``) in the ``TRADUCTOR_TRANSLATION_MEMORY_PATH`` environment
+        variable.
+
+        Returns:
+            TranslationMemory: Lazily created shared instance
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                memory = cls()
+                paths = [cls.DEFAULT_PATH]
+                paths += [p for p in os.environ.get("TRADUCTOR_TRANSLATION_MEMORY_PATH", "").split(os.pathsep) if p]
+                for path in paths:
+                    if os.path.isdir(path):
+                        memory.load_directory(path)
+                    elif os.path.isfile(path):
+                        memory.load(path)
+                cls._shared = memory
+            return cls._shared
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def add(self, source: str, target: str, lang_from: str, lang_to: str) -> None:
+        """Adds or replaces an entry.
+
+        Args:
+            source (str): Source segment
+            target (str): Translated segment
+            lang_from (str): Source language code (e.g. 'en' or 'en-US')
+            lang_to (str): Target language code
+        """
+        key = TranslationCache.normalize(source)
+        if not key:
+            return
+        pair = (self._lang(lang_from), self._lang(lang_to))
+
+        with self._lock:
+            exact = self._exact.setdefault(pair, {})
+            entry = exact.get(key)
+            if entry is not None:
+                self._targets[entry] = target
+                return
+
+            entry = exact[key] = len(self._sources)
+            self._sources.append(key)
+            self._targets.append(target)
+            buckets = self._buckets.setdefault(pair, {})
+            for band in self._bands(key):
+                bucket = buckets.get(band)
+                if bucket is None:
+                    buckets[band] = entry
+                elif isinstance(bucket, int):
+                    buckets[band] = [bucket, entry]
+                else:
+                    bucket.append(entry)
+
+    def lookup(self, text: str, lang_from: str, lang_to: str, threshold: float | None = None) -> MemoryMatch | None:
+        """Finds the best entry for a segment.
+
+        Args:
+            text (str): Segment to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            threshold (float, optional): Overrides the memory's ``threshold``.
+
+        Returns:
+            (MemoryMatch, optional): Exact match, else the most similar entry at
+                or above the threshold with the same numbers, else None
+        """
+        key = TranslationCache.normalize(text)
+        pair = (self._lang(lang_from), self._lang(lang_to))
+        threshold = self.threshold if threshold is None else threshold
+        bands = self._bands(key) if key and threshold < 1.0 else []
+
+        # Loading may run in the background, so the tables are only read under
+        # the lock; the candidates are then scored on a snapshot without it
+        with self._lock:
+            entry = self._exact.get(pair, {}).get(key)
+            if entry is not None:
+                return MemoryMatch(key, self._targets[entry], 1.0)
+
+            buckets = self._buckets.get(pair)
+            if not bands or not buckets:
+                return None
+
+            hits: dict[int, int] = {}
+            for band in bands:
+                bucket = buckets.get(band)
+                for candidate in (bucket,) if isinstance(bucket, int) else bucket or ():
+                    hits[candidate] = hits.get(candidate, 0) + 1
+            ranked = sorted(hits, key=hits.__getitem__, reverse=True)[:self.MAX_CANDIDATES]
+            candidates = [(self._sources[candidate], self._targets[candidate]) for candidate in ranked]
+
+        numbers = sorted(self._NUMBER.findall(key))
+        best: MemoryMatch | None = None
+        for source, target in candidates:
+            if sorted(self._NUMBER.findall(source)) != numbers:
+                continue
+            matcher = SequenceMatcher(None, key, source, autojunk=False)
+            floor = best.score if best else threshold
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
+            if score >= floor and (best is None or score > best.score):
+                best = MemoryMatch(source, target, score)
+        return best
+
+    def translate(self, text: str, lang_from: str, lang_to: str, threshold: float | None = None) -> str | None:
+        """Returns the stored translation of a segment, keeping its outer whitespace.
+
+        Args:
+            text (str): Segment to translate
+            lang_from (str): Source language code
+            lang_to (str): Target language code
+            threshold (float, optional): Overrides the memory's ``threshold``;
+                1.0 accepts exact matches only.
+
+        Returns:
+            (str, optional): Translation, or None if nothing matches
+        """
+        match = self.lookup(text, lang_from, lang_to, threshold)
+        if match is None:
+            return None
+        stripped = text.strip()
+        start = text.find(stripped) if stripped else 0
+        return text[:start] + match.target + text[start + len(stripped):]
+
+    def load(self, path: str, lang_from: str | None = None, lang_to: str | None = None) -> int:
+        """Loads a TMX or TSV file, chosen by extension.
+
+        Args:
+            path (str): File path
+            lang_from (str, optional): Source language for TSV files
+            lang_to (str, optional): Target language for TSV files
+
+        Raises:
+            ValueError: If the extension is not supported or a TSV language pair
+                cannot be determined.
+
+        Returns:
+            int: Entries read from the file
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in self.EXTENSIONS:
+            raise ValueError(f"Formato de memoria de traducción no soportado: {path}")
+        if extension == ".tmx":
+            return self.load_tmx(path)
+        return self.load_tsv(path, lang_from, lang_to)
+
+    def load_directory(self, path: str) -> int:
+        """Loads every file with one of the ``EXTENSIONS`` in a directory.
+
+        Args:
+            path (str): Directory path
+
+        Returns:
+            int: Entries read
+        """
+        count = 0
+        for name in sorted(os.listdir(path)):
+            if os.path.splitext(name)[1].lower() in self.EXTENSIONS:
+                count += self.load(os.path.join(path, name))
+        return count
+
+    def load_tmx(self, path: str) -> int:
+        """Streams a TMX file, adding every language pair of each translation unit.
+
+        Args:
+            path (str): TMX file path
+
+        Returns:
+            int: Entries read
+        """
+        lang_attr = "{http://www.w3.org/XML/1998/namespace}lang"
+        count = 0
+        body: ET.Element | None = None
+
+        for event, element in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                if element.tag == "body":
+                    body = element
+                continue
+            if element.tag != "tu":
+                continue
+            variants = []
+            for tuv in element.iter("tuv"):
+                seg = tuv.find("seg")
+                lang = tuv.get(lang_attr) or tuv.get("lang")
+                if seg is not None and lang:
+                    variants.append((lang, self._tmx_text(seg)))
+            for lang_from, source in variants:
+                for lang_to, target in variants:
+                    if lang_from != lang_to:
+                        self.add(source, target, lang_from, lang_to)
+                        count += 1
+            if body is not None:
+                body.clear()  # Drop parsed units so large files stream in constant memory
+
+        return count
+
+    def load_tsv(self, path: str, lang_from: str | None = None, lang_to: str | None = None) -> int:
+        """Loads a two-column ``source<TAB>target`` file.
+
+        Without explicit languages the pair is read from the file name, e.g.
+        ``legal.en-es.tsv``.
+
+        Args:
+            path (str): TSV file path
+            lang_from (str, optional): Source language code
+            lang_to (str, optional): Target language code
+
+        Raises:
+            ValueError: If the language pair cannot be determined.
+
+        Returns:
+            int: Entries read
+        """
+        if not (lang_from and lang_to):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            found = re.search(r"(?:^|\.)([A-Za-z]{2,3}(?:_[A-Za-z]+)?)-([A-Za-z]{2,3}(?:_[A-Za-z]+)?)$", stem)
+            if not found:
+                raise ValueError(f"No se pudo determinar el par de idiomas de {path}")
+            lang_from, lang_to = found.groups()
+
+        count = 0
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            for row in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+                if len(row) >= 2 and row[0].strip():
+                    self.add(row[0], row[1], lang_from, lang_to)
+                    count += 1
+        return count
+
+    def _bands(self, key: str) -> list[int]:
+        """Computes the LSH band keys of a normalized segment.
+
+        Uses one-permutation MinHash: each n-gram is hashed once and the hash
+        picks both its bin and its value, so the signature costs one pass over
+        the segment. Empty bins borrow the next filled bin (densification).
+        """
+        text = key.casefold()
+        n = self.NGRAM
+        bins = self.PERMUTATIONS
+        signature: list[int | None] = [None] * bins
+
+        for shingle in {text[i:i + n] for i in range(max(1, len(text) - n + 1))}:
+            value = hash(shingle) & 0xFFFFFFFFFFFFFFFF
+            slot, value = value % bins, value // bins
+            current = signature[slot]
+            if current is None or value < current:
+                signature[slot] = value
+
+        filled = list(signature)
+        for slot in range(bins):
+            if filled[slot] is None:
+                step = 1
+                while filled[(slot + step) % bins] is None:
+                    step += 1
+                signature[slot] = hash((step, filled[(slot + step) % bins]))
+
+        rows = bins // self.BANDS
+        return [hash((band, *signature[band * rows:(band + 1) * rows])) for band in range(self.BANDS)]
+
+    @classmethod
+    def _tmx_text(cls, seg: ET.Element) -> str:
+        """Extracts the translatable text of a ``<seg>``, dropping inline codes."""
+        parts = [seg.text or ""]
+        for child in seg:
+            if child.tag not in cls._TMX_CODES:
+                parts.append(cls._tmx_text(child))
+            parts.append(child.tail or "")
+        return "".join(parts)
+
+    @staticmethod
+    def _lang(code: str) -> str:
+        """Reduces a language tag to its primary subtag (``'en-US'`` -> ``'en'``)."""
+        return code.replace("_", "-").split("-")[0].lower()
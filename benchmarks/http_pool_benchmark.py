@@ -0,0 +1,44 @@
+"""Compares bare ``requests`` calls against pooled keep-alive sessions.
+
+Starts the local stub translation server and measures requests per second
+for both strategies, so the cost of per-request TCP handshakes is visible
+without touching a real translation API.
+
+Usage:
+    $ python -m benchmarks.http_pool_benchmark --requests 500
+"""
+import argparse
+import time
+import requests
+from app.core.constants import Engine
+from app.services.http_pool import HTTPSessionPool
+from app.services.stub_server import StubTranslationServer
+
+def _measure(label: str, get, url: str, total: int) -> float:
+    """Runs ``total`` sequential GETs and prints requests per second."""
+    params = {"q": "hello", "langpair": "en|es"}
+    start = time.perf_counter()
+    for _ in range(total):
+        get(url, params=params, timeout=10).json()
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed
+    print(f"{label:<10} {total} requests in {elapsed:.2f}s -> {rate:,.0f} req/s")
+    return rate
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    pool = HTTPSessionPool()
+    with StubTranslationServer() as server:
+        url = server.urls()[Engine.MY_MEMORY]
+        try:
+            before = _measure("bare", requests.get, url, args.requests)
+            after = _measure("pooled", pool.session(Engine.MY_MEMORY).get, url, args.requests)
+            print(f"speedup    x{after / before:.2f}")
+        finally:
+            pool.close()
+
+if __name__ == "__main__":
+    main()
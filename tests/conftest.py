@@ -0,0 +1,55 @@
+import pytest
+from docx import Document
+
+class FakeTranslator:
+    """Offline translator prefixing every segment with the target language.
+
+    Attributes:
+        calls (list[list[str]]): Segments of every ``translate_batch`` call, in order
+        fail_after (int | None): Successful calls before every further call raises,
+            or None to never fail
+    """
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.calls = []
+        self.fail_after = fail_after
+
+    def translate_batch(self, texts: list[str], lang_from: str, lang_to: str) -> list[str]:
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise ConnectionError("engine down")
+        self.calls.append(list(texts))
+        return [f"[{lang_to}] {text}" for text in texts]
+
+    @property
+    def sent(self) -> list[str]:
+        """Every segment sent, across calls."""
+        return [text for call in self.calls for text in call]
+
+@pytest.fixture
+def translator() -> FakeTranslator:
+    return FakeTranslator()
+
+@pytest.fixture
+def make_docx(tmp_path):
+    """Writes a DOCX with the given body paragraphs and an optional table."""
+    def make(paragraphs: list[str], table: list[list[str]] | None = None, name: str = "input.docx") -> str:
+        document = Document()
+        for text in paragraphs:
+            document.add_paragraph(text)
+        if table:
+            cells = document.add_table(rows=len(table), cols=len(table[0]))
+            for row, values in zip(cells.rows, table):
+                for cell, value in zip(row.cells, values):
+                    cell.text = value
+        path = str(tmp_path / name)
+        document.save(path)
+        return path
+    return make
+
+def body_texts(path: str) -> list[str]:
+    """Paragraph texts of a DOCX body, followed by its table cells."""
+    document = Document(path)
+    texts = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        texts.extend(cell.text for row in table.rows for cell in row.cells)
+    return texts
@@ -0,0 +1,69 @@
+import os
+import pytest
+from app.core.checkpoint_journal import CheckpointJournal
+from app.core.docx_processor import DocxProcessor
+from app.exceptions.document import DocumentProcessingError
+from conftest import FakeTranslator, body_texts
+
+PARAGRAPHS = [f"Paragraph number {i} of the manual." for i in range(12)]
+
+def translate(translator: FakeTranslator, input_path: str, output_path: str, lang_to: str = "es") -> None:
+    DocxProcessor(translator, batch_size=4).process_document(input_path, output_path, "en", lang_to)
+
+def test_journal_replays_records_after_reopening(tmp_path):
+    path = str(tmp_path / "out.docx.journal")
+    journal = CheckpointJournal(path, context="deepl:en:es")
+    journal.begin(3, CheckpointJournal.hash("Hello"))
+    journal.commit(3, "Hola")
+    journal.close()
+
+    assert CheckpointJournal(path, context="deepl:en:es").lookup(3, CheckpointJournal.hash("Hello")) == "Hola"
+    assert CheckpointJournal(path, context="deepl:en:es").lookup(3, CheckpointJournal.hash("Bye")) is None
+
+def test_journal_from_another_context_is_discarded(tmp_path):
+    path = str(tmp_path / "out.docx.journal")
+    journal = CheckpointJournal(path, context="deepl:en:es")
+    journal.begin(3, CheckpointJournal.hash("Hello"))
+    journal.commit(3, "Hola")
+    journal.close()
+
+    assert CheckpointJournal(path, context="deepl:en:fr").lookup(3, CheckpointJournal.hash("Hello")) is None
+
+def test_resume_translates_only_unfinished_paragraphs(make_docx, tmp_path):
+    input_path = make_docx(PARAGRAPHS)
+    output_path = str(tmp_path / "output.docx")
+
+    with pytest.raises(DocumentProcessingError):
+        translate(FakeTranslator(fail_after=2), input_path, output_path)
+    assert os.path.exists(f"{output_path}.journal")
+
+    resumed = FakeTranslator()
+    translate(resumed, input_path, output_path)
+
+    assert resumed.sent == PARAGRAPHS[8:]
+    assert body_texts(output_path) == [f"[es] {text}" for text in PARAGRAPHS]
+    assert not os.path.exists(f"{output_path}.journal")
+
+def test_failed_first_batch_leaves_journal_next_to_partial_output(make_docx, tmp_path):
+    input_path = make_docx(PARAGRAPHS)
+    output_path = str(tmp_path / "output.docx")
+
+    with pytest.raises(DocumentProcessingError):
+        translate(FakeTranslator(fail_after=0), input_path, output_path)
+
+    # BatchTranslator treats an output without a journal as finished
+    assert os.path.exists(output_path)
+    assert os.path.exists(f"{output_path}.journal")
+
+    resumed = FakeTranslator()
+    translate(resumed, input_path, output_path)
+    assert resumed.sent == PARAGRAPHS
+    assert body_texts(output_path) == [f"[es] {text}" for text in PARAGRAPHS]
+
+def test_unreadable_input_leaves_no_journal(tmp_path):
+    output_path = str(tmp_path / "output.docx")
+
+    with pytest.raises(DocumentProcessingError):
+        translate(FakeTranslator(), str(tmp_path / "missing.docx"), output_path)
+
+    assert not os.path.exists(f"{output_path}.journal")
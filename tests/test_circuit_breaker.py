@@ -0,0 +1,117 @@
+import gc
+import threading
+import time
+import pytest
+from app.exceptions.translation import TranslationCircuitOpen
+from app.services.circuit_breaker import CircuitBreaker, CircuitState
+
+class Engine:
+    """Probe owner whose health can be switched."""
+
+    def __init__(self, healthy: bool = False) -> None:
+        self.healthy = healthy
+        self.probed = threading.Event()
+
+    def probe(self) -> None:
+        self.probed.set()
+        if not self.healthy:
+            raise ConnectionError("still down")
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+def test_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker("deepl", failure_threshold=3)
+    states = []
+    breaker.subscribe(states.append)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert states == [CircuitState.OPEN]
+    with pytest.raises(TranslationCircuitOpen):
+        breaker.check()
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("deepl", failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+def test_trial_call_without_probe_closes_or_reopens():
+    breaker = CircuitBreaker("deepl", failure_threshold=1, probe_interval=0.05)
+    states = []
+    breaker.subscribe(states.append)
+    breaker.record_failure()
+
+    with pytest.raises(TranslationCircuitOpen):
+        breaker.check()
+    time.sleep(0.06)
+    breaker.check()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(TranslationCircuitOpen):
+        breaker.check()  # Only one trial at a time
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    time.sleep(0.06)
+    breaker.check()
+    breaker.record_success()
+
+    assert states == [
+        CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED
+    ]
+
+def test_probe_closes_circuit_once_engine_recovers():
+    breaker = CircuitBreaker("deepl", failure_threshold=1, probe_interval=0.02, max_probe_interval=0.05)
+    engine = Engine()
+    breaker.set_probe(engine.probe)
+
+    breaker.record_failure()
+    assert engine.probed.wait(1.0)
+    assert breaker.state == CircuitState.OPEN
+
+    engine.healthy = True
+    assert wait_for(lambda: breaker.state == CircuitState.CLOSED)
+    breaker.check()
+
+def test_oldest_live_probe_is_used():
+    breaker = CircuitBreaker("deepl", failure_threshold=1, probe_interval=0.02)
+    first, second = Engine(healthy=True), Engine(healthy=True)
+    breaker.set_probe(first.probe)
+    breaker.set_probe(second.probe)
+    breaker.clear_probe(first.probe)
+
+    breaker.record_failure()
+
+    assert wait_for(lambda: breaker.state == CircuitState.CLOSED)
+    assert second.probed.is_set() and not first.probed.is_set()
+
+def test_probe_of_collected_owner_is_dropped():
+    breaker = CircuitBreaker("deepl", failure_threshold=1, probe_interval=0.02)
+    engine = Engine(healthy=True)
+    breaker.set_probe(engine.probe)
+    del engine
+    gc.collect()
+
+    breaker.record_failure()
+    time.sleep(0.05)
+
+    # Without a live probe the next call is let through as a trial
+    breaker.check()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+def test_shared_breaker_is_one_per_engine():
+    assert CircuitBreaker.shared("test-engine") is CircuitBreaker.shared("test-engine")
+    assert CircuitBreaker.shared("test-engine") is not CircuitBreaker.shared("other-test-engine")
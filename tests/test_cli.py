@@ -0,0 +1,85 @@
+import pytest
+import app.exceptions.authorization as ae
+import app.exceptions.document as de
+import app.exceptions.translation as te
+from app import cli
+from app.cli import ExitCode, exit_code
+from app.core.batch_translator import BatchReport, BatchTranslator, DocumentResult
+from app.core.config import Config
+from app.core.segment_plan import SegmentStats
+
+@pytest.fixture(autouse=True)
+def settings(tmp_path, monkeypatch):
+    """Points the CLI at an empty INI file and restores the previous store afterwards."""
+    monkeypatch.setattr(Config, "_settings", None)
+    for name in ("TRADUCTOR_CONFIG", "TRADUCTOR_ENGINE", "TRADUCTOR_DEEPL_API"):
+        monkeypatch.delenv(name, raising=False)
+    return str(tmp_path / "config.ini")
+
+@pytest.mark.parametrize("error, code", [
+    (KeyboardInterrupt(), ExitCode.INTERRUPTED),
+    (ae.Unauthorized("no key"), ExitCode.UNAUTHORIZED),
+    (te.TranslationServiceUnavailable(), ExitCode.UNAVAILABLE),
+    (te.TranslationRateLimited(), ExitCode.UNAVAILABLE),
+    (te.TranslationCircuitOpen(engine="deepl"), ExitCode.UNAVAILABLE),
+    (TimeoutError("read timed out"), ExitCode.UNAVAILABLE),
+    (te.TranslationFailed(), ExitCode.TRANSLATION_FAILED),
+    (de.ParagraphTranslationError("paragraph 3"), ExitCode.TRANSLATION_FAILED),
+    (de.DocumentNotFound("missing.docx"), ExitCode.NOT_FOUND),
+    (de.DocumentReadError("corrupt"), ExitCode.READ_ERROR),
+    (de.DocumentWriteError("disk full"), ExitCode.WRITE_ERROR),
+    (ValueError("bad value"), ExitCode.USAGE),
+    (RuntimeError("unexpected"), ExitCode.ERROR),
+])
+def test_exit_code_mapping(error, code):
+    assert exit_code(error) == code
+
+def test_missing_api_key_is_unauthorized(settings, capsys):
+    code = cli.main(["text", "Hola", "--from", "es", "--to", "en", "--engine", "deepl", "--config", settings])
+
+    assert code == ExitCode.UNAUTHORIZED
+    assert "deepl_api" in capsys.readouterr().err
+
+def test_missing_api_key_of_hedging_engine_is_unauthorized(settings):
+    args = ["text", "Hola", "--from", "es", "--to", "en", "--hedge-with", "google", "--config", settings]
+
+    assert cli.main(args) == ExitCode.UNAUTHORIZED
+
+def test_timeout_is_unavailable(settings, monkeypatch):
+    class Manager:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def translate_text(self, *args) -> str:
+            raise TimeoutError("read timed out")
+
+    monkeypatch.setattr("app.core.translator.TranslationManager", Manager)
+
+    assert cli.main(["text", "Hola", "--from", "es", "--to", "en", "--config", settings]) == ExitCode.UNAVAILABLE
+
+def test_missing_document_is_not_found(settings, tmp_path):
+    args = ["doc", str(tmp_path / "missing.docx"), str(tmp_path / "out.docx"), "--from", "es", "--to", "en"]
+
+    assert cli.main([*args, "--config", settings]) == ExitCode.NOT_FOUND
+
+def test_batch_without_matches_is_not_found(settings, tmp_path, capsys):
+    pattern = str(tmp_path / "nothing" / "*.docx")
+    args = ["batch", pattern, "--out", str(tmp_path / "out"), "--from", "es", "--to", "en", "--config", settings]
+
+    assert cli.main(args) == ExitCode.NOT_FOUND
+    assert pattern in capsys.readouterr().err
+
+@pytest.mark.parametrize("results, missing, code", [
+    ([DocumentResult("a.docx", "a_en.docx", stats=SegmentStats())], [], ExitCode.OK),
+    ([DocumentResult("a.docx", "a_en.docx", skipped=True)], [], ExitCode.OK),
+    ([DocumentResult("a.docx", "a_en.docx", stats=SegmentStats())], ["b/*.docx"], ExitCode.PARTIAL),
+    ([DocumentResult("a.docx", "a_en.docx", error="DocumentReadError: corrupt")], [], ExitCode.PARTIAL),
+    ([], ["b/*.docx"], ExitCode.NOT_FOUND),
+])
+def test_batch_exit_code(settings, monkeypatch, capsys, results, missing, code):
+    monkeypatch.setattr(BatchTranslator, "translate", lambda *args, **kwargs: BatchReport(results, missing))
+    args = ["batch", "a.docx", "b/*.docx", "--out", "out", "--from", "es", "--to", "en", "--config", settings]
+
+    assert cli.main(args) == code
+    output = capsys.readouterr().out.split()
+    assert output == [result.output_path for result in results if result.stats is not None]
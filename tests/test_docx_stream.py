@@ -0,0 +1,62 @@
+import zipfile
+import pytest
+from app.core.docx_processor import DocxProcessor
+from app.core.docx_stream import StreamingDocxProcessor
+from app.exceptions.document import DocumentProcessingError
+from conftest import FakeTranslator, body_texts
+
+PARAGRAPHS = [
+    "Introduction to the manual.",
+    "Repeated boilerplate line.",
+    "The pump must be checked weekly. Replace the filter every month.",
+    "",
+    "12345",
+    "Repeated boilerplate line.",
+] * 5
+TABLE = [["Name", "Value"], ["Pressure", "3 bar"], ["Repeated boilerplate line.", "Notes"]]
+
+def translated_parts(path: str) -> dict[str, bytes]:
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_streaming_output_matches_dom_output(make_docx, tmp_path, workers):
+    input_path = make_docx(PARAGRAPHS, TABLE)
+    dom_path, stream_path = str(tmp_path / "dom.docx"), str(tmp_path / "stream.docx")
+    dom, stream = FakeTranslator(), FakeTranslator()
+
+    dom_stats = DocxProcessor(dom, batch_size=4, workers=workers).process_document(
+        input_path, dom_path, "en", "es"
+    )
+    stream_stats = StreamingDocxProcessor(stream, batch_size=4, workers=workers).process_document(
+        input_path, stream_path, "en", "es"
+    )
+
+    assert body_texts(stream_path) == body_texts(dom_path)
+    assert sorted(dom.sent) == sorted(stream.sent)
+    assert stream_stats.segments == dom_stats.segments
+    assert set(translated_parts(stream_path)) == set(translated_parts(dom_path))
+
+def test_streaming_translates_every_paragraph(make_docx, translator, tmp_path):
+    output_path = str(tmp_path / "stream.docx")
+
+    StreamingDocxProcessor(translator, batch_size=4).process_document(
+        make_docx(PARAGRAPHS, TABLE), output_path, "en", "es"
+    )
+
+    expected = [f"[es] {text}" if text.strip() and not text.isdigit() else text for text in PARAGRAPHS]
+    assert body_texts(output_path)[:len(PARAGRAPHS)] == expected
+
+def test_streaming_resumes_dom_journal(make_docx, tmp_path):
+    input_path = make_docx(PARAGRAPHS, TABLE)
+    dom_path, output_path = str(tmp_path / "dom.docx"), str(tmp_path / "output.docx")
+    full = FakeTranslator()
+    DocxProcessor(full, batch_size=4).process_document(input_path, dom_path, "en", "es")
+
+    with pytest.raises(DocumentProcessingError):
+        DocxProcessor(FakeTranslator(fail_after=1), batch_size=4).process_document(input_path, output_path, "en", "es")
+    resumed = FakeTranslator()
+    StreamingDocxProcessor(resumed, batch_size=4).process_document(input_path, output_path, "en", "es")
+
+    assert body_texts(output_path) == body_texts(dom_path)
+    assert 0 < len(resumed.sent) < len(full.sent)
@@ -0,0 +1,54 @@
+from urllib.parse import quote_plus
+import pytest
+from app.core.docx_processor import DocxProcessor
+from app.core.segmenter import Segmenter
+from conftest import body_texts
+
+def encoded(text: str) -> int:
+    return len(quote_plus(text.strip()))
+
+@pytest.mark.parametrize("text, lang", [
+    ("Ésta es una oración. Aquí otra más, con acentos: canción, corazón, ñandú. " * 6, "es"),
+    ("これは日本語の文です。もう一つの文があります！最後の文ですか？" * 4, "ja"),
+    ("Plain ASCII sentence number one. And the second one follows here. " * 6, "en"),
+])
+def test_chunks_respect_byte_limit_and_rejoin(text, lang):
+    segmenter = Segmenter(max_chars=500, max_bytes=120)
+
+    chunks = segmenter.split(text, lang)
+
+    assert "".join(chunks) == text
+    assert all(encoded(chunk) <= 120 for chunk in chunks)
+    assert all(len(chunk.strip()) <= 500 for chunk in chunks)
+
+def test_byte_limit_splits_text_within_character_limit():
+    text = "ñ" * 40  # 40 characters, 240 URL-encoded bytes
+
+    assert Segmenter(max_chars=100).split(text) == [text]
+    chunks = Segmenter(max_chars=100, max_bytes=60).split(text)
+    assert "".join(chunks) == text
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10, 10]
+
+def test_sentences_are_packed_whole_while_they_fit():
+    segmenter = Segmenter(max_chars=1000, max_bytes=len(quote_plus("Uno dos. Tres cuatro.")))
+
+    assert segmenter.split("Uno dos. Tres cuatro. Cinco seis.", "es") == ["Uno dos. Tres cuatro. ", "Cinco seis."]
+
+def test_fits_checks_both_limits():
+    segmenter = Segmenter(max_chars=5, max_bytes=12)
+
+    assert segmenter.fits("abcde")
+    assert not segmenter.fits("abcdef")
+    assert segmenter.fits("áé")  # 12 bytes
+    assert not segmenter.fits("áéí")  # 18 bytes
+
+def test_document_segments_sent_within_byte_limit(make_docx, translator, tmp_path):
+    paragraph = "Información técnica del camión. Revisión número dos, página cuatro. " * 5
+    output_path = str(tmp_path / "output.docx")
+
+    DocxProcessor(translator, chunk_size=500, chunk_bytes=100).process_document(
+        make_docx([paragraph]), output_path, "es", "en"
+    )
+
+    assert translator.sent and all(encoded(text) <= 100 for text in translator.sent)
+    assert body_texts(output_path)[0].replace("[en] ", "") == paragraph